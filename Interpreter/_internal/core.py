@@ -1,11 +1,21 @@
-from typing import List, Dict, Union, Optional, TypeAlias, Callable, Final, Any, overload
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, Union, Optional, Iterable, Iterator, Awaitable, Coroutine, TypeAlias, Callable, Final, TextIO, Any, overload
+from dataclasses import dataclass, field
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock, get_ident
+from weakref import WeakSet
+from inspect import isawaitable
+import asyncio
+import sys
+import io
 import os
 
 from .memory import (
     ArgumentList,
     InstructionList,
+    opcode_of,
     Instruction,
+    MemoryAddress,
     Argument,
     Environment
 )
@@ -13,8 +23,10 @@ from .memory import (
 from .exceptions import (
     ParserError, 
     InterpretationError,
+    ExecutionFailed,
     UnknownToken,
-    AlreadyInterpreted
+    AlreadyInterpreted,
+    NotColumnar
 )
 
 ParserResolver: TypeAlias = Callable[["Parser", InstructionList, int], int]
@@ -23,11 +35,18 @@ ParserResolutions: TypeAlias = Dict[str, ParserResolver]
 RuntimeResolver: TypeAlias = Callable[["Interpreter", "Runtime", ArgumentList], None]
 RuntimeResolutions: TypeAlias = Dict[str, RuntimeResolver]
 
+AsyncRuntimeResolver: TypeAlias = Callable[["Interpreter", "Runtime", ArgumentList], Awaitable[None]]
+AsyncRuntimeResolutions: TypeAlias = Dict[str, AsyncRuntimeResolver]
+
+# Evaluates a batch a column at a time, raising NotColumnar for batches it cannot.
+BatchExecutor: TypeAlias = Callable[["Interpreter", InstructionList, List[Dict[str, Any]], Optional[Environment], str], "BatchResult"]
+
 EnvironmentLoader: TypeAlias = Callable[[Environment], None]
 OnTokenize: TypeAlias = Callable[["Parser", str], None]
 
 NO_TOKEN: Final = object()
 NOT_FOUND: Final = object()
+ARGUMENT_CACHE_SIZE: Final = 65536
 
 def debug_method(parser: "Parser", instruction: str) -> None:
     print(parser.line_no, instruction)
@@ -53,6 +72,15 @@ def default_cast(text: str) -> Any:
         case _:
             return parse_number(text)
 
+@dataclass(frozen=True, slots=True)
+class ArgumentSpec:
+    """How an argument reads under an accent: the navigated parts, or None for string literals, and the fallback value."""
+
+    parts: Optional[Tuple[str, ...]]
+    text: str
+    fallback_text: str
+    fallback_value: Any
+
 @dataclass(slots=True)
 class Accent:
     """The accent of the interpretation"""
@@ -74,6 +102,24 @@ class Accent:
     
     def parts(self, s: str) -> List[str]:
         return s.split(self.navigator)
+    
+    def compile(self, s: str) -> ArgumentSpec:
+        text = self.extract_str(s)
+        value = self.value_caster(text)
+
+        if self.is_string(s):
+            return ArgumentSpec(None, text, text, value)
+        
+        parts = []
+        has_star = False
+        for part in self.parts(s):
+            if part.startswith("*"):
+                part = part.removeprefix("*")
+                has_star = True
+            parts.append(sys.intern(part))
+        
+        last = "*" + parts[-1] if has_star else parts[-1]
+        return ArgumentSpec(tuple(parts), last, text, value)
 
 @dataclass(slots=True)
 class Runtime(Environment):
@@ -87,22 +133,224 @@ class Runtime(Environment):
     def stop(self) -> None:
         self.stopped = True
 
+class Monitor:
+    """Hooks called around every frame and instruction of executions it is set on. Every hook does nothing by default."""
+
+    __slots__ = ()
+
+    def enter_frame(self, runtime: Runtime) -> None:
+        pass
+
+    def exit_frame(self, runtime: Runtime) -> None:
+        pass
+
+    def before(self, runtime: Runtime, inst: Instruction) -> None:
+        pass
+
+    def after(self, runtime: Runtime, inst: Instruction) -> None:
+        pass
+
+    def memoized(self, runtime: Runtime, name: str, hit: bool) -> None:
+        """A call to a memoized function, which returned from its memo when it was a hit."""
+        pass
+
+    def begin(self, name: str, category: str, args: Optional[Dict[str, Any]] = None) -> None:
+        pass
+
+    def end(self, name: str, category: str) -> None:
+        pass
+
+@contextmanager
+def span(monitor: Optional[Monitor], name: str, category: str, args: Optional[Dict[str, Any]] = None) -> Iterator[None]:
+    """Tell the monitor, if any, when a phase outside the interpreter loop begins and ends."""
+    if monitor is None:
+        yield
+        return
+    
+    monitor.begin(name, category, args)
+    try:
+        yield
+    finally:
+        monitor.end(name, category)
+
+class InterpreterIO:
+    """
+    The output and input of executions. Output is buffered, and written in blocks of 'buffer_size' characters, before 
+    input is read and when the outermost execution ends. Streams left as None are the ones of sys when used.
+    Output is also written at every line when 'line_buffering' is set, which by default it is for terminals.
+    """
+
+    __slots__ = ("output", "input", "buffer_size", "line_buffering", "_buffer", "_size", "_lock", "_terminal")
+
+    def __init__(
+        self, 
+        output: Optional[TextIO] = None, 
+        input: Optional[TextIO] = None, 
+        buffer_size: int = 8192, 
+        line_buffering: Optional[bool] = None
+    ) -> None:
+        self.output = output
+        self.input = input
+        self.buffer_size = buffer_size
+        self.line_buffering = line_buffering
+
+        self._buffer: List[str] = []
+        self._size = 0
+        self._lock = Lock()
+
+        # The output last checked for being a terminal, and whether it was, as sys.stdout may be replaced.
+        self._terminal: Optional[Tuple[TextIO, bool]] = None
+    
+    def __reduce__(self) -> Any:
+        # Streams belong to the process, so only the configuration is kept.
+        return type(self), (None, None, self.buffer_size, self.line_buffering)
+    
+    def write(self, text: str) -> None:
+        with self._lock:
+            self._buffer.append(text)
+            self._size += len(text)
+            full = self._size >= self.buffer_size or ("\n" in text and self.line_buffered())
+        
+        if full:
+            self.flush()
+    
+    def line_buffered(self) -> bool:
+        if self.line_buffering is not None:
+            return self.line_buffering
+
+        output = self.output or sys.stdout
+        terminal = self._terminal
+        if terminal is None or terminal[0] is not output:
+            isatty = getattr(output, "isatty", None)
+            terminal = self._terminal = (output, bool(isatty is not None and isatty()))
+        return terminal[1]
+    
+    def flush(self) -> None:
+        with self._lock:
+            if not self._buffer:
+                return
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            self._size = 0
+            
+            output = self.output or sys.stdout
+            output.write(text)
+            output.flush()
+    
+    def read_line(self, prompt: str = "") -> str:
+        """Flush the output with the prompt, then read a line without its newline. Raises EOFError at the end of input."""
+        if prompt:
+            self.write(prompt)
+        self.flush()
+
+        line = (self.input or sys.stdin).readline()
+        if not line:
+            raise EOFError("The input has ended.")
+        return line.removesuffix("\n")
+
+class CapturedIO(InterpreterIO):
+    """Output kept in memory, with input read from the given text."""
+
+    __slots__ = ("encoding",)
+
+    def __init__(self, input: str = "", encoding: str = "utf-8", buffer_size: int = 8192) -> None:
+        super().__init__(io.StringIO(), io.StringIO(input), buffer_size)
+        self.encoding = encoding
+    
+    def __reduce__(self) -> Any:
+        return type(self), ("", self.encoding, self.buffer_size)
+    
+    def getvalue(self) -> bytes:
+        self.flush()
+        return self.output.getvalue().encode(self.encoding)
+
+@dataclass(slots=True, eq=False, weakref_slot=True)
+class ExecutionContext:
+    """The state of one execution: its stack of runtimes, the files being interpreted, and whether it was stopped."""
+
+    runtimes: List[Runtime] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+    stopped: bool = False
+
+    # The views of imported modules this execution binds to, by their file. Modules are shared, their bindings are not.
+    modules: Dict[str, Runtime] = field(default_factory=dict)
+    thread: int = field(default_factory=get_ident, repr=False)
+
+    # Asynchronous executions with a time slice yield to the event loop every 'time_slice' instructions.
+    time_slice: Optional[int] = None
+    slice_left: int = 0
+
+    # Executions with a monitor run the instrumented loop, so the plain loop stays free of checks.
+    monitor: Optional[Monitor] = None
+
+    # Executions with their own streams print to and read from those rather than the ones of the interpreter.
+    io: Optional[InterpreterIO] = None
+
+    def stop(self) -> None:
+        self.stopped = True
+
+@dataclass(slots=True)
+class BatchResult:
+    """The names of every record after a batch, as columns, and whether the batch was evaluated a column at a time."""
+
+    columns: Dict[str, List[Any]]
+    size: int
+    columnar: bool
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return [{name: column[i] for name, column in self.columns.items()} for i in range(self.size)]
+
+class DispatchTable:
+    """Immutable table of runtime resolvers and their minimum arity, indexed by opcode."""
+
+    __slots__ = ("resolutions", "token_arities", "resolvers", "arities")
+
+    def __init__(self, runtime_resolutions: RuntimeResolutions, arities: Optional[Dict[str, int]] = None) -> None:
+        self.resolutions = dict(runtime_resolutions)
+        self.token_arities = dict(arities or {})
+
+        opcodes = [opcode_of(token) for token in (*self.resolutions, *self.token_arities)]
+        size = max(opcodes, default=-1) + 1
+
+        resolvers: List[Optional[RuntimeResolver]] = [None] * size
+        for token, resolver in self.resolutions.items():
+            resolvers[opcode_of(token)] = resolver
+
+        token_arities = [0] * size
+        for token, arity in self.token_arities.items():
+            token_arities[opcode_of(token)] = arity
+
+        self.resolvers = tuple(resolvers)
+        self.arities = tuple(token_arities)
+    
+    def __reduce__(self) -> Any:
+        # Opcodes are local to the process, so the table is rebuilt from the tokens.
+        return DispatchTable, (self.resolutions, self.token_arities)
+    
+    def resolver(self, opcode: int) -> Optional[RuntimeResolver]:
+        return self.resolvers[opcode] if opcode < len(self.resolvers) else None
+    
+    def arity(self, opcode: int) -> int:
+        return self.arities[opcode] if opcode < len(self.arities) else 0
+
 class Parser:
     """Pure structural parser with parser-time resolvers."""
 
     __slots__ = (
-        "accent", "parser_resolutions", "on_tokenize", "line_no"
+        "accent", "parser_resolutions", "on_tokenize", "dispatch", "line_no"
     )
 
     def __init__(
         self, 
         accent: Accent, 
         parser_resolutions: ParserResolutions, 
-        on_tokenize: Optional[OnTokenize] = None
+        on_tokenize: Optional[OnTokenize] = None,
+        dispatch: Optional[DispatchTable] = None
     ) -> None:
         self.accent = accent
         self.parser_resolutions = parser_resolutions
         self.on_tokenize = on_tokenize
+        self.dispatch = dispatch
 
         self.line_no = 0
     
@@ -158,11 +406,14 @@ class Parser:
     def raw_parse(self, code: str) -> List[Instruction]:
         raw_instructions = code.split(self.accent.suffix)
         instructions = []
+        shared_args = {}
 
-        self.line_no = 0
+        # The line is counted locally, so parsing from several threads at once does not mix line numbers.
+        line_no = 0
 
         for raw in raw_instructions:
-            self.line_no += raw.count("\n")
+            line_no += raw.count("\n")
+            self.line_no = line_no
             text = raw.replace("\n", "").strip()
 
             if not text or text.startswith(self.accent.comment):
@@ -172,8 +423,12 @@ class Parser:
             if not parts:
                 continue
 
+            # Names and argument tuples are shared, so repeated arguments are only stored once per program.
+            args = tuple([sys.intern(part) for part in parts[1:]])
+            args = shared_args.setdefault(args, args)
+
             instructions.append(
-                Instruction(token=parts[0].lower(), args=parts[1:], line=self.line_no + 1)
+                Instruction(token=sys.intern(parts[0].lower()), args=args, line=line_no + 1)
             )
 
         return instructions
@@ -192,23 +447,39 @@ class Parser:
                 i = resolver(self, instructions, i)
                 continue
 
+            if self.dispatch and len(inst.args) < self.dispatch.arity(inst.opcode):
+                raise ParserError(
+                    f"'{inst.token}' on line {inst.line} requires at least {self.dispatch.arity(inst.opcode)} argument(s)"
+                )
+
             output.append(inst)
             i += 1
 
         return output
     
-    def parse(self, code: str) -> List[Instruction]:
+    def parse(self, code: str, monitor: Optional["Monitor"] = None) -> List[Instruction]:
         try:
-            return self.transform(self.raw_parse(code))
+            if monitor is None:
+                return self.transform(self.raw_parse(code))
+            
+            with span(monitor, "raw_parse", "parse"):
+                instructions = self.raw_parse(code)
+            with span(monitor, "transform", "parse"):
+                return self.transform(instructions)
         except Exception as e:
             raise ParserError(f"Error occured while parsing (line {self.line_no + 1}): {e.args}") from e
 
 class Interpreter:
-    """Interpret code using a parser for runtime resolvers."""
+    """
+    Interpret code using a parser for runtime resolvers. 
+    
+    The state of each execution lives in an ExecutionContext, held in a context variable, so one interpreter 
+    and its parsed programs can be used from many threads at once.
+    """
 
     __slots__ = (
-        "accent", "runtime_resolutions", "parser", "runtimes", "files", 
-        "environment_loader", "stopped", "_debug"
+        "accent", "runtime_resolutions", "dispatch", "parser", "arguments", "modules", 
+        "environment_loader", "io", "batch_executor", "_debug", "_context", "_modules_lock", "_running", "_running_lock"
     )
 
     def __init__(
@@ -218,57 +489,155 @@ class Interpreter:
         accent: Optional[Accent] = None,
         environment_loader: Optional[EnvironmentLoader] = None,
         on_tokenize: Optional[OnTokenize] = None,
-        debug: bool = False
+        debug: bool = False,
+        dispatch: Optional[DispatchTable] = None,
+        io: Optional[InterpreterIO] = None,
+        batch_executor: Optional[BatchExecutor] = None
     ) -> None:
         self.accent = accent or Accent()
         self.runtime_resolutions = runtime_resolutions
-        self.parser = Parser(self.accent, parser_resolutions, on_tokenize if on_tokenize else debug_method if debug else None)
-        self.runtimes = []
-        self.files = []
+        self.dispatch = dispatch or DispatchTable(runtime_resolutions)
+        self.parser = Parser(self.accent, parser_resolutions, on_tokenize if on_tokenize else debug_method if debug else None, self.dispatch)
+        self.arguments: Dict[str, ArgumentSpec] = {}
+        self.modules: Dict[str, Runtime] = {}
 
         self.environment_loader = environment_loader
-        self.stopped = False
+        self.io = io or InterpreterIO()
+        self.batch_executor = batch_executor
 
         self._debug = debug
+        self._context: ContextVar[ExecutionContext] = ContextVar("execution_context")
+        self._modules_lock = Lock()
+
+        # Contexts with an execution going, so 'stop' reaches them from any thread.
+        self._running: WeakSet[ExecutionContext] = WeakSet()
+        self._running_lock = Lock()
+    
+    def __getstate__(self) -> Any:
+        # Context variables and locks belong to the process, so they are created again when unpickled.
+        slots = {
+            name: getattr(self, name) 
+            for cls in type(self).__mro__ for name in getattr(cls, "__slots__", ()) 
+            if name not in ("_context", "_modules_lock", "_running", "_running_lock") and hasattr(self, name)
+        }
+        return None, slots
+    
+    def __setstate__(self, state: Any) -> None:
+        _, slots = state
+        for name, value in slots.items():
+            setattr(self, name, value)
+        self._context = ContextVar("execution_context")
+        self._modules_lock = Lock()
+        self._running = WeakSet()
+        self._running_lock = Lock()
+    
+    @property
+    def context(self) -> ExecutionContext:
+        """The execution context of the current thread or task, created when there is none."""
+        context = self._context.get(None)
+        if context is None or context.thread != get_ident():
+            context = ExecutionContext()
+            self._context.set(context)
+        return context
+    
+    @contextmanager
+    def execution(self, context: Optional[ExecutionContext] = None) -> Iterator[ExecutionContext]:
+        """Run the block in a new, or the given, execution context. Another thread may stop it through the context."""
+        context = context or ExecutionContext()
+        context.thread = get_ident()
+        token = self._context.set(context)
+        try:
+            yield context
+        finally:
+            self._context.reset(token)
+    
+    @property
+    def runtimes(self) -> List[Runtime]:
+        return self.context.runtimes
+    
+    @property
+    def streams(self) -> InterpreterIO:
+        """The streams of the current execution, or of the interpreter when it has none of its own."""
+        return self.context.io or self.io
+    
+    @contextmanager
+    def capture(self, input: str = "") -> Iterator[CapturedIO]:
+        """Run the block in a new execution context, with its output kept in memory and its input read from the text."""
+        captured = CapturedIO(input)
+        with self.execution(ExecutionContext(io=captured)):
+            try:
+                yield captured
+            finally:
+                captured.flush()
+    
+    @property
+    def files(self) -> List[str]:
+        return self.context.files
+    
+    @property
+    def stopped(self) -> bool:
+        return self.context.stopped
 
     def stop(self) -> None:
-        self.stopped = True
+        """
+        Stop every execution going on this interpreter, on any thread, and the current context. Stopped contexts stay 
+        stopped; to stop a single execution, stop its context instead.
+        """
+        with self._running_lock:
+            running = list(self._running)
+        for context in running:
+            context.stop()
+        self.context.stop()
+    
+    def enter_execution(self, context: ExecutionContext) -> None:
+        """Mark the context as running, as its outermost runtime is pushed."""
+        with self._running_lock:
+            self._running.add(context)
+    
+    def exit_execution(self, context: ExecutionContext) -> None:
+        """Write what is left of the output of the context and mark it as done, as its outermost runtime is popped."""
+        with self._running_lock:
+            self._running.discard(context)
+        (context.io or self.io).flush()
     
     def jump(self, runtime: Runtime, lines: int) -> None:
         runtime.jump = lines
     
+    def compile_argument(self, arg: str) -> ArgumentSpec:
+        """Read an argument under the accent once, and keep the result for every later translation of it."""
+        spec = self.accent.compile(arg)
+
+        if len(self.arguments) >= ARGUMENT_CACHE_SIZE:
+            self.arguments.clear()
+        self.arguments[arg] = spec
+
+        return spec
+    
     def translate(self, environment: Environment, arg: Any) -> Union[Argument, Any]:
         if not isinstance(arg, str):
             return arg
         
-        if self.accent.is_string(arg):
-            text = self.accent.extract_str(arg)
-            value = self.accent.value_caster(text)
-            return Argument(as_text=text, as_value=value)
+        spec = self.arguments.get(arg)
+        if spec is None:
+            spec = self.compile_argument(arg)
         
-        parts = self.accent.parts(arg)
-        count = len(parts)
-
+        parts = spec.parts
+        if parts is None:
+            return Argument(as_text=spec.fallback_text, as_value=spec.fallback_value)
+        
+        last = len(parts) - 1
         current_env = environment
 
-        has_star = False
         for i, part in enumerate(parts):
-            if part.startswith("*"):
-                part = part.removeprefix("*")
-                has_star = True
             memory = current_env.resolve(part, NOT_FOUND)
 
             if memory is NOT_FOUND:
-                text = self.accent.extract_str(arg)
-                value = self.accent.value_caster(text)
-                return Argument(as_text=text, as_value=value)
+                return Argument(as_text=spec.fallback_text, as_value=spec.fallback_value)
             
-            if i == count - 1:
-                text = "*" + part if has_star else part
-                value = memory.value
+            if i == last:
                 return Argument(
-                    as_text = text,
-                    as_value = value,
+                    as_text = spec.text,
+                    as_value = memory.value,
                     obj = memory
                 )
             
@@ -280,6 +649,16 @@ class Interpreter:
 
             current_env = memory.value
     
+    def annotate_error(self, runtime: Runtime, inst: Instruction, e: Exception) -> Exception:
+        """Add the frame an interpretation error passed through, or wrap any other error in one."""
+        if not isinstance(e, InterpretationError):
+            error = ExecutionFailed("execution failed")
+            error.__cause__ = e
+            e = error
+        
+        e.add_frame(runtime.file, inst.line, inst.token)
+        return e
+    
     @overload
     def execute_instructions(
         self,
@@ -303,24 +682,41 @@ class Interpreter:
         file: Optional[str] = None,
         runtime: Optional[Runtime] = None
     ) -> Runtime:
-        runtime = runtime or Runtime(parent=parent, file=file or self.files[-1] if len(self.files) > 0 else "<code>")
-        self.runtimes.append(runtime)
+        context = self.context
+        runtimes = context.runtimes
+        if not runtimes:
+            self.enter_execution(context)
+
+        runtime = runtime or Runtime(parent=parent, file=file or (context.files[-1] if context.files else "<code>"))
+        runtimes.append(runtime)
 
         if self.environment_loader:
             self.environment_loader(runtime)
 
+        if context.monitor is not None:
+            try:
+                self.run_monitored(instructions, runtime, context, context.monitor)
+            finally:
+                runtimes.pop()
+                if not runtimes:
+                    self.exit_execution(context)
+            return runtime
+
+        resolvers = self.dispatch.resolvers
+        dispatch_size = len(resolvers)
+
         try:
             i = 0
             count = len(instructions)
             while i < count:
-                if runtime.stopped or self.stopped:
+                if runtime.stopped or context.stopped:
                     break
 
                 inst = instructions[i]
                 runtime.line_no = inst.line
 
-                resolver = self.runtime_resolutions.get(inst.token)
-                if not resolver:
+                resolver = resolvers[inst.opcode] if inst.opcode < dispatch_size else None
+                if resolver is None:
                     raise UnknownToken(
                         f"File '{runtime.file}', line {inst.line}: Unknown token '{inst.token}'"
                     )
@@ -330,45 +726,285 @@ class Interpreter:
                 try:
                     resolver(self, runtime, resolved_args)
                 except Exception as e:
-                    if isinstance(e, InterpretationError):
-                        e.args = (f"File '{runtime.file}', line {inst.line} -> {e.args[0]}",)
-                        raise e
-                    
-                    exc_type = type(e)
-                    exc_name = f"{exc_type.__module__}.{exc_type.__qualname__}"
-                    
-                    indent = "    " 
-                    arg_lines = "\n".join([f"{indent}{str(arg)}" for arg in e.args])
-
-                    raise InterpretationError(
-                        f'File "{runtime.file}", line {inst.line}: execution failed\n'
-                        f'Caused by {exc_name}: \n'
-                        f'{arg_lines}'
-                    ) from e
+                    raise self.annotate_error(runtime, inst, e)
                 
                 i += runtime.jump
                 runtime.jump = 1
 
         finally:
-            self.runtimes.pop()
+            runtimes.pop()
+            if not runtimes:
+                # The outermost execution writes what is left of the output it buffered.
+                self.exit_execution(context)
         
         return runtime
     
-    def execute(self, code: str) -> Runtime:
-        instructions = self.parser.parse(code)
-        return self.execute_instructions(instructions)
+    def run_monitored(self, instructions: InstructionList, runtime: Runtime, context: ExecutionContext, monitor: "Monitor") -> None:
+        """The interpreter loop with the monitor's hooks around every instruction, only used while a monitor is set."""
+        resolvers = self.dispatch.resolvers
+        dispatch_size = len(resolvers)
+
+        monitor.enter_frame(runtime)
+        try:
+            i = 0
+            count = len(instructions)
+            while i < count:
+                if runtime.stopped or context.stopped:
+                    break
+
+                inst = instructions[i]
+                runtime.line_no = inst.line
+
+                resolver = resolvers[inst.opcode] if inst.opcode < dispatch_size else None
+                if resolver is None:
+                    raise UnknownToken(
+                        f"File '{runtime.file}', line {inst.line}: Unknown token '{inst.token}'"
+                    )
+                
+                monitor.before(runtime, inst)
+                resolved_args = [self.translate(runtime, arg) for arg in inst.args]
+
+                try:
+                    resolver(self, runtime, resolved_args)
+                except Exception as e:
+                    raise self.annotate_error(runtime, inst, e)
+                finally:
+                    monitor.after(runtime, inst)
+                
+                i += runtime.jump
+                runtime.jump = 1
+
+        finally:
+            monitor.exit_frame(runtime)
+    
+    def execute(self, code: str, runtime: Optional[Runtime] = None) -> Runtime:
+        monitor = self.context.monitor
+        instructions = self.parser.parse(code, monitor)
 
+        with span(monitor, "execute", "interpret"):
+            return self.execute_instructions(instructions, runtime=runtime)
+
+    def execute_batch(
+        self, 
+        program: Union[str, InstructionList], 
+        records: Iterable[Dict[str, Any]], 
+        parent: Optional[Environment] = None
+    ) -> BatchResult:
+        """
+        Run one program once for every record, with its fields bound in a runtime of its own over the parent, and 
+        return the names of every runtime as columns. The program is parsed once, and evaluated a column at a time 
+        by the batch executor when it can be; otherwise, record by record.
+        """
+        context = self.context
+        instructions = self.parser.parse(program, context.monitor) if isinstance(program, str) else program
+        records = list(records)
+        file = context.files[-1] if context.files else "<batch>"
+
+        if self.batch_executor is not None and context.monitor is None:
+            try:
+                return self.batch_executor(self, instructions, records, parent, file)
+            except NotColumnar:
+                # The columnar evaluation changes nothing until it is done, so every record runs again by itself.
+                pass
+        
+        runtimes = []
+        for record in records:
+            runtime = Runtime(parent=parent, file=file)
+            for name, value in record.items():
+                runtime.memory[name] = MemoryAddress(name, value)
+            runtimes.append(self.execute_instructions(instructions, runtime=runtime))
+        
+        names: Dict[str, None] = {}
+        for runtime in runtimes:
+            names.update(dict.fromkeys(runtime.memory))
+        
+        columns = {
+            name: [address.value if address is not None else None for address in (runtime.memory.get(name) for runtime in runtimes)]
+            for name in names
+        }
+        return BatchResult(columns, len(runtimes), False)
+    
     def interpret(self, file: str) -> Environment:
         file = os.path.abspath(file)
+        context = self.context
+        files = context.files
 
-        if file in self.files:
+        if file in files:
             raise AlreadyInterpreted(f"File '{file}' is already being interpreted")
 
-        with open(file, "r", encoding="utf-8") as f:
-            self.files.append(file)
+        with span(context.monitor, "interpret", "interpret", {"file": file}):
+            with span(context.monitor, "read", "interpret"):
+                with open(file, "r", encoding="utf-8") as f:
+                    code = f.read()
+
+            files.append(file)
             try:
-                env = self.execute(f.read())
+                env = self.execute(code)
             finally:
-                self.files.remove(file)
+                files.remove(file)
         
-        return env
\ No newline at end of file
+        return env
+    
+    def import_file(self, file: str) -> Runtime:
+        """
+        Interpret a file once and share the runtime between every later import of it. 
+        Two threads importing the same file at once may both interpret it, but only the first runtime is kept.
+        """
+        file = os.path.abspath(file)
+        runtime = self.modules.get(file)
+
+        with span(self.context.monitor, "import", "import", {"file": file, "cached": runtime is not None}):
+            if runtime is None:
+                runtime = self.interpret(file)
+                with self._modules_lock:
+                    runtime = self.modules.setdefault(file, runtime)
+        
+        return runtime
+
+class AsyncInterpreter(Interpreter):
+    """
+    Interpreter that can also execute programs as asyncio coroutines, awaiting every resolver that returns an awaitable.
+
+    While executing asynchronously, the asynchronous resolutions replace the runtime resolutions of the same token, 
+    so the bodies they run can await as well. Synchronous resolvers work unchanged, but the bodies they run are 
+    executed synchronously.
+    """
+
+    __slots__ = ("async_resolutions", "async_dispatch")
+
+    def __init__(
+        self,
+        parser_resolutions: ParserResolutions,
+        runtime_resolutions: RuntimeResolutions,
+        accent: Optional[Accent] = None,
+        environment_loader: Optional[EnvironmentLoader] = None,
+        on_tokenize: Optional[OnTokenize] = None,
+        debug: bool = False,
+        dispatch: Optional[DispatchTable] = None,
+        async_resolutions: Optional[AsyncRuntimeResolutions] = None,
+        io: Optional[InterpreterIO] = None,
+        batch_executor: Optional[BatchExecutor] = None
+    ) -> None:
+        super().__init__(parser_resolutions, runtime_resolutions, accent, environment_loader, on_tokenize, debug, dispatch, io, batch_executor)
+        self.async_resolutions = dict(async_resolutions or {})
+        self.async_dispatch = DispatchTable(
+            {**self.dispatch.resolutions, **self.async_resolutions}, self.dispatch.token_arities
+        )
+    
+    async def execute_instructions_async(
+        self,
+        instructions: InstructionList,
+        parent: Optional[Environment] = None,
+        file: Optional[str] = None,
+        runtime: Optional[Runtime] = None
+    ) -> Runtime:
+        context = self.context
+        runtimes = context.runtimes
+        if not runtimes:
+            self.enter_execution(context)
+
+        runtime = runtime or Runtime(parent=parent, file=file or (context.files[-1] if context.files else "<code>"))
+        runtimes.append(runtime)
+
+        if self.environment_loader:
+            self.environment_loader(runtime)
+
+        resolvers = self.async_dispatch.resolvers
+        dispatch_size = len(resolvers)
+
+        monitor = context.monitor
+        if monitor is not None:
+            monitor.enter_frame(runtime)
+
+        try:
+            i = 0
+            count = len(instructions)
+            while i < count:
+                if runtime.stopped or context.stopped:
+                    break
+
+                inst = instructions[i]
+                runtime.line_no = inst.line
+
+                resolver = resolvers[inst.opcode] if inst.opcode < dispatch_size else None
+                if resolver is None:
+                    raise UnknownToken(
+                        f"File '{runtime.file}', line {inst.line}: Unknown token '{inst.token}'"
+                    )
+                
+                if monitor is not None:
+                    monitor.before(runtime, inst)
+                
+                resolved_args = [self.translate(runtime, arg) for arg in inst.args]
+
+                try:
+                    result = resolver(self, runtime, resolved_args)
+                    if result is not None and isawaitable(result):
+                        await result
+                except Exception as e:
+                    raise self.annotate_error(runtime, inst, e)
+                finally:
+                    if monitor is not None:
+                        monitor.after(runtime, inst)
+                
+                i += runtime.jump
+                runtime.jump = 1
+
+                if context.time_slice:
+                    context.slice_left -= 1
+                    if context.slice_left <= 0:
+                        await self.preempt(context)
+
+        finally:
+            if monitor is not None:
+                monitor.exit_frame(runtime)
+            runtimes.pop()
+            if not runtimes:
+                self.exit_execution(context)
+        
+        return runtime
+    
+    async def preempt(self, context: ExecutionContext) -> None:
+        """Start a new time slice and let the other tasks on the event loop run."""
+        context.slice_left = context.time_slice or 0
+        await asyncio.sleep(0)
+    
+    async def execute_async(self, code: str, runtime: Optional[Runtime] = None) -> Runtime:
+        monitor = self.context.monitor
+        instructions = self.parser.parse(code, monitor)
+
+        with span(monitor, "execute", "interpret"):
+            return await self.execute_instructions_async(instructions, runtime=runtime)
+    
+    async def interpret_async(self, file: str) -> Environment:
+        file = os.path.abspath(file)
+        context = self.context
+        files = context.files
+
+        if file in files:
+            raise AlreadyInterpreted(f"File '{file}' is already being interpreted")
+
+        with span(context.monitor, "interpret", "interpret", {"file": file}):
+            with span(context.monitor, "read", "interpret"):
+                with open(file, "r", encoding="utf-8") as f:
+                    code = f.read()
+            
+            files.append(file)
+            try:
+                env = await self.execute_async(code)
+            finally:
+                files.remove(file)
+        
+        return env
+    
+    async def _run_in_context(self, coroutine: Coroutine[Any, Any, Any], context: Optional[ExecutionContext]) -> Any:
+        with self.execution(context):
+            return await coroutine
+    
+    def create_task(self, coroutine: Coroutine[Any, Any, Any], context: Optional[ExecutionContext] = None) -> "asyncio.Task[Any]":
+        """Schedule an asynchronous execution as a task with its own, or the given, execution context."""
+        return asyncio.get_running_loop().create_task(self._run_in_context(coroutine, context))
+    
+    async def run_many(self, sources: Iterable[str]) -> List[Runtime]:
+        """Execute every source as a concurrent task on the running event loop."""
+        return await asyncio.gather(*[self.create_task(self.execute_async(source)) for source in sources])
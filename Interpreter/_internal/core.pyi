@@ -1,5 +1,7 @@
-from typing import List, Dict, Union, Optional, TypeAlias, Callable, Final, Any, overload
-from dataclasses import dataclass
+from typing import List, Dict, Tuple, Union, Optional, Iterable, Iterator, Awaitable, Coroutine, TypeAlias, Callable, Final, TextIO, Any, overload
+from dataclasses import dataclass, field
+from contextlib import contextmanager
+import asyncio
 
 from .memory import (
     ArgumentList, 
@@ -8,6 +10,7 @@ from .memory import (
     Argument,
     Environment
 )
+from .exceptions import InterpretationError
 
 ParserResolver: TypeAlias = Callable[["Parser", InstructionList, int], int]
 ParserResolutions: TypeAlias = Dict[str, ParserResolver]
@@ -15,16 +18,27 @@ ParserResolutions: TypeAlias = Dict[str, ParserResolver]
 RuntimeResolver: TypeAlias = Callable[["Interpreter", "Runtime", ArgumentList], None]
 RuntimeResolutions: TypeAlias = Dict[str, RuntimeResolver]
 
+AsyncRuntimeResolver: TypeAlias = Callable[["Interpreter", "Runtime", ArgumentList], Awaitable[None]]
+AsyncRuntimeResolutions: TypeAlias = Dict[str, AsyncRuntimeResolver]
+
+BatchExecutor: TypeAlias = Callable[["Interpreter", InstructionList, List[Dict[str, Any]], Optional[Environment], str], "BatchResult"]
+
 EnvironmentLoader: TypeAlias = Callable[[Environment], None]
 OnTokenize: TypeAlias = Callable[["Parser", str], None]
 
 NO_TOKEN: Final = object()
 NOT_FOUND: Final = object()
-
 def parse_number(text: str) -> Union[str, int, float]: ...
 
 def default_cast(text: str) -> Any: ...
 
+@dataclass(frozen=True, slots=True)
+class ArgumentSpec:
+    parts: Optional[Tuple[str, ...]]
+    text: str
+    fallback_text: str
+    fallback_value: Any
+
 @dataclass(slots=True)
 class Accent:
     navigator: str = "."
@@ -38,6 +52,7 @@ class Accent:
     def is_string(self, s: str) -> bool: ...
     def extract_str(self, s: str) -> str: ...
     def parts(self, s: str) -> List[str]: ...
+    def compile(self, s: str) -> ArgumentSpec: ...
 
 @dataclass(slots=True)
 class Runtime(Environment):
@@ -47,31 +62,102 @@ class Runtime(Environment):
     stopped: bool = False
     def stop(self) -> None: ...
 
+class Monitor:
+    def enter_frame(self, runtime: Runtime) -> None: ...
+    def exit_frame(self, runtime: Runtime) -> None: ...
+    def before(self, runtime: Runtime, inst: Instruction) -> None: ...
+    def after(self, runtime: Runtime, inst: Instruction) -> None: ...
+    def memoized(self, runtime: Runtime, name: str, hit: bool) -> None: ...
+    def begin(self, name: str, category: str, args: Optional[Dict[str, Any]] = None) -> None: ...
+    def end(self, name: str, category: str) -> None: ...
+
+@contextmanager
+def span(monitor: Optional[Monitor], name: str, category: str, args: Optional[Dict[str, Any]] = None) -> Iterator[None]: ...
+
+class InterpreterIO:
+    output: Optional[TextIO]
+    input: Optional[TextIO]
+    buffer_size: int
+    line_buffering: Optional[bool]
+
+    def __init__(
+        self, 
+        output: Optional[TextIO] = None, 
+        input: Optional[TextIO] = None, 
+        buffer_size: int = 8192, 
+        line_buffering: Optional[bool] = None
+    ) -> None: ...
+    def write(self, text: str) -> None: ...
+    def line_buffered(self) -> bool: ...
+    def flush(self) -> None: ...
+    def read_line(self, prompt: str = "") -> str: ...
+
+class CapturedIO(InterpreterIO):
+    encoding: str
+
+    def __init__(self, input: str = "", encoding: str = "utf-8", buffer_size: int = 8192) -> None: ...
+    def getvalue(self) -> bytes: ...
+
+@dataclass(slots=True, eq=False, weakref_slot=True)
+class ExecutionContext:
+    runtimes: List[Runtime] = field(default_factory=list)
+    files: List[str] = field(default_factory=list)
+    stopped: bool = False
+    modules: Dict[str, Runtime] = field(default_factory=dict)
+    thread: int = ...
+    time_slice: Optional[int] = None
+    slice_left: int = 0
+    monitor: Optional[Monitor] = None
+    io: Optional[InterpreterIO] = None
+    def stop(self) -> None: ...
+
+@dataclass(slots=True)
+class BatchResult:
+    columns: Dict[str, List[Any]]
+    size: int
+    columnar: bool
+
+    def rows(self) -> List[Dict[str, Any]]: ...
+
+class DispatchTable:
+    resolutions: RuntimeResolutions
+    token_arities: Dict[str, int]
+    resolvers: Tuple[Optional[RuntimeResolver], ...]
+    arities: Tuple[int, ...]
+
+    def __init__(self, runtime_resolutions: RuntimeResolutions, arities: Optional[Dict[str, int]] = None) -> None: ...
+    def resolver(self, opcode: int) -> Optional[RuntimeResolver]: ...
+    def arity(self, opcode: int) -> int: ...
+
 class Parser:
     accent: Accent
     parser_resolutions: ParserResolutions
     line_no: int
     on_tokenize: Optional[OnTokenize]
+    dispatch: Optional[DispatchTable]
 
     def __init__(
         self, 
         accent: Accent, 
         parser_resolutions: ParserResolutions, 
-        on_tokenize: Optional[OnTokenize] = None
+        on_tokenize: Optional[OnTokenize] = None,
+        dispatch: Optional[DispatchTable] = None
     ) -> None: ...
     def tokenize(self, instruction: str) -> List[str]: ...
     def raw_parse(self, code: str) -> List[Instruction]: ...
     def transform(self, instructions: List[Instruction]) -> List[Instruction]: ...
-    def parse(self, code: str) -> List[Instruction]: ...
+    def parse(self, code: str, monitor: Optional[Monitor] = None) -> List[Instruction]: ...
 
 class Interpreter:
     accent: Accent
     resolutions: RuntimeResolutions
+    dispatch: DispatchTable
     parser: Parser
-    runtimes: List[Runtime]
-    files: List[str]
+    arguments: Dict[str, ArgumentSpec]
+    modules: Dict[str, Runtime]
     environment_loader: Optional[EnvironmentLoader]
-    stopped: bool
+    io: InterpreterIO
+    batch_executor: Optional[BatchExecutor]
 
     def __init__(
         self,
@@ -80,11 +166,32 @@ class Interpreter:
         accent: Optional[Accent] = None,
         environment_loader: Optional[EnvironmentLoader] = None,
         on_tokenize: Optional[OnTokenize] = None,
-        debug: bool = False
+        debug: bool = False,
+        dispatch: Optional[DispatchTable] = None,
+        io: Optional[InterpreterIO] = None,
+        batch_executor: Optional[BatchExecutor] = None
     ) -> None: ...
+    @property
+    def context(self) -> ExecutionContext: ...
+    @contextmanager
+    def execution(self, context: Optional[ExecutionContext] = None) -> Iterator[ExecutionContext]: ...
+    @property
+    def runtimes(self) -> List[Runtime]: ...
+    @property
+    def streams(self) -> InterpreterIO: ...
+    @contextmanager
+    def capture(self, input: str = "") -> Iterator[CapturedIO]: ...
+    @property
+    def files(self) -> List[str]: ...
+    @property
+    def stopped(self) -> bool: ...
     def stop(self) -> None: ...
+    def enter_execution(self, context: ExecutionContext) -> None: ...
+    def exit_execution(self, context: ExecutionContext) -> None: ...
     def jump(self, runtime: Runtime, lines: int) -> None: ...
+    def compile_argument(self, arg: str) -> ArgumentSpec: ...
     def translate(self, environment: Environment, arg: Any) -> Union[Argument, Any]: ...
+    def annotate_error(self, runtime: Runtime, inst: Instruction, e: Exception) -> InterpretationError: ...
     @overload
     def execute_instructions(
         self,
@@ -106,5 +213,43 @@ class Interpreter:
         file: Optional[str] = None,
         runtime: Optional[Runtime] = None
     ) -> Runtime: ...
-    def execute(self, code: str) -> Runtime: ...
-    def interpret(self, file: str) -> Environment: ...
\ No newline at end of file
+    def run_monitored(self, instructions: InstructionList, runtime: Runtime, context: ExecutionContext, monitor: Monitor) -> None: ...
+    def execute(self, code: str, runtime: Optional[Runtime] = None) -> Runtime: ...
+    def execute_batch(
+        self, 
+        program: Union[str, InstructionList], 
+        records: Iterable[Dict[str, Any]], 
+        parent: Optional[Environment] = None
+    ) -> BatchResult: ...
+    def interpret(self, file: str) -> Environment: ...
+    def import_file(self, file: str) -> Runtime: ...
+
+class AsyncInterpreter(Interpreter):
+    async_resolutions: AsyncRuntimeResolutions
+    async_dispatch: DispatchTable
+
+    def __init__(
+        self,
+        parser_resolutions: ParserResolutions,
+        runtime_resolutions: RuntimeResolutions,
+        accent: Optional[Accent] = None,
+        environment_loader: Optional[EnvironmentLoader] = None,
+        on_tokenize: Optional[OnTokenize] = None,
+        debug: bool = False,
+        dispatch: Optional[DispatchTable] = None,
+        async_resolutions: Optional[AsyncRuntimeResolutions] = None,
+        io: Optional[InterpreterIO] = None,
+        batch_executor: Optional[BatchExecutor] = None
+    ) -> None: ...
+    async def execute_instructions_async(
+        self,
+        instructions: InstructionList,
+        parent: Optional[Environment] = None,
+        file: Optional[str] = None,
+        runtime: Optional[Runtime] = None
+    ) -> Runtime: ...
+    async def preempt(self, context: ExecutionContext) -> None: ...
+    async def execute_async(self, code: str, runtime: Optional[Runtime] = None) -> Runtime: ...
+    async def interpret_async(self, file: str) -> Environment: ...
+    def create_task(self, coroutine: Coroutine[Any, Any, Any], context: Optional[ExecutionContext] = None) -> asyncio.Task[Any]: ...
+    async def run_many(self, sources: Iterable[str]) -> List[Runtime]: ...
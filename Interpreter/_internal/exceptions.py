@@ -1,10 +1,60 @@
+from typing import List, Tuple, TypeAlias, Any
+
+Frame: TypeAlias = Tuple[str, int, str]
+
 class ParserError(Exception):
     """Errors during parsing."""
 class InterpretationError(Exception):
-    """Errors during interpretation."""
+    """
+    Errors during interpretation. The (file, line, token) frames an error passed through are collected innermost first,
+    and only formatted when the error is printed.
+    """
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.frames: List[Frame] = []
+    
+    @property
+    def message(self) -> str:
+        return str(self.args[0]) if self.args else ""
+    
+    def add_frame(self, file: str, line: int, token: str) -> None:
+        self.frames.append((file, line, token))
+    
+    def format_frames(self) -> str:
+        return "".join(f"File '{file}', line {line} -> " for file, line, _ in reversed(self.frames))
+    
+    def __str__(self) -> str:
+        return self.format_frames() + self.message
+class ExecutionFailed(InterpretationError):
+    """Any other error raised while executing an instruction, kept as the cause."""
+    def __str__(self) -> str:
+        cause = self.__cause__
+        if cause is None:
+            return super().__str__()
+        
+        exc_type = type(cause)
+        arg_lines = "\n".join(f"    {arg}" for arg in cause.args)
+        return (
+            f"{super().__str__()}\n"
+            f"Caused by {exc_type.__module__}.{exc_type.__qualname__}: \n"
+            f"{arg_lines}"
+        )
 class UnknownToken(InterpretationError):
     """The token was unknown."""
 class AlreadyInterpreted(InterpretationError):
     """The file is already being interpreted."""
+class Deadlock(InterpretationError):
+    """Every task of a scheduler is waiting on another."""
+class ResourceExhausted(InterpretationError):
+    """An execution went over one of its resource limits."""
+    def __init__(self, message: str, resource: str = "", limit: Any = None, usage: Any = None) -> None:
+        super().__init__(message)
+        self.resource = resource
+        self.limit = limit
+        self.usage = usage
 class ResolutionError(Exception):
-    """During resolution, and error occured."""
\ No newline at end of file
+    """During resolution, and error occured."""
+class NotColumnar(Exception):
+    """A program, or a value it met, that cannot be evaluated a column at a time."""
+class SnapshotError(Exception):
+    """A snapshot could not be written or restored."""
\ No newline at end of file
@@ -1,11 +1,25 @@
-from typing import List, Dict, Union, Protocol, Optional, TypeAlias, TypeVar, Generic, Any, runtime_checkable
-from dataclasses import dataclass, field
+from typing import List, Dict, Tuple, Union, Protocol, Optional, TypeAlias, TypeVar, Generic, Callable, Any, runtime_checkable
+from dataclasses import dataclass, field, replace
 from abc import ABCMeta
+from threading import Lock
 
 T = TypeVar("T")
 
 InstructionList: TypeAlias = List["Instruction"]
 ArgumentList: TypeAlias = List[Union["Argument", Any]]
+InstructionArguments: TypeAlias = Tuple[Union[Any, str], ...]
+Virtuals: TypeAlias = Dict[str, Callable[["Environment"], Any]]
+
+_opcodes: Dict[str, int] = {}
+_opcodes_lock = Lock()
+
+def opcode_of(token: str) -> int:
+    """Intern a token to a small integer opcode, shared by every parser and interpreter in the process."""
+    opcode = _opcodes.get(token)
+    if opcode is None:
+        with _opcodes_lock:
+            opcode = _opcodes.setdefault(token, len(_opcodes))
+    return opcode
 
 @runtime_checkable
 class WithAddress(Protocol, metaclass=ABCMeta):
@@ -13,19 +27,28 @@ class WithAddress(Protocol, metaclass=ABCMeta):
 
     name: str
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Instruction:
-    """An instruction contains token and arguments to an execution."""
+    """An immutable instruction contains token and arguments to an execution."""
 
     token: str
-    args: List[Union[Any, str]]
+    args: InstructionArguments
     line: int
+    opcode: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if type(self.args) is not tuple:
+            object.__setattr__(self, "args", tuple(self.args))
+        object.__setattr__(self, "opcode", opcode_of(self.token))
+    
+    def __reduce__(self) -> Any:
+        # Opcodes are local to the process, so they are interned again when unpickled.
+        return Instruction, (self.token, self.args, self.line)
 
 @dataclass(slots=True)
 class MemoryAddress(WithAddress, Generic[T]):
     """Memory address contains a name and value."""
 
-    owner: "Environment"
     name: str
     value: T
 
@@ -60,10 +83,63 @@ class Environment:
     is_obj: bool = False
 
     memory: Dict[str, MemoryAddress[Any]] = field(default_factory=dict, init=False, repr=False)
+    virtuals: Optional[Virtuals] = field(default=None, init=False, repr=False)
+    shared: bool = field(default=False, init=False, repr=False)
+    origin: Optional["Environment"] = field(default=None, init=False, repr=False)
+
+    def fork(self) -> "Environment":
+        """
+        Create a copy of this environment in O(1), sharing its memory until either of them writes to it. 
+        Only the memory itself is copied on write, values such as objects are still shared between forks.
+
+        Functions defined in this environment run in the fork they are called from, so they see what the fork wrote, 
+        as if they were defined in it. See 'scope_for'.
+        """
+        child = replace(self)
+        child.memory = self.memory
+        child.virtuals = self.virtuals
+        child.shared = self.shared = True
+        child.origin = self
+        return child
+    
+    def scope_for(self, owner: Optional["Environment"]) -> Optional["Environment"]:
+        """
+        The environment a function defined in 'owner' runs in when called from this one: the fork of the owner that 
+        this environment is, or is nested in, and otherwise the owner itself.
+        """
+        env = self
+        while env is not None:
+            if env is owner:
+                return owner
+            
+            origin = env.origin
+            while origin is not None:
+                if origin is owner:
+                    return env
+                origin = origin.origin
+            
+            env = env.parent
+        return owner
+    
+    def writable_memory(self) -> Dict[str, MemoryAddress[Any]]:
+        """Get the memory for writing, copying it first if it is still shared with a fork."""
+        if self.shared:
+            self.memory = {name: MemoryAddress(name, address.value) for name, address in self.memory.items()}
+            self.shared = False
+        return self.memory
 
     def resolve(self, name: str, default: Any = None) -> MemoryAddress[Any]:
-        if name in self.memory:
-            return self.memory[name]
-        if self.parent:
-            return self.parent.resolve(name, default)
+        """Resolve a name through the memory, then the virtual names, of this environment and its parents."""
+        env = self
+        while env is not None:
+            memory = env.memory
+            if name in memory:
+                return memory[name]
+            
+            virtuals = env.virtuals
+            if virtuals is not None and name in virtuals:
+                # Virtual names are computed on every lookup, so environments never store references to themselves.
+                return MemoryAddress(name, virtuals[name](env))
+            
+            env = env.parent
         return default
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List, Dict, Union, Protocol, Optional, TypeAlias, TypeVar, Generic, Any, runtime_checkable
+from typing import List, Dict, Tuple, Union, Protocol, Optional, TypeAlias, TypeVar, Generic, Callable, Any, runtime_checkable
 from dataclasses import dataclass, field
 from abc import ABCMeta
 
@@ -6,20 +6,24 @@ T = TypeVar("T")
 
 InstructionList: TypeAlias = List[Instruction]
 ArgumentList: TypeAlias = List[Union[Argument, Any]]
+InstructionArguments: TypeAlias = Tuple[Union[Any, str], ...]
+Virtuals: TypeAlias = Dict[str, Callable[[Environment], Any]]
+
+def opcode_of(token: str) -> int: ...
 
 @runtime_checkable
 class WithAddress(Protocol, metaclass=ABCMeta):
     name: str
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Instruction:
     token: str
-    args: List[Union[Any, str]]
+    args: InstructionArguments
     line: int
+    opcode: int = field(init=False, repr=False, compare=False)
 
 @dataclass(slots=True)
 class MemoryAddress(WithAddress, Generic[T]):
-    owner: Environment
     name: str
     value: T
 
@@ -45,5 +49,12 @@ class Environment:
     is_obj: bool = False
 
     memory: Dict[str, MemoryAddress[Any]] = field(default_factory=dict, init=False, repr=False)
+    virtuals: Optional[Virtuals] = field(default=None, init=False, repr=False)
+    shared: bool = field(default=False, init=False, repr=False)
+    origin: Optional[Environment] = field(default=None, init=False, repr=False)
+
+    def fork(self) -> Environment: ...
+    def scope_for(self, owner: Optional[Environment]) -> Optional[Environment]: ...
+    def writable_memory(self) -> Dict[str, MemoryAddress[Any]]: ...
 
     def resolve(self, name: str, default: Any = None) -> MemoryAddress[Any]: ...
\ No newline at end of file
@@ -1,11 +1,12 @@
-from typing import List, Optional
+from typing import List, Optional, Mapping
 from dataclasses import dataclass
+from types import MappingProxyType
 
 from .core import (
     ParserResolver, RuntimeResolver, 
     ParserResolutions, RuntimeResolutions, 
-    EnvironmentLoader, OnTokenize, 
-    Accent, Interpreter
+    BatchExecutor, EnvironmentLoader, OnTokenize, 
+    Accent, DispatchTable, Interpreter
 )
 
 @dataclass(slots=True)
@@ -14,6 +15,7 @@ class Syntax:
     internal: bool = False
     parser_resolver: Optional[ParserResolver] = None
     runtime_resolver: Optional[RuntimeResolver] = None
+    arity: int = 0
 
 class SyntaxTree:
     __slots__ = ("syntax_list", "internal_format", "_syntax_dict")
@@ -26,9 +28,9 @@ class SyntaxTree:
     
     @property
     def syntax_dict(self) -> "SyntaxDict":
-        if not self._syntax_dict:
+        if self._syntax_dict is None:
             self._syntax_dict = SyntaxDict(*self.syntax_list)
-        return self.syntax_dict
+        return self._syntax_dict
     
     @property
     def parser_resolutions(self) -> ParserResolutions:
@@ -40,18 +42,62 @@ class SyntaxTree:
     @property
     def runtime_resolutions(self) -> RuntimeResolutions:
         return {
-            syntax.name if not syntax.internal else self.internal_format.format(syntax.name): syntax.runtime_resolver 
+            self.runtime_token(syntax): syntax.runtime_resolver 
             for syntax in self.syntax_list if syntax.runtime_resolver is not None
         }
     
+    def runtime_token(self, syntax: Syntax) -> str:
+        return syntax.name if not syntax.internal else self.internal_format.format(syntax.name)
+    
+    def freeze(self) -> "FrozenSyntaxTree":
+        """Build the resolutions and the opcode dispatch table once, for creating many interpreters cheaply."""
+        return FrozenSyntaxTree(self)
+    
+    def create_interpreter(
+        self, 
+        accent: Optional[Accent] = None, 
+        environment_loader: Optional[EnvironmentLoader] = None, 
+        on_tokenize: Optional[OnTokenize] = None,
+        debug: bool = False,
+        batch_executor: Optional[BatchExecutor] = None
+    ) -> Interpreter:
+        return self.freeze().create_interpreter(accent, environment_loader, on_tokenize, debug, batch_executor)
+
+class FrozenSyntaxTree:
+    """An immutable syntax tree, with its resolutions and dispatch table built at freeze time."""
+
+    __slots__ = ("syntax", "_parser_resolutions", "_runtime_resolutions", "dispatch")
+
+    def __init__(self, tree: SyntaxTree) -> None:
+        self.syntax = tuple(tree.syntax_list)
+        self._parser_resolutions = tree.parser_resolutions
+        self._runtime_resolutions = tree.runtime_resolutions
+        self.dispatch = DispatchTable(
+            self._runtime_resolutions, 
+            {tree.runtime_token(syntax): syntax.arity for syntax in self.syntax if syntax.arity}
+        )
+    
+    @property
+    def parser_resolutions(self) -> Mapping[str, ParserResolver]:
+        return MappingProxyType(self._parser_resolutions)
+    
+    @property
+    def runtime_resolutions(self) -> Mapping[str, RuntimeResolver]:
+        return MappingProxyType(self._runtime_resolutions)
+    
     def create_interpreter(
         self, 
         accent: Optional[Accent] = None, 
         environment_loader: Optional[EnvironmentLoader] = None, 
         on_tokenize: Optional[OnTokenize] = None,
-        debug: bool = False
+        debug: bool = False,
+        batch_executor: Optional[BatchExecutor] = None
     ) -> Interpreter:
-        return Interpreter(self.parser_resolutions, self.runtime_resolutions, accent, environment_loader, on_tokenize, debug)
+        return Interpreter(
+            self._parser_resolutions, self._runtime_resolutions, 
+            accent, environment_loader, on_tokenize, debug, self.dispatch, 
+            batch_executor=batch_executor
+        )
 
 class SyntaxDict:
     __slots__ = ("syntax",)
@@ -1,5 +1,7 @@
-from typing import Tuple, List, Union, Optional, TypeAlias, Any
+from typing import Tuple, List, FrozenSet, Union, Optional, Sequence, TypeAlias, Any
+from collections import OrderedDict
 from dataclasses import dataclass
+from threading import Lock
 
 from .memory import (
     T, WithAddress, Instruction, MemoryAddress, Argument, Environment, InstructionList, ArgumentList
@@ -10,17 +12,116 @@ from .exceptions import ResolutionError
 
 Body: TypeAlias = List[Instruction]
 
+# What a call returned: the index of the argument it returned to, or -1 for other names, the name and the value.
+Returns: TypeAlias = Tuple[Tuple[int, str, Any], ...]
+
+class Identity:
+    """
+    Part of a memo key compared by identity, for values such as objects that cannot be hashed. It holds on to the value,
+    so while the key is in a memo the value is not collected, and its id cannot be given to another object.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+    
+    def __hash__(self) -> int:
+        return id(self.value)
+    
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Identity) and other.value is self.value
+
+class Memo:
+    """
+    The returns of a function by its arguments, for at most 'size' calls, evicting the least recently used first. The 
+    arguments it returns to, its destinations, are left out of the keys, so calls returning elsewhere share results.
+    """
+
+    __slots__ = ("size", "destinations", "entries", "hits", "misses", "_lock")
+
+    def __init__(self, size: Optional[int], destinations: FrozenSet[int]) -> None:
+        self.size = size
+        self.destinations = destinations
+        self.entries: OrderedDict[Tuple[Any, ...], Returns] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+    
+    def __reduce__(self) -> Any:
+        # Remembered returns may hold anything, so a memo is stored empty.
+        return Memo, (self.size, self.destinations)
+    
+    def key(self, values: Sequence[Any]) -> Tuple[Any, ...]:
+        parts = []
+        for i, value in enumerate(values):
+            if i in self.destinations:
+                continue
+            try:
+                hash(value)
+            except TypeError:
+                value = Identity(value)
+            parts.append(value)
+        return tuple(parts)
+    
+    def get(self, key: Tuple[Any, ...]) -> Optional[Returns]:
+        with self._lock:
+            returns = self.entries.get(key)
+            if returns is None:
+                self.misses += 1
+                return None
+            
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return returns
+    
+    def put(self, key: Tuple[Any, ...], returns: Returns) -> None:
+        with self._lock:
+            self.entries[key] = returns
+            self.entries.move_to_end(key)
+            if self.size is not None and len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+    
+    def forget(self, key: Optional[Tuple[Any, ...]] = None) -> None:
+        """Forget the returns of the call with the key, or of every call."""
+        with self._lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+
 @dataclass(slots=True)
 class Function(WithAddress):
+    """
+    The parser creates one function for every definition, without an owner. Every time the definition runs it creates a
+    closure over the runtime it ran in, sharing the code. Hoisted functions are nested definitions that capture nothing
+    from the function, so they are bound to every call of it without running their definitions again. Generator functions
+    yield values, and calling them creates a suspended frame rather than running them. Memoized functions have a memo.
+    """
+
     owner: Optional[Union[Environment, Runtime]]
     file: Optional[str]
     name: str
-    args: List[str]
-    instructions: InstructionList
+    args: Tuple[str, ...]
+    instructions: Sequence[Instruction]
+    hoisted: Tuple["Function", ...] = ()
+    generator: bool = False
+    memo: Optional[Memo] = None
 
     def __call__(self) -> None:
         pass
 
+    def bind(self, owner: Union[Environment, Runtime]) -> "Function":
+        """The same function with another owner, such as an object for its methods."""
+        return Function(owner, self.file, self.name, self.args, self.instructions, self.hoisted, self.generator, self.memo)
+
+def create_closure(func: Function, owner: Union[Environment, Runtime], file: Optional[str]) -> Function:
+    """A closure of the function over the owner, with closures of its hoisted functions over the same owner."""
+    return Function(
+        owner, file, func.name, func.args, func.instructions, 
+        tuple(create_closure(hoisted, owner, file) for hoisted in func.hoisted), func.generator, func.memo
+    )
+
 def create_body(instructions: InstructionList, start: int, inst_token: str, end_token: str, args: List[Any]) -> Tuple[Tuple[int, int], Body, int]:
     """
     Create a body from instructions, from the start to where the end token is found and all arguments matching. 
@@ -34,6 +135,7 @@ def create_body(instructions: InstructionList, start: int, inst_token: str, end_
     """
     count = len(instructions)
     body = []
+    args = tuple(args)
 
     i = start + 1
     depth = 0
@@ -54,14 +156,19 @@ def create_body(instructions: InstructionList, start: int, inst_token: str, end_
     return (start, i), body, depth
 
 def set_memory(environment: Environment, name: str, value: T) -> MemoryAddress[T]:
-    if name in environment.memory:
-        address = environment.memory[name]
+    memory = environment.writable_memory() if environment.shared else environment.memory
+    if name in memory:
+        address = memory[name]
         address.value = value
     else:
-        address = MemoryAddress(environment, name, value)
-        environment.memory[name] = address
+        address = MemoryAddress(name, value)
+        memory[name] = address
     return address
 
+def del_memory(environment: Environment, name: str) -> None:
+    memory = environment.writable_memory() if environment.shared else environment.memory
+    del memory[name]
+
 def extract_arguments(args: List[Any]) -> List[Any]:
     unpacked_values = []
     for arg in args:
@@ -3,12 +3,24 @@ from ._internal.core import (
     ParserResolutions,
     RuntimeResolver,
     RuntimeResolutions,
+    AsyncRuntimeResolver,
+    AsyncRuntimeResolutions,
+    BatchExecutor,
     EnvironmentLoader,
     OnTokenize,
+    ArgumentSpec,
     Accent,
     Runtime,
+    Monitor,
+    span,
+    InterpreterIO,
+    CapturedIO,
+    ExecutionContext,
+    BatchResult,
+    DispatchTable,
     Parser,
-    Interpreter
+    Interpreter,
+    AsyncInterpreter
 )
 
 __all__ = (
@@ -16,10 +28,22 @@ __all__ = (
     "ParserResolutions",
     "RuntimeResolver",
     "RuntimeResolutions",
+    "AsyncRuntimeResolver",
+    "AsyncRuntimeResolutions",
+    "BatchExecutor",
     "EnvironmentLoader",
     "OnTokenize",
+    "ArgumentSpec",
     "Accent",
     "Runtime",
+    "Monitor",
+    "span",
+    "InterpreterIO",
+    "CapturedIO",
+    "ExecutionContext",
+    "BatchResult",
+    "DispatchTable",
     "Parser",
-    "Interpreter"
+    "Interpreter",
+    "AsyncInterpreter"
 )
\ No newline at end of file
@@ -1,15 +1,27 @@
 from ._internal.exceptions import (
     ParserError,
+    Frame,
     InterpretationError,
+    ExecutionFailed,
     UnknownToken,
     AlreadyInterpreted,
-    ResolutionError
+    Deadlock,
+    ResourceExhausted,
+    ResolutionError,
+    NotColumnar,
+    SnapshotError
 )
 
 __all__ = (
     "ParserError",
+    "Frame",
     "InterpretationError",
+    "ExecutionFailed",
     "UnknownToken",
     "AlreadyInterpreted",
-    "ResolutionError"
+    "Deadlock",
+    "ResourceExhausted",
+    "ResolutionError",
+    "NotColumnar",
+    "SnapshotError"
 )
\ No newline at end of file
@@ -1,6 +1,9 @@
 from ._internal.memory import (
     ArgumentList,
     InstructionList,
+    InstructionArguments,
+    Virtuals,
+    opcode_of,
     WithAddress,
     Instruction,
     MemoryAddress,
@@ -12,6 +15,9 @@ from ._internal.memory import (
 __all__ = (
     "ArgumentList",
     "InstructionList",
+    "InstructionArguments",
+    "Virtuals",
+    "opcode_of",
     "WithAddress",
     "Instruction",
     "MemoryAddress",
@@ -0,0 +1,208 @@
+"""Numeric arrays, which 'math' combines element by element and reduces in a single statement."""
+
+from typing import Dict, List, Iterable, Iterator, Optional, Callable, Union, Any
+from functools import partial
+from itertools import repeat
+from array import array
+
+from Interpreter.core import Runtime, Interpreter
+from Interpreter.memory import Environment, ArgumentList, Virtuals
+from Interpreter.exceptions import ResolutionError
+from Interpreter.utils import set_memory, evaluate_math
+
+from Interpreter.syntax import Syntax, SyntaxDict
+
+from .ffi import NativeMethod, value_of, name_of, py_to_vm
+from .generators import iterate
+from .math import math_operation, r_math as math_resolver
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+Scalar = Union[int, float]
+
+class NumericArray:
+    """
+    Floats stored contiguously, in a numpy array when numpy is installed and an 'array.array' otherwise. Both hold the
+    same values, so programs behave alike with either.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> "NumericArray":
+        floats = map(float, values)
+        if numpy is not None:
+            return cls(numpy.fromiter(floats, dtype=float))
+        return cls(array("d", floats))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.data.tolist())
+
+    def __getitem__(self, index: int) -> float:
+        return float(self.data[index])
+
+    def __setitem__(self, index: int, value: Any) -> None:
+        self.data[index] = float(value)
+
+    def copy(self) -> "NumericArray":
+        return NumericArray(self.data.copy() if numpy is not None else array("d", self.data))
+
+    def sum(self) -> float:
+        return float(self.data.sum()) if numpy is not None else float(sum(self.data))
+
+    def min(self) -> float:
+        return float(self.data.min()) if numpy is not None else min(self.data)
+
+    def max(self) -> float:
+        return float(self.data.max()) if numpy is not None else max(self.data)
+
+def operand(value: Any) -> Any:
+    """The array of an array environment, or the value as a number, like 'evaluate_math' reads strings."""
+    if isinstance(value, Environment) and is_array(value):
+        return array_data(value)
+    if isinstance(value, str):
+        return float(value)
+    return value
+
+def elementwise(func: Callable[[Any, Any], Any], left: Any, right: Any) -> NumericArray:
+    """Apply the operation to every pair of elements, where a number on either side pairs with every element."""
+    arrays = [side for side in (left, right) if isinstance(side, NumericArray)]
+    size = len(arrays[0])
+    if any(len(side) != size for side in arrays):
+        raise ResolutionError(f"Arrays of {' and '.join(str(len(side)) for side in arrays)} elements can not be combined element by element.")
+
+    # Dividing by zero fails with either backend, as numpy would otherwise fill in infinities and python raises its own error.
+    try:
+        if numpy is not None:
+            with numpy.errstate(divide="raise", invalid="raise"):
+                result = func(
+                    left.data if isinstance(left, NumericArray) else left,
+                    right.data if isinstance(right, NumericArray) else right
+                )
+            return NumericArray(numpy.asarray(result, dtype=float))
+
+        return NumericArray(array("d", map(
+            func,
+            left.data if isinstance(left, NumericArray) else repeat(left, size),
+            right.data if isinstance(right, NumericArray) else repeat(right, size)
+        )))
+    except ArithmeticError as e:
+        raise ResolutionError(f"Arrays could not be combined element by element: {e}.") from e
+
+def reduce_values(op: str, values: List[Any]) -> Scalar:
+    """Reduce numbers and arrays together, with every element of an array counting as a value of its own."""
+    match op:
+        case "abs":
+            return abs(reduce_values("sum", values))
+        case "sum":
+            return sum(value.sum() if isinstance(value, NumericArray) else value for value in values)
+        case "min":
+            return min(value.min() if isinstance(value, NumericArray) else value for value in values)
+        case "max":
+            return max(value.max() if isinstance(value, NumericArray) else value for value in values)
+
+    raise ResolutionError(f"'{op}' is not a reduction.")
+
+def array_data(environment: Environment) -> NumericArray:
+    return environment.memory["data"].value
+
+def array_get(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any, index: Any) -> None:
+    set_memory(runtime, name_of(dest), array_data(owner)[int(value_of(index))])
+
+def array_set(interpreter: Interpreter, runtime: Runtime, owner: Environment, index: Any, value: Any) -> None:
+    array_data(owner)[int(value_of(index))] = value_of(value)
+
+def array_len(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any) -> None:
+    set_memory(runtime, name_of(dest), len(array_data(owner)))
+
+def array_copy(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any) -> None:
+    set_memory(runtime, name_of(dest), create_array(array_data(owner).copy(), owner.parent))
+
+def array_to_list(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any) -> None:
+    set_memory(runtime, name_of(dest), py_to_vm(list(array_data(owner)), runtime))
+
+array_methods: Dict[str, Callable[..., None]] = {
+    "get": array_get,
+    "set": array_set,
+    "len": array_len,
+    "copy": array_copy,
+    "to_list": array_to_list
+}
+
+array_virtuals: Virtuals = {name: partial(NativeMethod, func) for name, func in array_methods.items()}
+
+def create_array(data: NumericArray, parent: Optional[Environment]) -> Environment:
+    env = Environment(parent, True)
+    set_memory(env, "data", data)
+    env.virtuals = array_virtuals
+    return env
+
+def is_array(environment: Environment) -> bool:
+    return environment.virtuals is array_virtuals
+
+def r_array(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 1:
+        raise ResolutionError("The 'array' runtime resolver requires a name to save the array to, followed by its numbers or something to iterate over.")
+
+    name = args[0].as_text
+    values = [arg.as_value for arg in args[1:]]
+
+    if len(values) == 1 and not isinstance(values[0], (int, float, str)):
+        source = values[0]
+        data = array_data(source).copy() if isinstance(source, Environment) and is_array(source) else NumericArray.from_values(map(value_of, iterate(source)))
+    else:
+        data = NumericArray.from_values(values)
+
+    set_memory(runtime, name, create_array(data, runtime))
+
+def r_math(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    """'math' with arrays among its values. Statements without arrays are left to the 'math' of 'math.py'."""
+    values = [arg.as_value for arg in args]
+    if not any(isinstance(value, Environment) and is_array(value) for value in values):
+        math_resolver(interpreter, runtime, args)
+        return
+
+    if len(args) < 2:
+        raise ResolutionError("The 'math' runtime resolver requires at least a return variable, operation and value to operate on, or a 'if' statement like structure.")
+
+    env = runtime
+    offset = 0
+
+    # Arrays are saved to, never saved into.
+    if isinstance(values[0], Environment) and not is_array(values[0]):
+        env = values[0]
+        offset = 1
+
+    name = args[offset + 0].as_text
+    op = args[offset + 1].as_text
+
+    match op:
+        case "abs" | "sum" | "min" | "max":
+            result = reduce_values(op, [operand(value) for value in values[offset + 2:]])
+        case _ if len(args) < offset + 3:
+            result = False
+        case _:
+            left = operand(values[offset + 1])
+            right = operand(values[-1])
+            ops = tuple(arg.as_text for arg in args[offset + 2:-1])
+
+            if isinstance(left, NumericArray) or isinstance(right, NumericArray):
+                result = create_array(elementwise(math_operation(ops), left, right), runtime)
+            else:
+                result = evaluate_math([left, *ops, right])
+
+    set_memory(env, name, result)
+
+array_syntax: SyntaxDict = SyntaxDict(
+    Syntax("array", runtime_resolver=r_array, arity=1),
+    Syntax("math", runtime_resolver=r_math, arity=2)
+)
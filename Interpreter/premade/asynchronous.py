@@ -0,0 +1,176 @@
+"""Asynchronous resolutions, for running programs as asyncio tasks that await python coroutines and blocking calls."""
+
+from typing import Tuple, Optional
+from inspect import isawaitable, iscoroutinefunction
+import asyncio
+
+from Interpreter.core import AsyncRuntimeResolutions, Runtime, AsyncInterpreter
+from Interpreter.memory import ArgumentList
+from Interpreter.exceptions import ResolutionError, ResourceExhausted
+from Interpreter.utils import Function, set_memory, extract_arguments
+
+from .ffi import PyFunction, NativeMethod
+from .objects import (
+    bind_runtime, prepare_init, finish_init, prepare_call, call_values, lookup_memo, store_memo, python_arguments, native_arguments
+)
+from .comparison import resolve_condition
+from .generators import iterate, start_generator
+from .standard import standard_accent, standard_environment_loader, frozen_standard_syntax_tree, execute_batch_columns
+
+async def a_await(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    """
+    Await a python coroutine function or awaitable, and save the result. Other python functions are run in a thread, 
+    so blocking calls do not stall the event loop.
+    """
+    if len(args) < 2:
+        raise ResolutionError("The 'await' runtime resolver requires at least a destination and something to await.")
+    
+    dest = args[0].as_text
+    value = args[1].as_value
+
+    if isinstance(value, PyFunction):
+        values = extract_arguments([arg.as_value for arg in args[2:]])
+
+        if iscoroutinefunction(value.func):
+            result = await value(*values)
+        else:
+            result = await asyncio.to_thread(value, *values)
+            if isawaitable(result):
+                result = await result
+    
+    elif isawaitable(value):
+        result = await value
+    
+    else:
+        raise ResolutionError("Only python functions and awaitables can be awaited.")
+    
+    set_memory(runtime, dest, result)
+
+async def a_call(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 1:
+        raise ResolutionError("The 'call' runtime resolver requires at least a name for the function to call. Optionally parse arguments following.")
+    
+    func = args[0].as_value
+
+    if isinstance(func, PyFunction):
+        dest, values = python_arguments(args)
+        result = func(*values)
+        if isawaitable(result):
+            result = await result
+        set_memory(runtime, dest, result)
+        return
+    
+    if isinstance(func, NativeMethod):
+        func(interpreter, runtime, *native_arguments(args))
+        return
+    
+    if isinstance(func, Function) and func.generator:
+        start_generator(interpreter, runtime, func, args)
+        return
+    
+    if isinstance(func, Function) and func.memo is not None:
+        await call_memoized(interpreter, runtime, func, args)
+        return
+    
+    callee = prepare_call(runtime, func, args)
+    await interpreter.execute_instructions_async(func.instructions, runtime=callee)
+
+async def call_memoized(interpreter: AsyncInterpreter, runtime: Runtime, func: Function, args: ArgumentList) -> None:
+    values = call_values(func, args)
+    key, hit = lookup_memo(interpreter, runtime, func, values)
+    if hit:
+        return
+    
+    returned = Runtime(None, file=runtime.file)
+    runtimes = interpreter.runtimes
+    runtimes.append(returned)
+    failed = True
+    try:
+        await interpreter.execute_instructions_async(func.instructions, runtime=bind_runtime(func, values, runtime))
+        failed = False
+    finally:
+        runtimes.pop()
+        store_memo(runtime, func, values, key, returned, failed)
+
+async def a_init(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    name, obj, func, callee = prepare_init(interpreter, runtime, args)
+    await interpreter.execute_instructions_async(func.instructions, runtime=callee)
+    finish_init(runtime, name, obj)
+
+async def a___if__(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The if statement could not be saved during runtime: the given arguments were too few.")
+    
+    cond_args, body = args
+
+    if resolve_condition(interpreter, runtime, cond_args):
+        await interpreter.execute_instructions_async(body, runtime=runtime)
+
+async def a___while__(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The while statement could not be saved during runtime: the given arguments were too few.")
+    
+    cond_args, body = args
+
+    while resolve_condition(interpreter, runtime, cond_args):
+        await interpreter.execute_instructions_async(body, runtime=runtime)
+
+        if runtime.stopped or interpreter.stopped:
+            break
+
+async def a___for__(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The for statement could not be saved during runtime: the given arguments were too few.")
+    
+    (name, source), body = args
+
+    for value in iterate(interpreter.translate(runtime, source).as_value):
+        set_memory(runtime, name, value)
+        await interpreter.execute_instructions_async(body, runtime=runtime)
+
+        if runtime.stopped or interpreter.stopped:
+            break
+
+async def a___try__(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The try statement could not be saved during runtime: the given arguments were too few.")
+    
+    try_args, body = args
+    func = interpreter.translate(runtime, try_args[0]).as_value
+
+    if not isinstance(func, Function):
+        raise ResolutionError("The function to handle whether the try block failed wasn't of the right type.")
+    
+    try:
+        await interpreter.execute_instructions_async(body, runtime=runtime)
+    except ResourceExhausted:
+        raise
+    except Exception as e:
+        await interpreter.execute_instructions_async(func.instructions, runtime=bind_runtime(func, [e], runtime))
+
+async_resolutions: AsyncRuntimeResolutions = {
+    "await": a_await,
+    "call": a_call,
+    "init": a_init,
+    "__if__": a___if__,
+    "__while__": a___while__,
+    "__for__": a___for__,
+    "__try__": a___try__
+}
+
+def create_async_interpreter(debug: bool = False, resolutions: Optional[AsyncRuntimeResolutions] = None) -> AsyncInterpreter:
+    return AsyncInterpreter(
+        dict(frozen_standard_syntax_tree.parser_resolutions), 
+        dict(frozen_standard_syntax_tree.runtime_resolutions),
+        accent = standard_accent,
+        environment_loader = standard_environment_loader,
+        debug = debug,
+        dispatch = frozen_standard_syntax_tree.dispatch,
+        async_resolutions = {**async_resolutions, **(resolutions or {})},
+        batch_executor = execute_batch_columns
+    )
+
+async def interpret_file_async(file: str, debug: bool = False) -> Tuple[AsyncInterpreter, Runtime]:
+    interpreter = create_async_interpreter(debug)
+    runtime = await interpreter.interpret_async(file)
+    return interpreter, runtime
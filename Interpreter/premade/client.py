@@ -0,0 +1,186 @@
+"""
+The client of the interpreter daemon of 'daemon.py', and the framing both use. It only needs the standard library, so
+scripts and shell pipelines talking to a running server start without loading the interpreter.
+
+Every message is a frame: its length as 4 bytes, big-endian, followed by that many bytes of UTF-8 JSON.
+"""
+
+from typing import Dict, Sequence, Optional, Any
+import argparse
+import tempfile
+import socket
+import struct
+import json
+import sys
+import os
+
+FRAME_HEADER = struct.Struct(">I")
+
+# Frames larger than this are refused rather than read into memory.
+MAX_FRAME = 64 << 20
+
+def default_socket_path() -> str:
+    return os.environ.get("EPIS_SOCKET") or os.path.join(tempfile.gettempdir(), f"epis-{os.getuid()}.sock")
+
+class ProtocolError(Exception):
+    pass
+
+def read_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Read the given number of bytes, or None when the connection closes before the first of them."""
+    chunks = []
+    left = size
+    while left:
+        chunk = sock.recv(min(left, 1 << 20))
+        if not chunk:
+            if left == size:
+                return None
+            raise ProtocolError("The connection closed in the middle of a frame.")
+        chunks.append(chunk)
+        left -= len(chunk)
+    return b"".join(chunks)
+
+def read_frame(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """The next message, or None when the other side has closed the connection."""
+    header = read_exactly(sock, FRAME_HEADER.size)
+    if header is None:
+        return None
+
+    (size,) = FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME:
+        raise ProtocolError(f"A frame of {size} bytes is larger than the limit of {MAX_FRAME}.")
+
+    body = read_exactly(sock, size) if size else b""
+    if body is None:
+        raise ProtocolError("The connection closed in the middle of a frame.")
+
+    message = json.loads(body.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ProtocolError("Messages are JSON objects.")
+    return message
+
+def write_frame(sock: socket.socket, message: Dict[str, Any]) -> None:
+    # Values without a JSON form, like functions and arrays, are sent as their representation.
+    body = json.dumps(message, default=repr).encode("utf-8")
+    sock.sendall(FRAME_HEADER.pack(len(body)) + body)
+
+class InterpreterClient:
+    """A connection to a running server, sending one message at a time."""
+
+    __slots__ = ("path", "_sock")
+
+    def __init__(self, path: Optional[str] = None, timeout: Optional[float] = None) -> None:
+        self.path = path or default_socket_path()
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(self.path)
+
+    def __enter__(self) -> "InterpreterClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        write_frame(self._sock, message)
+        response = read_frame(self._sock)
+        if response is None:
+            raise ProtocolError("The server closed the connection without answering.")
+        return response
+
+    def run(
+        self,
+        source: Optional[str] = None,
+        path: Optional[str] = None,
+        input: str = "",
+        variables: Optional[Dict[str, Any]] = None,
+        limits: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        # Paths are sent whole, as the server resolves relative ones from its own working directory.
+        return self.request({
+            "op": "run",
+            "source": source,
+            "path": os.path.abspath(path) if path is not None else None,
+            "input": input,
+            "variables": variables,
+            "limits": limits
+        })
+
+    def ping(self) -> bool:
+        return bool(self.request({"op": "ping"}).get("ok"))
+
+    def stats(self) -> Dict[str, Any]:
+        return self.request({"op": "stats"})["stats"]
+
+    def shutdown(self) -> None:
+        self.request({"op": "shutdown"})
+
+    def close(self) -> None:
+        self._sock.close()
+
+def parse_variables(pairs: Sequence[str]) -> Dict[str, Any]:
+    """Variables given as 'name=value', where values are read as JSON and kept as text when they are not."""
+    variables = {}
+    for pair in pairs:
+        name, _, value = pair.partition("=")
+        try:
+            variables[name] = json.loads(value)
+        except ValueError:
+            variables[name] = value
+    return variables
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m Interpreter.premade.client", description="Run EPIS programs on a running daemon.")
+    parser.add_argument("--socket", default=None, help="path of the Unix domain socket, $EPIS_SOCKET or one in the temporary directory by default")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run a file, or the source read from stdin with '-'")
+    run_parser.add_argument("file")
+    run_parser.add_argument("--input", default=None, help="file to read the program's input from, '-' for stdin, which is also read when it is not a terminal")
+    run_parser.add_argument("--var", action="append", default=[], help="variable to set before running, as name=value")
+    run_parser.add_argument("--seconds", type=float, default=None, help="time limit")
+    run_parser.add_argument("--instructions", type=int, default=None, help="instruction limit")
+    run_parser.add_argument("--json", action="store_true", help="print the whole response as JSON")
+
+    commands.add_parser("stats", help="print the statistics of the server")
+    commands.add_parser("stop", help="stop the server")
+
+    args = parser.parse_args(argv)
+    if args.command == "run" and args.file == "-" and args.input == "-":
+        parser.error("stdin can be read as the program or as its input, not both")
+
+    with InterpreterClient(args.socket) as client:
+        if args.command == "stats":
+            print(json.dumps(client.stats(), indent=2))
+            return 0
+
+        if args.command == "stop":
+            client.shutdown()
+            return 0
+
+        limits = {
+            name: value for name, value in (("seconds", args.seconds), ("instructions", args.instructions))
+            if value is not None
+        }
+        input_text = ""
+        if args.input == "-" or (args.input is None and args.file != "-" and sys.stdin is not None and not sys.stdin.isatty()):
+            input_text = sys.stdin.read()
+        elif args.input is not None:
+            with open(args.input, "r", encoding="utf-8") as f:
+                input_text = f.read()
+
+        if args.file == "-":
+            response = client.run(source=sys.stdin.read(), input=input_text, variables=parse_variables(args.var), limits=limits)
+        else:
+            response = client.run(path=args.file, input=input_text, variables=parse_variables(args.var), limits=limits)
+
+    if args.json:
+        print(json.dumps(response, indent=2, default=repr))
+    else:
+        sys.stdout.write(response.get("output") or "")
+        if response.get("error"):
+            print(response["error"], file=sys.stderr)
+
+    return 0 if response.get("ok") else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Batches evaluated a column at a time, with column resolutions of 'set', 'math' and 'if' evaluating a statement for
+every record at once. 'execute_batch_columns' is the batch executor of the standard interpreters.
+"""
+
+from typing import Dict, List, Tuple, Iterator, Optional, Callable, TypeAlias, Final, Any
+from dataclasses import dataclass
+from contextlib import contextmanager
+
+from Interpreter.core import ArgumentSpec, BatchResult, Runtime, Interpreter
+from Interpreter.memory import Environment, InstructionList
+from Interpreter.exceptions import NotColumnar
+from Interpreter.utils import evaluate_condition, evaluate_math
+
+from .objects import casters, is_container_type
+from .math import math_operation
+
+ColumnResolver: TypeAlias = Callable[[Interpreter, "ColumnFrame", Tuple[Any, ...]], None]
+ColumnResolutions: TypeAlias = Dict[str, ColumnResolver]
+
+# The value of a record that has none, for names only some records have, and outside the mask of a block.
+MISSING: Final = object()
+
+# Casts that keep values plain. Containers, errors and objects are only created record by record.
+COLUMN_CASTS: Final = frozenset(("int", "float", "str", "bool", "any"))
+
+# Errors of evaluating values, which running every record by itself reports with the file and line of the record.
+VALUE_ERRORS: Final = (ArithmeticError, ValueError, TypeError)
+
+@dataclass(slots=True)
+class ColumnFrame:
+    """
+    A batch of records evaluated a column at a time: a column of values, one for every record, for each name, and the 
+    runtime every other name resolves through. Inside blocks, only the records in the mask are changed.
+    """
+
+    columns: Dict[str, List[Any]]
+    size: int
+    scope: Runtime
+    mask: Optional[List[bool]] = None
+
+    def apply(self, func: Callable[..., Any], *columns: List[Any]) -> List[Any]:
+        """Apply the function to the values of every record in the mask, leaving the others without a value."""
+        mask = self.mask
+        if mask is None:
+            return list(map(func, *columns))
+        return [func(*values) if keep else MISSING for keep, *values in zip(mask, *columns)]
+    
+    def write(self, name: str, values: List[Any]) -> None:
+        mask = self.mask
+        if mask is None:
+            self.columns[name] = values
+            return
+        
+        old = self.columns.get(name) or [MISSING] * self.size
+        self.columns[name] = [value if keep else current for keep, value, current in zip(mask, values, old)]
+    
+    def where(self, values: List[Any]) -> List[bool]:
+        """The mask of the records in the current mask whose value is true."""
+        return [value is not MISSING and bool(value) for value in values]
+    
+    @contextmanager
+    def masked(self, mask: List[bool]) -> Iterator[None]:
+        previous = self.mask
+        self.mask = mask
+        try:
+            yield
+        finally:
+            self.mask = previous
+
+def is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (int, float, str))
+
+def is_numeric(column: List[Any]) -> bool:
+    return all(type(value) is int or type(value) is float for value in column)
+
+def argument_spec(interpreter: Interpreter, arg: Any) -> ArgumentSpec:
+    """How the interpreter reads an argument, from the same cache as 'translate'."""
+    if not isinstance(arg, str):
+        raise NotColumnar(f"Argument '{arg}' is not text.")
+    
+    spec = interpreter.arguments.get(arg)
+    if spec is None:
+        spec = interpreter.compile_argument(arg)
+    return spec
+
+def column(interpreter: Interpreter, frame: ColumnFrame, arg: Any) -> List[Any]:
+    """The values of an argument for every record: its column, or what it reads as outside the batch."""
+    parts = argument_spec(interpreter, arg).parts
+    values = frame.columns.get(parts[0]) if parts else None
+
+    if values is None:
+        value = interpreter.translate(frame.scope, arg).as_value
+        if not is_scalar(value):
+            raise NotColumnar(f"Argument '{arg}' is not a plain value.")
+        return [value] * frame.size
+    
+    if len(parts) > 1:
+        raise NotColumnar(f"Argument '{arg}' navigates through a column.")
+    
+    if MISSING in values:
+        # Records without a value of their own read the name like any other record would without it.
+        fallback = interpreter.translate(frame.scope, arg).as_value
+        return [fallback if value is MISSING else value for value in values]
+    
+    return values
+
+def column_name(interpreter: Interpreter, frame: ColumnFrame, arg: Any) -> str:
+    """The name an argument is written to in a batch. Names of objects are not columns, so they are refused."""
+    spec = argument_spec(interpreter, arg)
+    if spec.parts is None:
+        return spec.fallback_text
+    
+    if len(spec.parts) > 1 or (spec.parts[0] not in frame.columns and not is_scalar(interpreter.translate(frame.scope, arg).as_value)):
+        raise NotColumnar(f"Argument '{arg}' is not the name of a column.")
+    
+    return spec.text
+
+def execute_columns(interpreter: Interpreter, instructions: InstructionList, frame: ColumnFrame) -> None:
+    """Evaluate the instructions for every record of the frame at once, raising NotColumnar when one cannot be."""
+    for inst in instructions:
+        resolver = column_resolutions.get(inst.token)
+        if resolver is None:
+            raise NotColumnar(f"'{inst.token}' on line {inst.line} cannot be evaluated a column at a time.")
+        resolver(interpreter, frame, inst.args)
+
+def execute_batch_columns(
+    interpreter: Interpreter, 
+    instructions: InstructionList, 
+    records: List[Dict[str, Any]], 
+    parent: Optional[Environment], 
+    file: str
+) -> BatchResult:
+    """Evaluate a batch a column at a time, when every statement has a column resolution and every value is plain."""
+    size = len(records)
+    names: Dict[str, None] = {}
+    for record in records:
+        names.update(dict.fromkeys(record))
+    
+    columns = {name: [record.get(name, MISSING) for record in records] for name in names}
+    for values in columns.values():
+        if not all(value is MISSING or is_scalar(value) for value in values):
+            raise NotColumnar("Records hold values that are not plain.")
+    
+    scope = Runtime(parent=parent, file=file)
+    if interpreter.environment_loader:
+        interpreter.environment_loader(scope)
+    
+    frame = ColumnFrame(columns, size, scope)
+    try:
+        execute_columns(interpreter, instructions, frame)
+    except VALUE_ERRORS as e:
+        raise NotColumnar(f"A value could not be evaluated a column at a time: {e}") from e
+
+    return BatchResult(
+        {name: [None if value is MISSING else value for value in values] for name, values in frame.columns.items()}, 
+        size, 
+        True
+    )
+
+def c_set(interpreter: Interpreter, frame: ColumnFrame, args: Tuple[Any, ...]) -> None:
+    if len(args) not in (2, 3):
+        raise NotColumnar("Only 'set' with a name, optionally a type, and a value is evaluated a column at a time.")
+    if len(args) == 2 and is_container_type(casters.get(argument_spec(interpreter, args[1]).text)):
+        raise NotColumnar("Empty containers are only created record by record.")
+
+    name = column_name(interpreter, frame, args[0])
+    values = column(interpreter, frame, args[-1])
+    t = argument_spec(interpreter, args[1]).text if len(args) == 3 else "any"
+
+    if t not in casters:
+        t = "any"
+    if t not in COLUMN_CASTS:
+        raise NotColumnar(f"Values cast to '{t}' are not plain.")
+
+    frame.write(name, values if t == "any" else frame.apply(casters[t], values))
+
+def c_math(interpreter: Interpreter, frame: ColumnFrame, args: Tuple[Any, ...]) -> None:
+    if len(args) < 2:
+        raise NotColumnar("'math' requires a name and an operation.")
+
+    name = column_name(interpreter, frame, args[0])
+    op = argument_spec(interpreter, args[1]).text
+
+    match op:
+        case "abs" | "sum" | "min" | "max":
+            columns = [column(interpreter, frame, arg) for arg in args[2:]]
+            func = {"abs": lambda *values: abs(sum(values)), "sum": lambda *values: sum(values), "min": min, "max": max}[op]
+            values = frame.apply(func, *columns)
+
+        case _ if len(args) < 3:
+            values = frame.apply(lambda: False)
+
+        case _:
+            left = column(interpreter, frame, args[1])
+            right = column(interpreter, frame, args[-1])
+            ops = tuple(argument_spec(interpreter, arg).text for arg in args[2:-1])
+
+            if is_numeric(left) and is_numeric(right):
+                values = frame.apply(math_operation(ops), left, right)
+            else:
+                values = frame.apply(lambda l, r: evaluate_math([l, *ops, r]), left, right)
+
+    frame.write(name, values)
+
+def c___if__(interpreter: Interpreter, frame: ColumnFrame, args: Tuple[Any, ...]) -> None:
+    cond_args, body = args
+    columns = [column(interpreter, frame, arg) for arg in cond_args]
+    extract_str = interpreter.accent.extract_str
+
+    def condition(*values: Any) -> Any:
+        return evaluate_condition([extract_str(value) if isinstance(value, str) else value for value in values])
+
+    mask = frame.where(frame.apply(condition, *columns))
+    if not any(mask):
+        return
+
+    with frame.masked(mask):
+        execute_columns(interpreter, body, frame)
+
+column_resolutions: ColumnResolutions = {
+    "set": c_set,
+    "math": c_math,
+    "__if__": c___if__
+}
@@ -1,9 +1,10 @@
+from typing import Any
 from Interpreter.core import Runtime, Parser, Interpreter
-from Interpreter.memory import Instruction, ArgumentList, InstructionList, Explicit, Argument
-from Interpreter.exceptions import ResolutionError
-from Interpreter.utils import Function, create_body, extract_arguments, evaluate_condition
+from Interpreter.memory import Instruction, ArgumentList, InstructionList
+from Interpreter.exceptions import ResolutionError, ResourceExhausted
+from Interpreter.utils import Function, create_body, evaluate_condition
 
-from .ffi import py_to_vm
+from .objects import bind_runtime
 
 from Interpreter.syntax import Syntax, SyntaxDict
 
@@ -15,18 +16,13 @@ def p_if(parser: Parser, instructions: InstructionList, i: int) -> int:
     if not depth < 0:
         raise ResolutionError("Could not locate where 'if' body ends.")
     
-    instructions[start] = Instruction("__if__", [inst.args, parser.transform(body)], start)
+    instructions[start] = Instruction("__if__", (inst.args, tuple(parser.transform(body))), inst.line)
 
     del instructions[start+1:end+1]
 
     return start
 
-def r___if__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
-    if len(args) < 2:
-        raise ResolutionError("The if statement could not be saved during runtime: the given arguments were too few.")
-    
-    cond_args, body = args
-
+def resolve_condition(interpreter: Interpreter, runtime: Runtime, cond_args: ArgumentList) -> Any:
     resolved_args = []
     for arg in cond_args:
         value = interpreter.translate(runtime, arg).as_value
@@ -35,7 +31,15 @@ def r___if__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) ->
         else:
             resolved_args.append(value)
     
-    if evaluate_condition(resolved_args):
+    return evaluate_condition(resolved_args)
+
+def r___if__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The if statement could not be saved during runtime: the given arguments were too few.")
+    
+    cond_args, body = args
+    
+    if resolve_condition(interpreter, runtime, cond_args):
         interpreter.execute_instructions(body, runtime=runtime)
 
 def p_while(parser: Parser, instructions: InstructionList, i: int) -> int:
@@ -46,7 +50,7 @@ def p_while(parser: Parser, instructions: InstructionList, i: int) -> int:
     if not depth < 0:
         raise ResolutionError("Could not locate where 'while' body ends.")
     
-    instructions[start] = Instruction("__while__", [inst.args, parser.transform(body)], start)
+    instructions[start] = Instruction("__while__", (inst.args, tuple(parser.transform(body))), inst.line)
 
     del instructions[start+1:end+1]
 
@@ -57,19 +61,8 @@ def r___while__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList)
         raise ResolutionError("The while statement could not be saved during runtime: the given arguments were too few.")
     
     cond_args, body = args
-
-    def evaluate_comparison():
-        resolved_args = []
-        for arg in cond_args:
-            value = interpreter.translate(runtime, arg).as_value
-            if isinstance(value, str):
-                resolved_args.append(interpreter.accent.extract_str(value))
-            else:
-                resolved_args.append(value)
-        
-        return evaluate_condition(resolved_args)
     
-    while evaluate_comparison():
+    while resolve_condition(interpreter, runtime, cond_args):
         interpreter.execute_instructions(body, runtime=runtime)
 
         if runtime.stopped or interpreter.stopped:
@@ -83,7 +76,7 @@ def p_try(parser: Parser, instructions: InstructionList, i: int) -> int:
     if not depth < 0:
         raise ResolutionError("Could not locate where 'try' body ends.")
     
-    instructions[start] = Instruction("__try__", [inst.args, parser.transform(body)], start)
+    instructions[start] = Instruction("__try__", (inst.args, tuple(parser.transform(body))), inst.line)
 
     del instructions[start+1:end+1]
 
@@ -101,35 +94,10 @@ def r___try__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) ->
     
     try:
         interpreter.execute_instructions(body, runtime=runtime)
+    except ResourceExhausted:
+        raise
     except Exception as e:
-        fn_args = func.args
-        values = [e]
-        
-        if fn_args and fn_args[-1].startswith("*"):
-            variadic_name = fn_args[-1][1:]
-            fixed_count = len(fn_args) - 1
-
-            if len(values) < fixed_count:
-                raise ResolutionError("Not enough arguments supplied.")
-            
-            fixed_values = values[:fixed_count]
-            rest_values = values[fixed_count:]
-
-            vm_list = py_to_vm(rest_values, runtime)
-
-            values = fixed_values + [Explicit(variadic_name, vm_list)]
-            fn_args = fn_args[:-1] + [variadic_name]
-        
-        if len(values) < len(fn_args):
-            raise ResolutionError("All arguments must be supplied.")
-
-        instructions = [
-            Instruction("set", [name, "obj", Explicit(name, value.as_value if isinstance(value, Argument) else value)], func.instructions[0].line)
-            for name, value in zip(fn_args, values)
-        ]
-
-        instructions.extend(func.instructions)
-        interpreter.execute_instructions(instructions, func.owner, func.file)
+        interpreter.execute_instructions(func.instructions, runtime=bind_runtime(func, [e], runtime))
 
 def r_raise(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     if len(args) < 1:
@@ -138,8 +106,8 @@ def r_raise(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> N
     raise args[0].as_value
 
 comparison_syntax: SyntaxDict = SyntaxDict(
-    Syntax("if", True, p_if, r___if__),
-    Syntax("while", True, p_while, r___while__),
-    Syntax("try", True, p_try, r___try__),
-    Syntax("raise", False, runtime_resolver=r_raise)
+    Syntax("if", True, p_if, r___if__, 2),
+    Syntax("while", True, p_while, r___while__, 2),
+    Syntax("try", True, p_try, r___try__, 2),
+    Syntax("raise", False, runtime_resolver=r_raise, arity=1)
 )
\ No newline at end of file
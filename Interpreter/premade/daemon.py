@@ -0,0 +1,389 @@
+"""
+A long-running server keeping a warm interpreter, its imported modules and parsed programs resident, and running
+programs sent to it over a Unix domain socket, several at once. 'client.py' talks to it.
+
+Run it with 'python -m Interpreter.premade.daemon', and programs on it with 'python -m Interpreter.premade.client run file.txt'.
+"""
+
+from typing import Dict, Tuple, Sequence, Optional, Callable, Any
+from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from threading import Lock, Semaphore, Thread
+import socketserver
+import argparse
+import socket
+import stat
+import time
+import sys
+import os
+
+from Interpreter.core import CapturedIO, ExecutionContext, Runtime
+from Interpreter.memory import InstructionList
+from Interpreter.utils import set_memory
+
+from .standard import create_standard_interpreter
+from .governor import ResourceLimits, Governor
+from .ffi import py_to_vm, export_memory
+from .client import ProtocolError, default_socket_path, read_frame, write_frame
+
+def file_version(path: str) -> Optional[Tuple[int, int]]:
+    """The modification time and size of a file, or None when it is gone."""
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_mtime_ns, info.st_size
+
+class ProgramCache:
+    """
+    Parsed programs, by their source or by their path. Files are parsed again when their size or modification time
+    changes, and the least recently used programs are dropped past 'size'.
+    """
+
+    __slots__ = ("size", "hits", "misses", "_programs", "_lock")
+
+    def __init__(self, size: int = 256) -> None:
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._programs: OrderedDict[Tuple[Any, ...], InstructionList] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Tuple[Any, ...], parse: Callable[[], InstructionList]) -> Tuple[InstructionList, bool]:
+        """The program of the key, parsed when it is not cached, and whether it was."""
+        with self._lock:
+            program = self._programs.get(key)
+            if program is not None:
+                self._programs.move_to_end(key)
+                self.hits += 1
+                return program, True
+            self.misses += 1
+
+        # Parsing happens outside the lock, so one large program does not hold up the others.
+        program = parse()
+
+        with self._lock:
+            self._programs[key] = program
+            self._programs.move_to_end(key)
+            while len(self._programs) > self.size:
+                self._programs.popitem(last=False)
+
+        return program, False
+
+    def __len__(self) -> int:
+        return len(self._programs)
+
+@dataclass(slots=True)
+class RunRequest:
+    """A program to run, given either as source code or as a path, with its input, variables and limits."""
+
+    source: Optional[str] = None
+    path: Optional[str] = None
+    input: str = ""
+    variables: Optional[Dict[str, Any]] = None
+    limits: Optional[Dict[str, Any]] = None
+
+@dataclass(slots=True)
+class RunResponse:
+    ok: bool
+    output: str = ""
+    exports: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    timing: Optional[Dict[str, float]] = None
+    usage: Optional[Dict[str, Any]] = None
+    cached: bool = False
+
+@dataclass(slots=True)
+class ServerStats:
+    runs: int = 0
+    failures: int = 0
+    running: int = 0
+    busy_time: float = 0.0
+
+class InterpreterService:
+    """
+    Runs requests on one warm interpreter. Its modules are interpreted once, like in the workers of 'pool.py', and again
+    after any imported file changes size or modification time. Every run has its own execution context, streams and
+    limits. Runs import views of the modules kept by their context, so names one run binds in a module are not seen by
+    the others, even on several threads at once. Objects the modules hold, such as lists, are still shared.
+    """
+
+    __slots__ = ("interpreter", "imports", "programs", "limits", "stats", "started", "_slots", "_lock", "_modules", "_modules_lock")
+
+    def __init__(
+        self,
+        modules: Sequence[str] = ("standard/.txt",),
+        workers: int = 8,
+        cache_size: int = 256,
+        limits: Optional[ResourceLimits] = None
+    ) -> None:
+        self.interpreter = create_standard_interpreter()
+        self.imports = tuple(modules)
+
+        # The modification time and size of every imported file when it was last checked, None before the first check.
+        self._modules: Optional[Dict[str, Optional[Tuple[int, int]]]] = None
+        self._modules_lock = Lock()
+        self.refresh_modules()
+
+        self.programs = ProgramCache(cache_size)
+        self.limits = limits
+        self.stats = ServerStats()
+        self.started = time.monotonic()
+
+        self._slots = Semaphore(workers)
+        self._lock = Lock()
+
+    def refresh_modules(self) -> None:
+        """
+        Import the modules again when a file imported so far changed. Every module is dropped, as modules hold the
+        bindings of the ones they import. Runs already going keep the modules they imported.
+        """
+        interpreter = self.interpreter
+
+        with self._modules_lock:
+            known = self._modules
+            current = {file: file_version(file) for file in list(interpreter.modules)}
+
+            if known is None or any(known.get(file, version) != version for file, version in current.items()):
+                interpreter.modules.clear()
+                for module in self.imports:
+                    interpreter.import_file(module)
+                current = {file: file_version(file) for file in list(interpreter.modules)}
+
+            self._modules = current
+
+    def load(self, request: RunRequest) -> Tuple[InstructionList, str, bool]:
+        parser = self.interpreter.parser
+
+        if request.path is not None:
+            path = os.path.abspath(request.path)
+            info = os.stat(path)
+
+            def parse() -> InstructionList:
+                with open(path, "r", encoding="utf-8") as f:
+                    return parser.parse(f.read())
+
+            program, cached = self.programs.get(("path", path, info.st_mtime_ns, info.st_size), parse)
+            return program, path, cached
+
+        source = request.source or ""
+        program, cached = self.programs.get(("source", source), lambda: parser.parse(source))
+        return program, "<daemon>", cached
+
+    def request_limits(self, request: RunRequest) -> Optional[ResourceLimits]:
+        """The limits of the server, with those of the request in place of them."""
+        if self.limits is None and not request.limits:
+            return None
+
+        limits = asdict(self.limits) if self.limits is not None else {}
+        limits.update(request.limits or {})
+        return ResourceLimits(**limits)
+
+    def execute(self, program: InstructionList, file: str, request: RunRequest, context: ExecutionContext) -> Runtime:
+        interpreter = self.interpreter
+        runtime = Runtime(parent=None, file=file)
+
+        # Strings are plain values in programs, so only containers are wrapped.
+        for name, value in (request.variables or {}).items():
+            set_memory(runtime, name, value if isinstance(value, str) else py_to_vm(value, runtime))
+
+        with interpreter.execution(context):
+            # Files are marked as interpreted like with 'interpret', so they cannot import themselves.
+            context.files.append(file)
+            return interpreter.execute_instructions(program, runtime=runtime)
+
+    def run(self, request: RunRequest) -> RunResponse:
+        started = time.perf_counter()
+
+        with self._slots:
+            with self._lock:
+                self.stats.running += 1
+            try:
+                response = self._run(request, started)
+            finally:
+                with self._lock:
+                    stats = self.stats
+                    stats.running -= 1
+                    stats.runs += 1
+                    stats.busy_time += time.perf_counter() - started
+
+        if not response.ok:
+            with self._lock:
+                self.stats.failures += 1
+        return response
+
+    def _run(self, request: RunRequest, started: float) -> RunResponse:
+        try:
+            self.refresh_modules()
+            program, file, cached = self.load(request)
+            limits = self.request_limits(request)
+        except Exception as e:
+            return RunResponse(False, error=f"{type(e).__qualname__}: {e}")
+
+        parsed = time.perf_counter()
+
+        governor = Governor(limits) if limits is not None else None
+        captured = CapturedIO(request.input or "")
+        context = ExecutionContext(monitor=governor, io=captured)
+
+        exports = None
+        error = None
+        try:
+            runtime = self.execute(program, file, request, context)
+            exports = export_memory(runtime)
+        except Exception as e:
+            error = f"{type(e).__qualname__}: {e}"
+        finally:
+            if governor is not None:
+                governor.finish()
+
+        finished = time.perf_counter()
+
+        return RunResponse(
+            error is None,
+            captured.getvalue().decode(captured.encoding),
+            exports,
+            error,
+            {"parse": parsed - started, "execute": finished - parsed, "total": finished - started},
+            asdict(governor.usage) if governor is not None else None,
+            cached
+        )
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = asdict(self.stats)
+        return {
+            **stats,
+            "uptime": time.monotonic() - self.started,
+            "programs": len(self.programs),
+            "program_hits": self.programs.hits,
+            "program_misses": self.programs.misses,
+            "modules": len(self.interpreter.modules)
+        }
+
+def is_stale_socket(path: str) -> bool:
+    """Whether the path is a socket no server accepts connections on, as left behind by one that did not exit cleanly."""
+    try:
+        mode = os.stat(path).st_mode
+    except FileNotFoundError:
+        return False
+    
+    if not stat.S_ISSOCK(mode):
+        return False
+    
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            return True
+        except OSError:
+            return False
+    return False
+
+class RequestHandler(socketserver.BaseRequestHandler):
+    """Answer every message of a connection in order, until the client closes it."""
+
+    server: "InterpreterServer"
+
+    def handle(self) -> None:
+        sock: socket.socket = self.request
+
+        while True:
+            try:
+                message = read_frame(sock)
+            except (ProtocolError, ValueError) as e:
+                write_frame(sock, {"ok": False, "error": f"ProtocolError: {e}"})
+                return
+            except OSError:
+                return
+
+            if message is None:
+                return
+
+            try:
+                write_frame(sock, self.server.answer(message))
+            except OSError:
+                return
+
+            if message.get("op") == "shutdown":
+                # The answer is sent first, as the process may exit as soon as the server stops. 'shutdown' waits for
+                # the serving loop, so it cannot be called from the thread of a request.
+                Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+class InterpreterServer(socketserver.ThreadingUnixStreamServer):
+    """A server answering 'run', 'ping', 'stats' and 'shutdown' messages, with a thread for every connection."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, service: InterpreterService) -> None:
+        # A socket left behind by a server that did not exit cleanly would make binding fail. Anything else at the path,
+        # including the socket of a running server, is left alone for binding to fail on.
+        if is_stale_socket(path):
+            os.unlink(path)
+
+        self.path = path
+        self.service = service
+        self.bound = False
+        super().__init__(path, RequestHandler)
+
+    def server_bind(self) -> None:
+        super().server_bind()
+        self.bound = True
+
+    def answer(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op", "run")
+
+        match op:
+            case "run":
+                try:
+                    request = RunRequest(**{key: value for key, value in message.items() if key != "op"})
+                except TypeError as e:
+                    return {"ok": False, "error": f"ProtocolError: {e}"}
+                return asdict(self.service.run(request))
+            case "ping":
+                return {"ok": True}
+            case "stats":
+                return {"ok": True, "stats": self.service.status()}
+            case "shutdown":
+                return {"ok": True}
+
+        return {"ok": False, "error": f"ProtocolError: Unknown operation '{op}'."}
+
+    def server_close(self) -> None:
+        # Also called when binding failed, when the path belongs to someone else.
+        super().server_close()
+        if self.bound and os.path.exists(self.path):
+            os.unlink(self.path)
+
+def serve(
+    path: Optional[str] = None,
+    modules: Sequence[str] = ("standard/.txt",),
+    workers: int = 8,
+    cache_size: int = 256,
+    limits: Optional[ResourceLimits] = None
+) -> None:
+    """Serve on the socket until a client asks the server to shut down."""
+    service = InterpreterService(modules, workers, cache_size, limits)
+    with InterpreterServer(path or default_socket_path(), service) as server:
+        server.serve_forever()
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m Interpreter.premade.daemon", description="Serve EPIS programs until stopped.")
+    parser.add_argument("--socket", default=None, help="path of the Unix domain socket, $EPIS_SOCKET or one in the temporary directory by default")
+    parser.add_argument("--module", action="append", default=None, help="module to import before serving, 'standard/.txt' by default")
+    parser.add_argument("--workers", type=int, default=8, help="programs run at once")
+    parser.add_argument("--cache-size", type=int, default=256, help="parsed programs kept")
+    parser.add_argument("--seconds", type=float, default=None, help="default time limit of every run")
+    parser.add_argument("--instructions", type=int, default=None, help="default instruction limit of every run")
+    args = parser.parse_args(argv)
+
+    limits = None
+    if args.seconds is not None or args.instructions is not None:
+        limits = ResourceLimits(instructions=args.instructions, seconds=args.seconds)
+
+    serve(args.socket, args.module or ["standard/.txt"], args.workers, args.cache_size, limits)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
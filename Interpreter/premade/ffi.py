@@ -1,14 +1,15 @@
-from typing import Dict, Optional, Callable, TypeVar, ParamSpec, Generic, Any
+from typing import Dict, List, Tuple, Set, Iterable, Optional, Callable, TypeVar, ParamSpec, Generic, Final, Any
 from Interpreter.core import Runtime, Interpreter
-from Interpreter.memory import MemoryAddress, Explicit, Argument, Environment, ArgumentList
+from Interpreter.memory import Instruction, MemoryAddress, Explicit, Argument, Environment, ArgumentList, Virtuals
 from Interpreter.exceptions import ResolutionError
-from Interpreter.utils import set_memory
+from Interpreter.utils import Function, set_memory
 
 from Interpreter.syntax import Syntax, SyntaxDict
 
 import importlib
 
 from dataclasses import dataclass
+from functools import partial
 import types
 
 P = ParamSpec("P")
@@ -21,6 +22,110 @@ class PyFunction(Generic[P, T]):
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
         return self.func(*args, **kwargs)
 
+@dataclass(slots=True)
+class NativeMethod:
+    """
+    A method written in python, called with its owner and the arguments following it in 'call'. Like python functions, 
+    it takes destinations by their name, and other arguments by their value.
+    """
+
+    func: Callable[..., None]
+    owner: Environment
+
+    def __call__(self, interpreter: Interpreter, runtime: Runtime, *args: Any) -> None:
+        self.func(interpreter, runtime, self.owner, *args)
+
+def value_of(arg: Any) -> Any:
+    return arg.as_value if isinstance(arg, Argument) else arg
+
+def name_of(arg: Any) -> str:
+    return arg.as_text if isinstance(arg, Argument) else str(arg)
+
+def map_items(environment: Environment) -> Dict[Any, Any]:
+    return environment.memory["items"].value
+
+# Rows are called in batches, so iterating over lazy sources never builds more than one batch of instructions.
+CALL_BATCH: Final = 1024
+
+def call_each(interpreter: Interpreter, runtime: Runtime, func: Any, rows: Iterable[Tuple[Any, ...]]) -> None:
+    """Call the function once for every row of values, as the 'call' statement on the current line would."""
+    target = Argument(as_text="func", as_value=func)
+    line = runtime.line_no
+    batch: List[Instruction] = []
+
+    for row in rows:
+        batch.append(Instruction("call", (target, *(Argument(as_text=f"arg{i}", as_value=value) for i, value in enumerate(row))), line))
+        if len(batch) < CALL_BATCH:
+            continue
+
+        interpreter.execute_instructions(batch, runtime=runtime)
+        batch = []
+        if runtime.stopped or interpreter.stopped:
+            return
+    
+    if batch:
+        interpreter.execute_instructions(batch, runtime=runtime)
+
+def map_get(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any, key: Any) -> None:
+    set_memory(runtime, name_of(dest), map_items(owner)[value_of(key)])
+
+def map_set(interpreter: Interpreter, runtime: Runtime, owner: Environment, key: Any, value: Any) -> None:
+    map_items(owner)[value_of(key)] = value_of(value)
+
+def map_set_default(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any, key: Any, value: Any) -> None:
+    set_memory(runtime, name_of(dest), map_items(owner).setdefault(value_of(key), value_of(value)))
+
+def map_pop(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any, key: Any) -> None:
+    set_memory(runtime, name_of(dest), map_items(owner).pop(value_of(key)))
+
+def map_contains(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any, key: Any) -> None:
+    set_memory(runtime, name_of(dest), value_of(key) in map_items(owner))
+
+def map_len(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any) -> None:
+    set_memory(runtime, name_of(dest), len(map_items(owner)))
+
+def map_clear(interpreter: Interpreter, runtime: Runtime, owner: Environment) -> None:
+    map_items(owner).clear()
+
+def map_copy(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any) -> None:
+    set_memory(runtime, name_of(dest), create_map(map_items(owner).copy(), owner.parent))
+
+def map_iterate_keys(interpreter: Interpreter, runtime: Runtime, owner: Environment, func: Any) -> None:
+    call_each(interpreter, runtime, value_of(func), [(key,) for key in map_items(owner)])
+
+def map_iterate_values(interpreter: Interpreter, runtime: Runtime, owner: Environment, func: Any) -> None:
+    call_each(interpreter, runtime, value_of(func), [(value,) for value in map_items(owner).values()])
+
+def map_iterate_items(interpreter: Interpreter, runtime: Runtime, owner: Environment, func: Any) -> None:
+    call_each(interpreter, runtime, value_of(func), list(map_items(owner).items()))
+
+map_methods: Dict[str, Callable[..., None]] = {
+    "get": map_get,
+    "set": map_set,
+    "set_default": map_set_default,
+    "pop": map_pop,
+    "contains": map_contains,
+    "len": map_len,
+    "clear": map_clear,
+    "copy": map_copy,
+    "iterate_keys": map_iterate_keys,
+    "iterate_values": map_iterate_values,
+    "iterate_items": map_iterate_items
+}
+
+# Every map shares this table, so creating one only stores its items.
+map_virtuals: Virtuals = {name: partial(NativeMethod, func) for name, func in map_methods.items()}
+
+def create_map(items: Dict[Any, Any], parent: Optional[Environment]) -> Environment:
+    """Wrap a python dictionary as a vm map, with the methods of the 'Dict' class of 'standard/iterables.txt'."""
+    env = Environment(parent, True)
+    set_memory(env, "items", items)
+    env.virtuals = map_virtuals
+    return env
+
+def is_map(environment: Environment) -> bool:
+    return environment.virtuals is map_virtuals
+
 def py_to_vm(value: Any, parent: Optional[Environment], seen: Optional[Dict[int, Any]] = None) -> Any:
     if seen is None:
         seen = {}
@@ -56,14 +161,19 @@ def py_to_vm(value: Any, parent: Optional[Environment], seen: Optional[Dict[int,
         set_memory(env, "count", PyFunction(items.count))
         set_memory(env, "index", PyFunction(items.index))
         set_memory(env, "insert", PyFunction(items.insert))
-        set_memory(env, "copy", PyFunction(lambda: py_to_vm(items.copy(), parent, seen)))
+        set_memory(env, "copy", PyFunction(partial(copy_list, items, parent)))
         set_memory(env, "sort", PyFunction(items.sort))
 
-        set_memory(env, "contains", PyFunction(lambda key: items.__contains__(key)))
-        set_memory(env, "len", PyFunction(lambda: items.__len__()))
+        set_memory(env, "contains", PyFunction(items.__contains__))
+        set_memory(env, "len", PyFunction(items.__len__))
 
         return env
     
+    if isinstance(value, dict):
+        env = create_map(value, parent)
+        seen[obj_id] = env
+        return env
+    
     if isinstance(value, str):
         env = Environment(parent, True)
         seen[obj_id] = env
@@ -75,14 +185,15 @@ def py_to_vm(value: Any, parent: Optional[Environment], seen: Optional[Dict[int,
         set_memory(env, "index", PyFunction(string.index))
         set_memory(env, "format", PyFunction(string.format))
 
-        set_memory(env, "contains", PyFunction(lambda key: string.__contains__(key)))
-        set_memory(env, "len", PyFunction(lambda: string.__len__()))
+        set_memory(env, "contains", PyFunction(string.__contains__))
+        set_memory(env, "len", PyFunction(string.__len__))
 
         return env
     
     if isinstance(value, types.ModuleType):
         env = Environment(parent, False)
         seen[obj_id] = env
+        set_memory(env, "__module__", value.__name__)
         for name in dir(value):
             if name.startswith("__"):
                 continue
@@ -133,6 +244,71 @@ def py_to_vm(value: Any, parent: Optional[Environment], seen: Optional[Dict[int,
     
     return env
 
+def is_exportable(value: Any) -> bool:
+    """Whether a vm value is data, rather than a function, class or runtime."""
+    if isinstance(value, (Function, PyFunction)):
+        return False
+    if isinstance(value, Environment):
+        return value.is_obj and not isinstance(value, Runtime)
+    return True
+
+def vm_to_py(value: Any, seen: Optional[Set[int]] = None) -> Any:
+    """Convert a vm value back to plain python data, the inverse of 'py_to_vm' for lists, strings and objects."""
+    if not isinstance(value, Environment):
+        return value if is_exportable(value) else None
+    
+    if not is_exportable(value):
+        return None
+    
+    if seen is None:
+        seen = set()
+    
+    if id(value) in seen:
+        return None
+    seen.add(id(value))
+
+    memory = value.memory
+
+    if is_map(value):
+        return {vm_to_py(key, seen): vm_to_py(item, seen) for key, item in map_items(value).items()}
+
+    items = memory.get("items")
+    if items is not None and isinstance(items.value, list) and "append" in memory:
+        return [vm_to_py(item, seen) for item in items.value]
+    
+    string = memory.get("string")
+    if string is not None and isinstance(string.value, str) and "format" in memory:
+        return string.value
+    
+    return export_memory(value, seen)
+
+def export_memory(environment: Environment, seen: Optional[Set[int]] = None) -> Dict[str, Any]:
+    """Export the data in an environment's memory as a dictionary of plain python values."""
+    if seen is None:
+        seen = {id(environment)}
+    
+    return {
+        name: vm_to_py(address.value, seen) for name, address in environment.memory.items()
+        if not name.startswith("__") and is_exportable(address.value)
+    }
+
+def copy_list(items: list, parent: Optional[Environment]) -> Environment:
+    return py_to_vm(items.copy(), parent)
+
+def pyimport_environment(module_name: str, parent: Optional[Environment]) -> Environment:
+    """Import a python module and wrap its public attributes in an environment."""
+    module = importlib.import_module(module_name)
+    module_env = Environment(parent, False)
+    set_memory(module_env, "__module__", module.__name__)
+
+    for attr_name in dir(module):
+        if attr_name.startswith("__"):
+            continue
+        attr_value = getattr(module, attr_name)
+        set_memory(module_env, attr_name, py_to_vm(attr_value, module_env))
+    
+    return module_env
+
 def r_pytovm(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     if len(args) < 2:
         raise ResolutionError("The 'pytovm' runtime resolver requires a name to save the vm and a python object.")
@@ -149,16 +325,7 @@ def r_pyimport(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -
     name = args[0].as_text
     module_name = args[1].as_value
 
-    module = importlib.import_module(module_name)
-    module_env = Environment(runtime, False)
-
-    for attr_name in dir(module):
-        if attr_name.startswith("__"):
-            continue
-        attr_value = getattr(module, attr_name)
-        set_memory(module_env, attr_name, py_to_vm(attr_value, module_env))
-    
-    set_memory(runtime, name, module_env)
+    set_memory(runtime, name, pyimport_environment(module_name, runtime))
 
 def r_id(intepreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     if len(args) < 2:
@@ -170,7 +337,7 @@ def r_id(intepreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     set_memory(runtime, name, value)
 
 ffi_syntax: SyntaxDict = SyntaxDict(
-    Syntax("pytovm", runtime_resolver=r_pytovm),
-    Syntax("pyimport", runtime_resolver=r_pyimport),
-    Syntax("id", runtime_resolver=r_id)
+    Syntax("pytovm", runtime_resolver=r_pytovm, arity=2),
+    Syntax("pyimport", runtime_resolver=r_pyimport, arity=2),
+    Syntax("id", runtime_resolver=r_id, arity=2)
 )
\ No newline at end of file
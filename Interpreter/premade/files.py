@@ -0,0 +1,168 @@
+"""Reading files from programs as lazy streams of lines and chunks, memory-mapped or buffered, without loading them whole."""
+
+from typing import Dict, Iterator, Optional, Callable, Final, Any
+from functools import partial
+import codecs
+import mmap
+import os
+
+from Interpreter.core import Runtime, Interpreter
+from Interpreter.memory import Environment, ArgumentList, Virtuals
+from Interpreter.exceptions import ResolutionError
+from Interpreter.utils import set_memory
+
+from Interpreter.syntax import Syntax, SyntaxDict
+
+from .ffi import NativeMethod, value_of, name_of, call_each
+
+BUFFER_SIZE: Final = 1 << 20
+
+# Files from this size are memory-mapped when no mode is given, smaller ones are cheaper to read buffered.
+MAP_THRESHOLD: Final = 1 << 24
+
+class FileReader:
+    """
+    A file read as text, by lines or by chunks of bytes, through a memory map or a buffered binary stream. Only what is
+    read is decoded, and lines are plain strings without their line ending. Iterating over every line or chunk closes it.
+    """
+
+    __slots__ = ("path", "mode", "encoding", "errors", "size", "_file", "_map", "_source", "_decoder", "_pending")
+
+    def __init__(self, path: str, mode: str = "auto", encoding: str = "utf-8", errors: str = "replace") -> None:
+        if mode not in ("auto", "map", "buffered"):
+            raise ResolutionError(f"Files are opened as 'auto', 'map' or 'buffered', not '{mode}'.")
+
+        self.path = os.path.abspath(path)
+        self.encoding = encoding
+        self.errors = errors
+
+        self._file = open(self.path, "rb", buffering=BUFFER_SIZE)
+        self.size = os.fstat(self._file.fileno()).st_size
+
+        if mode == "auto":
+            mode = "map" if self.size >= MAP_THRESHOLD else "buffered"
+
+        # Empty files cannot be mapped, and have nothing to read either way.
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if mode == "map" and self.size else None
+        self._source: Any = self._map if self._map is not None else self._file
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors)
+        self.mode = mode
+
+        # Whether a chunk ended in the middle of a character, whose other bytes start what is read next.
+        self._pending = False
+
+    def __enter__(self) -> "FileReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def decode_line(self, data: bytes) -> str:
+        if self._pending:
+            line = self._decoder.decode(data, not data.endswith(b"\n"))
+            self._pending = False
+        else:
+            line = data.decode(self.encoding, self.errors)
+        if line.endswith("\n"):
+            line = line[:-1]
+            if line.endswith("\r"):
+                line = line[:-1]
+        return line
+
+    def check_open(self) -> None:
+        if self.closed:
+            raise ResolutionError(f"The file '{self.path}' is closed.")
+
+    def read_line(self) -> Optional[str]:
+        """The next line, or None at the end of the file."""
+        self.check_open()
+        data = self._source.readline()
+        return self.decode_line(data) if data or self._pending else None
+
+    def read_chunk(self, size: int) -> Optional[str]:
+        """The text of at most the next 'size' bytes, or None at the end of the file."""
+        self.check_open()
+        data = self._source.read(size)
+        text = self._decoder.decode(data, not data)
+        self._pending = bool(self._decoder.getstate()[0])
+        if not data and not text:
+            return None
+        return text
+
+    def lines(self) -> Iterator[str]:
+        self.check_open()
+        decode = self.decode_line
+        for data in iter(self._source.readline, b""):
+            yield decode(data)
+
+        if self._pending:
+            yield decode(b"")
+        self.close()
+
+    def chunks(self, size: int) -> Iterator[str]:
+        while (chunk := self.read_chunk(size)) is not None:
+            yield chunk
+        self.close()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+def file_reader(environment: Environment) -> FileReader:
+    return environment.memory["reader"].value
+
+def file_read_line(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any) -> None:
+    set_memory(runtime, name_of(dest), file_reader(owner).read_line())
+
+def file_read_chunk(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any, size: Any) -> None:
+    set_memory(runtime, name_of(dest), file_reader(owner).read_chunk(int(value_of(size))))
+
+def file_iterate_lines(interpreter: Interpreter, runtime: Runtime, owner: Environment, func: Any) -> None:
+    call_each(interpreter, runtime, value_of(func), ((line,) for line in file_reader(owner).lines()))
+
+def file_iterate_chunks(interpreter: Interpreter, runtime: Runtime, owner: Environment, func: Any, size: Any) -> None:
+    call_each(interpreter, runtime, value_of(func), ((chunk,) for chunk in file_reader(owner).chunks(int(value_of(size)))))
+
+def file_size(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any) -> None:
+    set_memory(runtime, name_of(dest), file_reader(owner).size)
+
+def file_close(interpreter: Interpreter, runtime: Runtime, owner: Environment) -> None:
+    file_reader(owner).close()
+
+file_methods: Dict[str, Callable[..., None]] = {
+    "read_line": file_read_line,
+    "read_chunk": file_read_chunk,
+    "iterate_lines": file_iterate_lines,
+    "iterate_chunks": file_iterate_chunks,
+    "size": file_size,
+    "close": file_close
+}
+
+file_virtuals: Virtuals = {name: partial(NativeMethod, func) for name, func in file_methods.items()}
+
+def create_file(reader: FileReader, parent: Optional[Environment]) -> Environment:
+    env = Environment(parent, True)
+    set_memory(env, "reader", reader)
+    set_memory(env, "path", reader.path)
+    env.virtuals = file_virtuals
+    return env
+
+def r_open(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The 'open' runtime resolver requires a name to save the file to and a path, optionally followed by a mode and an encoding.")
+
+    name = args[0].as_text
+    path = args[1].as_value
+    mode = args[2].as_value if len(args) > 2 else "auto"
+    encoding = args[3].as_value if len(args) > 3 else "utf-8"
+
+    set_memory(runtime, name, create_file(FileReader(str(path), str(mode), str(encoding)), runtime))
+
+files_syntax: SyntaxDict = SyntaxDict(
+    Syntax("open", runtime_resolver=r_open, arity=2)
+)
@@ -0,0 +1,298 @@
+"""Generator functions, whose frames suspend at every 'yield' with a value, and the 'for' loop consuming them lazily."""
+
+from typing import Dict, Iterator, Optional, Callable, Any
+from functools import partial
+
+from Interpreter.core import Parser, Runtime, Interpreter
+from Interpreter.memory import Instruction, Environment, ArgumentList, InstructionList, Virtuals
+from Interpreter.exceptions import UnknownToken, ResolutionError, ResourceExhausted
+from Interpreter.utils import Function, create_body, set_memory
+
+from Interpreter.syntax import Syntax, SyntaxDict
+
+from .ffi import NativeMethod, value_of, name_of, map_items, is_map
+from .files import file_reader, file_virtuals
+from .objects import bind_runtime, prepare_call, r_call as call_function
+from .comparison import resolve_condition
+
+Steps = Iterator[Any]
+
+def frame_steps(interpreter: Interpreter, instructions: InstructionList, runtime: Runtime) -> Steps:
+    """
+    Execute the instructions like the interpreter loop does, but as a python generator yielding every value of a
+    '__yield__'. Blocks run their bodies as steps too, so a frame suspends in the middle of loops.
+    """
+    resolvers = interpreter.dispatch.resolvers
+    dispatch_size = len(resolvers)
+    context = interpreter.context
+
+    i = 0
+    count = len(instructions)
+    while i < count:
+        if runtime.stopped or context.stopped:
+            break
+
+        inst = instructions[i]
+        runtime.line_no = inst.line
+
+        block = block_steps.get(inst.token)
+        if block is not None:
+            try:
+                yield from block(interpreter, runtime, inst.args)
+            except Exception as e:
+                raise interpreter.annotate_error(runtime, inst, e)
+            
+            # The frame may have been resumed from another execution.
+            context = interpreter.context
+
+        else:
+            resolver = resolvers[inst.opcode] if inst.opcode < dispatch_size else None
+            if resolver is None:
+                raise UnknownToken(
+                    f"File '{runtime.file}', line {inst.line}: Unknown token '{inst.token}'"
+                )
+
+            # Only whole instructions are monitored, as a suspended one would interleave with those of the consumer.
+            monitor = context.monitor
+            if monitor is not None:
+                monitor.before(runtime, inst)
+
+            resolved_args = [interpreter.translate(runtime, arg) for arg in inst.args]
+
+            try:
+                resolver(interpreter, runtime, resolved_args)
+            except Exception as e:
+                raise interpreter.annotate_error(runtime, inst, e)
+            finally:
+                if monitor is not None:
+                    monitor.after(runtime, inst)
+
+        i += runtime.jump
+        runtime.jump = 1
+
+def body_steps(interpreter: Interpreter, body: InstructionList, runtime: Runtime) -> Steps:
+    """
+    The steps of the body of a block. Like the block resolvers running it with 'execute_instructions', the runtime is
+    pushed again while the body runs, so 'return' in it writes where it would outside of a generator. It is only taken
+    off while the frame is suspended.
+    """
+    steps = frame_steps(interpreter, body, runtime)
+    try:
+        while True:
+            # The frame may be resumed from another execution, with a stack of its own.
+            runtimes = interpreter.runtimes
+            runtimes.append(runtime)
+            try:
+                value = next(steps)
+            except StopIteration:
+                return
+            finally:
+                runtimes.pop()
+            
+            yield value
+    finally:
+        steps.close()
+
+def yield_steps(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Steps:
+    yield interpreter.translate(runtime, args[0]).as_value
+
+def pause_steps(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Steps:
+    """
+    A 'yield' without a value, which yields to the scheduler outside of generators. A frame runs in the steps of its
+    consumer, which is preempted instead, so the frame goes on.
+    """
+    return iter(())
+
+def if_steps(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Steps:
+    cond_args, body = args
+
+    if resolve_condition(interpreter, runtime, cond_args):
+        yield from body_steps(interpreter, body, runtime)
+
+def while_steps(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Steps:
+    cond_args, body = args
+
+    while resolve_condition(interpreter, runtime, cond_args):
+        yield from body_steps(interpreter, body, runtime)
+
+        if runtime.stopped or interpreter.stopped:
+            break
+
+def try_steps(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Steps:
+    try_args, body = args
+    func = interpreter.translate(runtime, try_args[0]).as_value
+
+    if not isinstance(func, Function):
+        raise ResolutionError("The function to handle whether the try block failed wasn't of the right type.")
+
+    try:
+        yield from body_steps(interpreter, body, runtime)
+    except ResourceExhausted:
+        raise
+    except Exception as e:
+        interpreter.execute_instructions(func.instructions, runtime=bind_runtime(func, [e], runtime))
+
+def for_steps(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Steps:
+    (name, source), body = args
+
+    for value in iterate(interpreter.translate(runtime, source).as_value):
+        set_memory(runtime, name, value)
+        yield from body_steps(interpreter, body, runtime)
+
+        if runtime.stopped or interpreter.stopped:
+            break
+
+block_steps: Dict[str, Callable[[Interpreter, Runtime, ArgumentList], Steps]] = {
+    "__yield__": yield_steps,
+    "yield": pause_steps,
+    "__if__": if_steps,
+    "__while__": while_steps,
+    "__try__": try_steps,
+    "__for__": for_steps
+}
+
+class Generator:
+    """
+    The suspended frame of a call to a generator function. Every step resumes the frame until it yields its next value,
+    with its runtime on the stack of whoever resumed it, so functions it calls return to it.
+    """
+
+    __slots__ = ("interpreter", "runtime", "done", "_steps")
+
+    def __init__(self, interpreter: Interpreter, func: Function, runtime: Runtime) -> None:
+        self.interpreter = interpreter
+        self.runtime = runtime
+        self.done = False
+        self._steps = frame_steps(interpreter, func.instructions, runtime)
+
+        if interpreter.environment_loader:
+            interpreter.environment_loader(runtime)
+
+    def __iter__(self) -> "Generator":
+        return self
+
+    def __next__(self) -> Any:
+        if self.done:
+            raise StopIteration
+
+        runtimes = self.interpreter.runtimes
+        runtimes.append(self.runtime)
+        try:
+            return next(self._steps)
+        except Exception:
+            # Frames that returned or raised are finished, like python generators.
+            self.done = True
+            raise
+        finally:
+            runtimes.pop()
+            if not runtimes:
+                self.interpreter.streams.flush()
+
+    def close(self) -> None:
+        self.done = True
+        self._steps.close()
+
+def generator_frame(environment: Environment) -> Generator:
+    return environment.memory["frame"].value
+
+def generator_next(interpreter: Interpreter, runtime: Runtime, owner: Environment, dest: Any, default: Any = None) -> None:
+    set_memory(runtime, name_of(dest), next(generator_frame(owner), value_of(default)))
+
+def generator_close(interpreter: Interpreter, runtime: Runtime, owner: Environment) -> None:
+    generator_frame(owner).close()
+
+generator_methods: Dict[str, Callable[..., None]] = {
+    "next": generator_next,
+    "close": generator_close
+}
+
+generator_virtuals: Virtuals = {
+    **{name: partial(NativeMethod, func) for name, func in generator_methods.items()},
+    "done": lambda environment: generator_frame(environment).done
+}
+
+def create_generator(frame: Generator, parent: Optional[Environment]) -> Environment:
+    env = Environment(parent, True)
+    set_memory(env, "frame", frame)
+    env.virtuals = generator_virtuals
+    return env
+
+def is_generator(environment: Environment) -> bool:
+    return environment.virtuals is generator_virtuals
+
+def iterate(value: Any) -> Iterator[Any]:
+    """Iterate lazily over a generator, a file by its lines, the keys of a map, the items of a list or a python iterable."""
+    if isinstance(value, Environment):
+        if is_generator(value):
+            return generator_frame(value)
+        if value.virtuals is file_virtuals:
+            return file_reader(value).lines()
+        if is_map(value):
+            return iter(map_items(value))
+
+        items = value.memory.get("items")
+        if items is not None and isinstance(items.value, list):
+            return iter(items.value)
+
+        raise ResolutionError("Only generators, files, maps and lists can be iterated over.")
+
+    try:
+        return iter(value)
+    except TypeError:
+        raise ResolutionError(f"Values of type '{type(value).__name__}' can not be iterated over.") from None
+
+def start_generator(interpreter: Interpreter, runtime: Runtime, func: Function, args: ArgumentList) -> None:
+    """Create the generator of a call to a generator function, saved to the destination following it like python calls."""
+    if len(args) < 2:
+        raise ResolutionError("Calling a generator function requires a destination for the generator. Optionally parse arguments following.")
+
+    callee = prepare_call(runtime, func, args[1:])
+    set_memory(runtime, args[1].as_text, create_generator(Generator(interpreter, func, callee), runtime))
+
+def r_call(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    func = args[0].as_value if args else None
+
+    if isinstance(func, Function) and func.generator:
+        start_generator(interpreter, runtime, func, args)
+        return
+
+    call_function(interpreter, runtime, args)
+
+def r___yield__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    raise ResolutionError("Values can only be yielded from generator functions, which must be called with 'call'.")
+
+def p_for(parser: Parser, instructions: InstructionList, i: int) -> int:
+    inst = instructions[i]
+
+    if len(inst.args) != 2:
+        raise ResolutionError("The for statement requires a name for every value and what to iterate over.")
+
+    (start, end), body, depth = create_body(instructions, i, "for", "end", ["for"])
+
+    if not depth < 0:
+        raise ResolutionError("Could not locate where 'for' body ends.")
+
+    instructions[start] = Instruction("__for__", (inst.args, tuple(parser.transform(body))), inst.line)
+
+    del instructions[start+1:end+1]
+
+    return start
+
+def r___for__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The for statement could not be saved during runtime: the given arguments were too few.")
+
+    (name, source), body = args
+
+    for value in iterate(interpreter.translate(runtime, source).as_value):
+        set_memory(runtime, name, value)
+        interpreter.execute_instructions(body, runtime=runtime)
+
+        if runtime.stopped or interpreter.stopped:
+            break
+
+generator_syntax: SyntaxDict = SyntaxDict(
+    Syntax("call", runtime_resolver=r_call, arity=1),
+    Syntax("__yield__", runtime_resolver=r___yield__, arity=1),
+    Syntax("for", True, p_for, r___for__, 2)
+)
@@ -0,0 +1,143 @@
+"""Resource limits for executions: instructions, wall-clock time, frame depth and allocated memory."""
+
+from typing import Iterator, Optional, Any
+from dataclasses import dataclass
+from contextlib import contextmanager
+from threading import Lock
+import tracemalloc
+import time
+
+from Interpreter.core import Monitor, ExecutionContext, Runtime, Interpreter
+from Interpreter.memory import Instruction
+from Interpreter.exceptions import ResourceExhausted
+
+@dataclass(slots=True)
+class ResourceLimits:
+    """The most an execution may use. Limits left as None are not checked."""
+
+    instructions: Optional[int] = None
+    seconds: Optional[float] = None
+    frames: Optional[int] = None
+
+    # tracemalloc traces the whole process, so the bytes are those allocated by every thread while the execution runs,
+    # including other governed executions, not only by this execution.
+    memory: Optional[int] = None
+
+    # Time and memory are only measured every 'check_interval' instructions, as they are more costly to read.
+    check_interval: int = 256
+
+@dataclass(slots=True)
+class ResourceUsage:
+    instructions: int = 0
+    seconds: float = 0.0
+    frames: int = 0
+    memory: int = 0
+
+# Governors counting memory at once, and whether tracing was started by them, so it is only stopped by the last one.
+_tracing_lock = Lock()
+_tracing_users = 0
+_tracing_started = False
+
+def acquire_tracing() -> None:
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing_started = True
+        _tracing_users += 1
+
+def release_tracing() -> None:
+    global _tracing_users, _tracing_started
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _tracing_started:
+            tracemalloc.stop()
+            _tracing_started = False
+
+class Governor(Monitor):
+    """Monitor that raises ResourceExhausted, with the usage so far, as soon as an execution goes over a limit."""
+
+    __slots__ = ("limits", "usage", "started", "deadline", "depth", "countdown", "memory_base", "tracing")
+
+    def __init__(self, limits: ResourceLimits) -> None:
+        self.limits = limits
+        self.usage = ResourceUsage()
+
+        self.started: Optional[float] = None
+        self.deadline: Optional[float] = None
+        self.depth = 0
+        self.countdown = limits.check_interval
+
+        self.memory_base = 0
+        self.tracing = False
+
+    def start(self) -> None:
+        self.started = time.monotonic()
+        if self.limits.seconds is not None:
+            self.deadline = self.started + self.limits.seconds
+
+        if self.limits.memory is not None:
+            acquire_tracing()
+            self.tracing = True
+            self.memory_base = tracemalloc.get_traced_memory()[0]
+
+    def finish(self) -> None:
+        if self.started is not None:
+            self.usage.seconds = time.monotonic() - self.started
+        if self.tracing:
+            release_tracing()
+            self.tracing = False
+
+    def exhausted(self, runtime: Runtime, inst: Optional[Instruction], resource: str, limit: Any) -> ResourceExhausted:
+        if self.started is not None:
+            self.usage.seconds = time.monotonic() - self.started
+
+        where = f"File '{runtime.file}', line {inst.line}" if inst is not None else f"File '{runtime.file}'"
+        return ResourceExhausted(f"{where}: the {resource} limit of {limit} was exceeded", resource, limit, self.usage)
+
+    def enter_frame(self, runtime: Runtime) -> None:
+        if self.started is None:
+            self.start()
+
+        self.depth += 1
+        if self.depth > self.usage.frames:
+            self.usage.frames = self.depth
+
+            if self.limits.frames is not None and self.depth > self.limits.frames:
+                raise self.exhausted(runtime, None, "frames", self.limits.frames)
+
+    def exit_frame(self, runtime: Runtime) -> None:
+        self.depth -= 1
+
+    def before(self, runtime: Runtime, inst: Instruction) -> None:
+        usage = self.usage
+        usage.instructions += 1
+
+        limits = self.limits
+        if limits.instructions is not None and usage.instructions > limits.instructions:
+            raise self.exhausted(runtime, inst, "instructions", limits.instructions)
+
+        self.countdown -= 1
+        if self.countdown > 0:
+            return
+        self.countdown = limits.check_interval
+
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise self.exhausted(runtime, inst, "seconds", limits.seconds)
+
+        if limits.memory is not None:
+            memory = tracemalloc.get_traced_memory()[0] - self.memory_base
+            if memory > usage.memory:
+                usage.memory = memory
+            if memory > limits.memory:
+                raise self.exhausted(runtime, inst, "memory", limits.memory)
+
+@contextmanager
+def governed(interpreter: Interpreter, limits: ResourceLimits) -> Iterator[Governor]:
+    """Run the block in a new execution context with the limits, giving the governor to read the usage from."""
+    governor = Governor(limits)
+    try:
+        with interpreter.execution(ExecutionContext(monitor=governor)):
+            yield governor
+    finally:
+        governor.finish()
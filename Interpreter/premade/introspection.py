@@ -0,0 +1,234 @@
+"""Memory introspection: what the environments reachable from an interpreter hold, and where memory was allocated."""
+
+from typing import Dict, List, Tuple, Set, Iterator, Optional, Any
+from dataclasses import dataclass, field
+from contextlib import contextmanager
+from collections import deque
+import tracemalloc
+import sys
+
+from Interpreter.core import Monitor, ExecutionContext, Runtime, Interpreter
+from Interpreter.memory import Instruction, MemoryAddress, Environment
+from Interpreter.utils import Function
+
+from .ffi import PyFunction
+
+@dataclass(slots=True)
+class MemorySnapshot:
+    """Counts and deep sizes, in bytes, of everything reachable from the roots. Shared values count for the first root."""
+
+    environments: int = 0
+    runtimes: int = 0
+    addresses: int = 0
+    functions: int = 0
+    objects: Dict[str, int] = field(default_factory=dict)
+    roots: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return sum(self.roots.values())
+
+@dataclass(slots=True)
+class MemoryDiff:
+    """How much every count and size grew from one snapshot to another. Negative values shrank."""
+
+    environments: int = 0
+    runtimes: int = 0
+    addresses: int = 0
+    functions: int = 0
+    objects: Dict[str, int] = field(default_factory=dict)
+    roots: Dict[str, int] = field(default_factory=dict)
+
+def class_name(environment: Environment) -> str:
+    cls = environment.memory.get("__class__")
+    if cls is not None and isinstance(cls.value, Environment):
+        name = cls.value.memory.get("__name__")
+        if name is not None:
+            return str(name.value)
+    return "<object>"
+
+def interpreter_roots(interpreter: Interpreter) -> Dict[str, Environment]:
+    """The module cache, and the runtimes being executed in the current context."""
+    roots: Dict[str, Environment] = dict(interpreter.modules)
+    for i, runtime in enumerate(interpreter.runtimes):
+        roots.setdefault(f"<runtime {i}: {runtime.file}>", runtime)
+    return roots
+
+def walk(root: Any, snapshot: MemorySnapshot, seen: Set[int]) -> int:
+    """Visit everything reachable from the root that was not seen yet, counting it, and return its deep size."""
+    size = 0
+    pending = deque([root])
+
+    while pending:
+        value = pending.popleft()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        size += sys.getsizeof(value)
+
+        if isinstance(value, Environment):
+            snapshot.environments += 1
+            if isinstance(value, Runtime):
+                snapshot.runtimes += 1
+            if value.is_obj:
+                name = class_name(value)
+                snapshot.objects[name] = snapshot.objects.get(name, 0) + 1
+
+            if value.parent is not None:
+                pending.append(value.parent)
+
+            memory = value.memory
+            if id(memory) not in seen:
+                seen.add(id(memory))
+                size += sys.getsizeof(memory)
+                pending.extend(memory.values())
+
+        elif isinstance(value, MemoryAddress):
+            snapshot.addresses += 1
+            pending.append(value.value)
+
+        elif isinstance(value, Function):
+            snapshot.functions += 1
+            if value.owner is not None:
+                pending.append(value.owner)
+            pending.extend(value.instructions)
+
+        elif isinstance(value, Instruction):
+            pending.extend(value.args)
+
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            pending.extend(value)
+
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+
+        elif isinstance(value, PyFunction):
+            # Python functions belong to python, so only the wrapper is counted.
+            continue
+
+    return size
+
+def snapshot_memory(interpreter: Interpreter, roots: Optional[Dict[str, Any]] = None) -> MemorySnapshot:
+    """Walk the environments reachable from the roots, the interpreter's modules and current runtimes by default."""
+    snapshot = MemorySnapshot()
+    seen: Set[int] = set()
+
+    for name, root in (roots if roots is not None else interpreter_roots(interpreter)).items():
+        snapshot.roots[name] = walk(root, snapshot, seen)
+
+    return snapshot
+
+def diff_counts(before: Dict[str, int], after: Dict[str, int]) -> Dict[str, int]:
+    return {
+        name: after.get(name, 0) - before.get(name, 0)
+        for name in {*before, *after} if after.get(name, 0) != before.get(name, 0)
+    }
+
+def diff_snapshots(before: MemorySnapshot, after: MemorySnapshot) -> MemoryDiff:
+    return MemoryDiff(
+        after.environments - before.environments,
+        after.runtimes - before.runtimes,
+        after.addresses - before.addresses,
+        after.functions - before.functions,
+        diff_counts(before.objects, after.objects),
+        diff_counts(before.roots, after.roots)
+    )
+
+def format_snapshot(snapshot: MemorySnapshot, limit: int = 20) -> str:
+    out = [
+        f"environments: {snapshot.environments} ({snapshot.runtimes} runtimes)",
+        f"addresses: {snapshot.addresses}",
+        f"functions: {snapshot.functions}",
+        f"size: {snapshot.size / 1024:.1f} KiB",
+        "",
+        "Objects by class:"
+    ]
+    for name, count in sorted(snapshot.objects.items(), key=lambda item: item[1], reverse=True)[:limit]:
+        out.append(f"{count:>10}  {name}")
+
+    out.append("")
+    out.append("Size by root:")
+    for name, size in sorted(snapshot.roots.items(), key=lambda item: item[1], reverse=True)[:limit]:
+        out.append(f"{size / 1024:>10.1f} KiB  {name}")
+
+    return "\n".join(out)
+
+def format_diff(diff: MemoryDiff, limit: int = 20) -> str:
+    out = [
+        f"environments: {diff.environments:+} ({diff.runtimes:+} runtimes)",
+        f"addresses: {diff.addresses:+}",
+        f"functions: {diff.functions:+}",
+        "",
+        "Objects by class:"
+    ]
+    for name, count in sorted(diff.objects.items(), key=lambda item: abs(item[1]), reverse=True)[:limit]:
+        out.append(f"{count:>+10}  {name}")
+
+    out.append("")
+    out.append("Size by root:")
+    for name, size in sorted(diff.roots.items(), key=lambda item: abs(item[1]), reverse=True)[:limit]:
+        out.append(f"{size / 1024:>+10.1f} KiB  {name}")
+
+    return "\n".join(out)
+
+@dataclass(slots=True)
+class LineAllocations:
+    count: int = 0
+    net: int = 0
+    peak: int = 0
+
+class AllocationTracker(Monitor):
+    """
+    Monitor attributing the memory traced by tracemalloc to the EPIS file and line that allocated it. Every instruction
+    is charged with what it allocated minus what it freed, without what the instructions it ran did.
+    """
+
+    __slots__ = ("lines", "_calls")
+
+    def __init__(self) -> None:
+        self.lines: Dict[Tuple[str, int], LineAllocations] = {}
+        self._calls: List[List[int]] = []
+
+    def before(self, runtime: Runtime, inst: Instruction) -> None:
+        self._calls.append([tracemalloc.get_traced_memory()[0], 0])
+
+    def after(self, runtime: Runtime, inst: Instruction) -> None:
+        start, child = self._calls.pop()
+        inclusive = tracemalloc.get_traced_memory()[0] - start
+
+        if self._calls:
+            self._calls[-1][1] += inclusive
+
+        key = (runtime.file, inst.line)
+        line = self.lines.get(key)
+        if line is None:
+            line = self.lines[key] = LineAllocations()
+
+        line.count += 1
+        line.net += inclusive - child
+        if line.net > line.peak:
+            line.peak = line.net
+
+    def top(self, limit: int = 20) -> List[Tuple[Tuple[str, int], LineAllocations]]:
+        return sorted(self.lines.items(), key=lambda item: item[1].net, reverse=True)[:limit]
+
+    def report(self, limit: int = 20) -> str:
+        out = [f"{'net KiB':>12} {'peak KiB':>12} {'count':>10}  line"]
+        for (file, line), allocations in self.top(limit):
+            out.append(f"{allocations.net / 1024:>12.1f} {allocations.peak / 1024:>12.1f} {allocations.count:>10}  {file}:{line}")
+        return "\n".join(out)
+
+@contextmanager
+def tracked(interpreter: Interpreter, tracker: Optional[AllocationTracker] = None) -> Iterator[AllocationTracker]:
+    """Attribute the allocations of everything executed in the block to EPIS lines, in a new execution context."""
+    tracker = tracker or AllocationTracker()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    try:
+        with interpreter.execution(ExecutionContext(monitor=tracker)):
+            yield tracker
+    finally:
+        if started:
+            tracemalloc.stop()
@@ -1,3 +1,6 @@
+from typing import Dict, Tuple, Callable, Final, Any
+import operator
+
 from Interpreter.core import Runtime, Interpreter
 from Interpreter.memory import Environment, ArgumentList
 from Interpreter.exceptions import ResolutionError
@@ -5,6 +8,31 @@ from Interpreter.utils import set_memory, evaluate_math
 
 from Interpreter.syntax import Syntax, SyntaxDict
 
+OPERATIONS: Final[Dict[str, Callable[[Any, Any], Any]]] = {
+    "plus": operator.add,
+    "minus": operator.sub,
+    "times": operator.mul,
+    "power": operator.pow,
+    "modolo": operator.mod,
+    "divide": operator.truediv,
+    "divide_int": operator.floordiv,
+    "difference": lambda left, right: abs(left - right)
+}
+
+def math_operation(ops: Tuple[str, ...]) -> Callable[[Any, Any], Any]:
+    """The operation 'evaluate_math' applies with these operators, for numbers: the last one counts, and 'invert' flips it."""
+    func = OPERATIONS["difference"]
+    inverted = False
+    for op in ops:
+        if op == "invert":
+            inverted = not inverted
+        elif op in OPERATIONS:
+            func = OPERATIONS[op]
+
+    if inverted:
+        return lambda left, right: -func(left, right)
+    return func
+
 def r_math(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     if len(args) < 2:
         raise ResolutionError("The 'math' runtime resolver requires at least a return variable, operation and value to operate on, or a 'if' statement like structure.")
@@ -40,5 +68,5 @@ def r_math(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> No
     set_memory(env, name, result)
 
 math_syntax: SyntaxDict = SyntaxDict(
-    Syntax("math", runtime_resolver=r_math)
+    Syntax("math", runtime_resolver=r_math, arity=2)
 )
\ No newline at end of file
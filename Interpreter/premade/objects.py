@@ -1,19 +1,33 @@
-from typing import Iterable, Type, Final
-from Interpreter.core import Runtime, Parser, Interpreter
-from Interpreter.memory import Instruction, Explicit, Argument, Environment, InstructionList, ArgumentList
+from typing import Iterable, Sequence, Tuple, List, Set, FrozenSet, Type, Optional, Final, Any
+from dataclasses import replace
+from Interpreter.core import Accent, Runtime, Parser, Interpreter
+from Interpreter.memory import Instruction, MemoryAddress, Explicit, Argument, Environment, InstructionList, ArgumentList
 from Interpreter.exceptions import ResolutionError
-from Interpreter.utils import Function, create_body, set_memory, extract_arguments
+from Interpreter.utils import Memo, Function, create_closure, create_body, set_memory, del_memory, extract_arguments
 
 from Interpreter.syntax import Syntax, SyntaxDict
 
-from .ffi import PyFunction, py_to_vm
+from .ffi import PyFunction, NativeMethod, py_to_vm
 
 class Error(ResolutionError):
     """An error raised from the program."""
 
 NOT_FOUND: Final = object()
 
-_import_cache = {}
+# Words read as text by the resolvers, rather than names a nested function could capture.
+OPERATORS: Final = frozenset((
+    "not", "is", "equal", "greater", "lesser",
+    "invert", "plus", "minus", "times", "power", "modolo", "divide", "divide_int", "difference"
+))
+
+# Statements whose first argument is a condition.
+CONDITIONAL: Final = frozenset(("__if__", "__while__"))
+
+# Virtual names resolved through the parent of a runtime, which differs once a function is hoisted.
+SCOPED: Final = frozenset(("this_parent",))
+
+# Calls remembered by a memoized function when no size is given.
+MEMO_SIZE: Final = 128
 
 casters = {
     "error": Error,
@@ -22,6 +36,7 @@ casters = {
     "str": str,
     "bool": bool,
     "list": list,
+    "dict": dict,
     "any": lambda x: x,
 }
 
@@ -32,6 +47,12 @@ def is_container_type(t: Type) -> bool:
         and not issubclass(t, (str, bytes))
     )
 
+def pair_values(values: List[Any]) -> dict:
+    """Pair up alternating keys and values, as given to 'set' for a dict."""
+    if len(values) % 2:
+        raise ResolutionError("A dict must be given pairs of keys and values.")
+    return dict(zip(values[::2], values[1::2]))
+
 def p_class(parser: Parser, instructions: InstructionList, i: int) -> int:
     inst = instructions[i]
 
@@ -46,23 +67,23 @@ def p_class(parser: Parser, instructions: InstructionList, i: int) -> int:
     if not depth < 0:
         raise ResolutionError("Could not locate where class body ends.")
     
-    instructions[start] = Instruction("__class__", [name, inherit, Environment(None), parser.transform(body)], start)
+    instructions[start] = Instruction("__class__", (name, inherit, tuple(parser.transform(body))), inst.line)
 
     del instructions[start+1:end+1]
 
     return start
 
 def r___class__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
-    if len(args) < 4:
+    if len(args) < 3:
         raise ResolutionError("The class could not be saved during runtime: the given arguments were too few.")
     
-    name, inherit, class_env, body = args
+    name, inherit, body = args
     name = name.as_text
 
-    if not isinstance(class_env, Environment):
+    if not isinstance(body, tuple):
         raise ResolutionError(f"The class could not be saved during runtime: the arguments for '{name}' were corrupted.")
     
-    class_env.parent = runtime
+    class_env = Environment(runtime)
 
     interpreter.environment_loader(class_env)
 
@@ -75,7 +96,7 @@ def r___class__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList)
         else:
             inherit_env = inherit_env.as_value
         
-        class_env.memory.update(inherit_env.memory)
+        class_env.memory.update((member, MemoryAddress(member, address.value)) for member, address in inherit_env.memory.items())
         processed_inheritance.append(inherit_env)
     
     set_memory(class_env, "__inheritance__", processed_inheritance)
@@ -86,6 +107,123 @@ def r___class__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList)
 
     set_memory(runtime, name, class_env)
 
+def is_keyword(token: str, args: Sequence[Any], i: int) -> bool:
+    """
+    Whether the argument is read as an operator or a type rather than looked up: an operator between the values of
+    'math' or of a condition, or a type given to 'set' before its values. The same words anywhere else are names.
+    """
+    word = args[i]
+    if not isinstance(word, str) or i == len(args) - 1:
+        return False
+
+    match token:
+        case "set":
+            return 0 < i < 3 and word in casters
+        case "math":
+            return i > 1 and word in OPERATORS
+        case "condition":
+            return (i > 0 or word == "not") and word in OPERATORS
+
+    return False
+
+def referenced_names(accent: Accent, values: Iterable[Any], names: Set[str], token: Optional[str] = None) -> Set[str]:
+    """
+    Collect every name the values could look up or bind, through bodies and nested functions. 'token' is the statement
+    the values are the arguments of, so that its operators and types are left out.
+    """
+    values = tuple(values)
+    for i, value in enumerate(values):
+        if isinstance(value, str):
+            if token is not None and is_keyword(token, values, i):
+                continue
+            spec = accent.compile(value)
+            # Quoted strings still name the destinations functions return to.
+            name = spec.parts[0] if spec.parts else spec.text
+            if name.isidentifier():
+                names.add(name)
+        elif isinstance(value, Instruction):
+            args = value.args
+            if value.token in CONDITIONAL and args and isinstance(args[0], tuple):
+                referenced_names(accent, args[0], names, "condition")
+                args = args[1:]
+            referenced_names(accent, args, names, value.token)
+        elif isinstance(value, Function):
+            referenced_names(accent, value.args, names)
+            referenced_names(accent, value.instructions, names)
+            referenced_names(accent, value.hoisted, names)
+        elif isinstance(value, (tuple, list)):
+            referenced_names(accent, value, names)
+    return names
+
+def hoist(accent: Accent, args: Tuple[str, ...], body: List[Instruction]) -> Tuple[List[Instruction], Tuple[Function, ...]]:
+    """
+    Take the nested definitions out of a function body that capture nothing from its frame: they use no name the function
+    has as an argument or mentions anywhere else. They are bound to every call of the function instead, so definitions
+    whose name the function uses before defining them are left in place.
+    """
+    definitions = [inst for inst in body if inst.token == "__func__"]
+    if not definitions:
+        return body, ()
+    
+    defined = [inst.args[0] for inst in definitions]
+    hoisted = []
+
+    for inst in definitions:
+        name, func = inst.args
+        if not name.isidentifier() or defined.count(name) > 1:
+            continue
+        
+        before = referenced_names(accent, args, set())
+        for other in body:
+            if other is inst:
+                break
+            referenced_names(accent, (other,), before)
+        
+        if name in before:
+            continue
+        
+        free = referenced_names(accent, (func.instructions, func.hoisted), set())
+        free.difference_update(arg.removeprefix("*") for arg in func.args)
+
+        if free & SCOPED:
+            continue
+
+        frame = referenced_names(accent, args, set())
+        for other in body:
+            referenced_names(accent, (name,) if other is inst else (other,), frame)
+        
+        if not free & frame:
+            hoisted.append(inst)
+    
+    if not hoisted:
+        return body, ()
+    
+    return [inst for inst in body if inst not in hoisted], tuple(inst.args[1] for inst in hoisted)
+
+# Statements running their body in the runtime they are in, as their last argument.
+BLOCKS: Final = frozenset(("__if__", "__while__", "__try__", "__for__"))
+
+def mark_yields(body: Sequence[Instruction]) -> Tuple[List[Instruction], bool]:
+    """
+    Turn every 'yield' with a value in the body, and the bodies of its blocks, into '__yield__'. Nested functions yield
+    for themselves, and 'yield' without a value still yields to the scheduler. Returns whether any value is yielded.
+    """
+    marked = []
+    found = False
+
+    for inst in body:
+        if inst.token == "yield" and inst.args:
+            inst = Instruction("__yield__", inst.args, inst.line)
+            found = True
+        elif inst.token in BLOCKS:
+            block, yields = mark_yields(inst.args[-1])
+            if yields:
+                inst = Instruction(inst.token, (*inst.args[:-1], tuple(block)), inst.line)
+                found = True
+        marked.append(inst)
+    
+    return marked, found
+
 def p_func(parser: Parser, instructions: InstructionList, i: int) -> int:
     inst = instructions[i]
 
@@ -101,7 +239,10 @@ def p_func(parser: Parser, instructions: InstructionList, i: int) -> int:
         print(depth, inst, parser.line_no)
         raise ResolutionError("Could not locate where function body ends.")
 
-    instructions[start] = Instruction("__func__", [name, Function(None, None, name, args, parser.transform(body))], start)
+    body, generator = mark_yields(parser.transform(body))
+    body, hoisted = hoist(parser.accent, args, body)
+
+    instructions[start] = Instruction("__func__", (name, Function(None, None, name, args, tuple(body), hoisted, generator)), inst.line)
 
     del instructions[start+1:end+1]
 
@@ -117,23 +258,99 @@ def r___func__(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -
     if not isinstance(func, Function):
         raise ResolutionError("The function could not be saved during runtime: the arguments were corrupted.")
     
-    func.owner = runtime
-    func.file = runtime.file
+    # The parsed function is shared by every run of its definition, so each run creates its own closure.
+    set_memory(runtime, name, create_closure(func, runtime, runtime.file))
+
+def module_view(interpreter: Interpreter, module: Runtime) -> Runtime:
+    """
+    The bindings of an imported module for the current execution: a fork of the module the interpreter keeps, with its 
+    functions and the modules it imported bound to the fork. Values such as classes and lists are still shared.
+    """
+    views = interpreter.context.modules
+    view = views.get(module.file)
+    if view is not None:
+        return view
+    
+    view = views[module.file] = module.fork()
+    for address in view.writable_memory().values():
+        value = address.value
+        if isinstance(value, Function) and value.owner is module:
+            address.value = value.bind(view)
+        elif isinstance(value, Runtime) and value.file in interpreter.modules:
+            address.value = module_view(interpreter, interpreter.modules[value.file])
     
-    set_memory(runtime, name, func)
+    return view
 
 def r_import(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     if len(args) < 1:
         raise ResolutionError("The 'import' runtime resolver requires at least a path and optionally a variable name.")
     
-    import_runtime = _import_cache.setdefault(args[0].as_value, interpreter.interpret(args[0].as_value))
+    import_runtime = module_view(interpreter, interpreter.import_file(args[0].as_value))
 
     if len(args) == 1:
-        runtime.memory.update(import_runtime.memory)
+        # The names are copied, so setting one does not change the module.
+        runtime.writable_memory().update(
+            (name, MemoryAddress(name, address.value)) for name, address in import_runtime.memory.items()
+        )
     else:
         set_memory(runtime, args[1].as_text, import_runtime)
 
-def r_init(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+def bound_values(func: Function, values: List[Any], runtime: Runtime) -> List[Tuple[str, Any]]:
+    """Pair the arguments of a function with the values given to it, gathering variadic values in a list."""
+    fn_args = func.args
+
+    if fn_args and fn_args[-1].startswith("*"):
+        variadic_name = fn_args[-1][1:]
+        fixed_count = len(fn_args) - 1
+
+        if len(values) < fixed_count:
+            raise ResolutionError("Not enough arguments supplied.")
+        
+        fixed_values = values[:fixed_count]
+        rest_values = values[fixed_count:]
+
+        vm_list = py_to_vm(rest_values, runtime)
+
+        values = fixed_values + [Explicit(variadic_name, vm_list)]
+        fn_args = fn_args[:-1] + (variadic_name,)
+    
+    if len(values) < len(fn_args):
+        raise ResolutionError("All arguments must be supplied.")
+
+    return [
+        (name, value.as_value if isinstance(value, (Argument, Explicit)) else value)
+        for name, value in zip(fn_args, values)
+    ]
+
+def bind_arguments(func: Function, values: List[Any], runtime: Runtime) -> List[Instruction]:
+    """Build the instructions that run a function, with the values bound to its arguments and its hoisted functions."""
+    line = func.instructions[0].line if func.instructions else runtime.line_no
+
+    # The names are explicit too, so 'set' does not take a name that is an object outside the function as the object to set.
+    instructions = [
+        Instruction("set", (Explicit(name), "obj", Explicit(name, value)), line)
+        for name, value in bound_values(func, values, runtime)
+    ]
+    instructions.extend(
+        Instruction("set", (Explicit(hoisted.name), "obj", Explicit(hoisted.name, hoisted)), line)
+        for hoisted in func.hoisted
+    )
+
+    instructions.extend(func.instructions)
+
+    return instructions
+
+def bind_runtime(func: Function, values: List[Any], runtime: Runtime) -> Runtime:
+    """Create the runtime of a function with the values bound to its arguments directly, without building instructions."""
+    callee = Runtime(runtime.scope_for(func.owner), file=func.file or runtime.file)
+    for name, value in bound_values(func, values, runtime):
+        set_memory(callee, name, value)
+    for hoisted in func.hoisted:
+        set_memory(callee, hoisted.name, hoisted)
+    return callee
+
+def prepare_init(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Tuple[str, Environment, Function, Runtime]:
+    """Create the object for 'init', and the runtime to run the init function of its class on it in."""
     if len(args) < 2:
         raise ResolutionError("The 'init' runtime resolver requires at least a class, name, and optional arguments.")
     
@@ -153,9 +370,11 @@ def r_init(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> No
     else:
         func = func.value
     
-    fn_args = func.args
+    # Every object has its own addresses, and methods bound to it, so objects never write to their class.
     obj = Environment(class_env.parent, True)
-    obj.memory.update(class_env.memory)
+    for member, address in class_env.memory.items():
+        value = address.value
+        obj.memory[member] = MemoryAddress(member, value.bind(obj) if isinstance(value, Function) else value)
 
     interpreter.environment_loader(obj)
     set_memory(obj, "__class__", class_env)
@@ -164,38 +383,110 @@ def r_init(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> No
     values = extract_arguments(args[2:])
     values = [obj] + values
 
-    if fn_args and fn_args[-1].startswith("*"):
-        variadic_name = fn_args[-1][1:]
-        fixed_count = len(fn_args) - 1
-
-        if len(values) < fixed_count:
-            raise ResolutionError("Not enough arguments supplied.")
-        
-        fixed_values = values[:fixed_count]
-        rest_values = values[fixed_count:]
-
-        vm_list = py_to_vm(rest_values, runtime)
+    return name, obj, func, bind_runtime(func, values, runtime)
 
-        values = fixed_values + [Explicit(variadic_name, vm_list)]
-        fn_args = fn_args[:-1] + [variadic_name]
+def finish_init(runtime: Runtime, name: str, obj: Environment) -> None:
+    # Functions the init function stored on the object become its methods as well.
+    for mem in obj.memory.values():
+        value = mem.value
+        if isinstance(value, Function) and value.owner is not obj:
+            mem.value = value.bind(obj)
     
-    if len(values) < len(fn_args):
-        raise ResolutionError("All arguments must be supplied.")
+    set_memory(runtime, name, obj)
 
-    instructions = [
-        Instruction("set", [name, "obj", Explicit(name, value.as_value if isinstance(value, Argument) else value)], func.instructions[0].line)
-        for name, value in zip(fn_args, values)
-    ]
+def r_init(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    name, obj, func, callee = prepare_init(interpreter, runtime, args)
+    interpreter.execute_instructions(func.instructions, runtime=callee)
+    finish_init(runtime, name, obj)
 
-    instructions.extend(func.instructions)
-    interpreter.execute_instructions(instructions, func.owner, func.file)
+def call_values(func: Any, args: ArgumentList) -> List[Any]:
+    """The values of the arguments following an interpreted function in 'call', after its object for methods."""
+    if not isinstance(func, Function):
+        raise ResolutionError("The given function is not of the right type.")
+    
+    values = [value.as_value if isinstance(value, Argument) else value for value in extract_arguments(args[1:])]
 
-    for mem in obj.memory.values():
-        value = mem.value
-        if isinstance(value, Function):
-            value.owner = obj
+    if func.owner and func.owner.is_obj:
+        values = [func.owner] + values
     
-    set_memory(runtime, name, obj)
+    return values
+
+def prepare_call(runtime: Runtime, func: Any, args: ArgumentList) -> Runtime:
+    """The runtime to run an interpreted function in for 'call', with the arguments following it."""
+    return bind_runtime(func, call_values(func, args), runtime)
+
+def return_destinations(func: Function, body: Optional[Sequence[Instruction]] = None, found: Optional[Set[int]] = None) -> FrozenSet[int]:
+    """The indices of the arguments of a function that it returns to, through the bodies of its blocks."""
+    names = [arg.removeprefix("*") for arg in func.args]
+    found = set() if found is None else found
+
+    for inst in func.instructions if body is None else body:
+        if inst.token == "return" and inst.args and inst.args[0] in names:
+            found.add(names.index(inst.args[0]))
+        elif inst.token in BLOCKS:
+            return_destinations(func, inst.args[-1], found)
+    
+    return frozenset(found)
+
+def lookup_memo(interpreter: Interpreter, runtime: Runtime, func: Function, values: List[Any]) -> Tuple[Tuple[Any, ...], bool]:
+    """
+    Look the call up in the memo of the function, and return to the destinations of this call what it returned when it
+    was a hit. Returns the key of the call and whether it was a hit.
+    """
+    memo = func.memo
+    key = memo.key(values)
+    returns = memo.get(key)
+
+    monitor = interpreter.context.monitor
+    if monitor is not None:
+        monitor.memoized(runtime, func.name, returns is not None)
+
+    if returns is None:
+        return key, False
+    
+    for index, name, value in returns:
+        set_memory(runtime, values[index] if index >= 0 else name, value)
+    return key, True
+
+def store_memo(runtime: Runtime, func: Function, values: List[Any], key: Tuple[Any, ...], returned: Runtime, failed: bool) -> None:
+    """Pass what a memoized call returned on to its caller, and keep it in the memo unless the call failed."""
+    returns = []
+    for name, address in returned.memory.items():
+        set_memory(runtime, name, address.value)
+        index = next((i for i in func.memo.destinations if i < len(values) and values[i] == name), -1)
+        returns.append((index, name, address.value))
+    
+    if not failed:
+        func.memo.put(key, tuple(returns))
+
+def call_memoized(interpreter: Interpreter, runtime: Runtime, func: Function, args: ArgumentList) -> None:
+    """Call a memoized function, which only runs, and returns to a runtime of its own, when its memo misses."""
+    values = call_values(func, args)
+    key, hit = lookup_memo(interpreter, runtime, func, values)
+    if hit:
+        return
+    
+    returned = Runtime(None, file=runtime.file)
+    runtimes = interpreter.runtimes
+    runtimes.append(returned)
+    failed = True
+    try:
+        interpreter.execute_instructions(func.instructions, runtime=bind_runtime(func, values, runtime))
+        failed = False
+    finally:
+        runtimes.pop()
+        store_memo(runtime, func, values, key, returned, failed)
+
+def python_arguments(args: ArgumentList) -> Tuple[str, List[Any]]:
+    """The destination and values for calling a python function with 'call'."""
+    if len(args) < 2:
+        raise ResolutionError("The 'call' runtime resolver requires at least a name and destination for the result. Optionally parse arguments following.")
+    
+    return args[1].as_text, extract_arguments([arg.as_value for arg in args[2:]])
+
+def native_arguments(args: ArgumentList) -> List[Any]:
+    """The arguments for calling a native method with 'call', which reads each either by its name or its value."""
+    return extract_arguments(args[1:])
 
 def r_call(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     if len(args) < 1:
@@ -204,50 +495,50 @@ def r_call(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> No
     func = args[0].as_value
 
     if isinstance(func, PyFunction):
-        if len(args) < 2:
-            raise ResolutionError("The 'call' runtime resolver requires at least a name and destination for the result. Optionally parse arguments following.")
-        
-        dest = args[1].as_text
-
-        values = extract_arguments([arg.as_value for arg in args[2:]])
-
+        dest, values = python_arguments(args)
         set_memory(runtime, dest, func(*values))
         return
-
-    if not isinstance(func, Function):
-        raise ResolutionError("The given function is not of the right type.")
     
-    fn_args = func.args
-    values = extract_arguments(args[1:])
-
-    if func.owner and func.owner.is_obj:
-        values = [func.owner] + values
+    if isinstance(func, NativeMethod):
+        func(interpreter, runtime, *native_arguments(args))
+        return
     
-    if fn_args and fn_args[-1].startswith("*"):
-        variadic_name = fn_args[-1][1:]
-        fixed_count = len(fn_args) - 1
+    if isinstance(func, Function) and func.memo is not None:
+        call_memoized(interpreter, runtime, func, args)
+        return
 
-        if len(values) < fixed_count:
-            raise ResolutionError("Not enough arguments supplied.")
-        
-        fixed_values = values[:fixed_count]
-        rest_values = values[fixed_count:]
+    callee = prepare_call(runtime, func, args)
+    interpreter.execute_instructions(func.instructions, runtime=callee)
 
-        vm_list = py_to_vm(rest_values, runtime)
+def r_memo(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 1:
+        raise ResolutionError("The 'memo' runtime resolver requires a function, and optionally the most calls to remember.")
+    
+    name = args[0].as_text
+    func = args[0].as_value
+    size = args[1].as_value if len(args) > 1 else MEMO_SIZE
 
-        values = fixed_values + [Explicit(variadic_name, vm_list)]
-        fn_args = fn_args[:-1] + [variadic_name]
+    if not isinstance(func, Function) or func.generator:
+        raise ResolutionError("Only interpreted functions, which are not generators, can be memoized.")
     
-    if len(values) < len(fn_args):
-        raise ResolutionError("All arguments must be supplied.")
+    memo = Memo(None if size is None else int(size), return_destinations(func))
+    set_memory(runtime, name, replace(func, memo=memo))
 
-    instructions = [
-        Instruction("set", [name, "obj", Explicit(name, value.as_value if isinstance(value, Argument) else value)], func.instructions[0].line)
-        for name, value in zip(fn_args, values)
-    ]
+def r_forget(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 1:
+        raise ResolutionError("The 'forget' runtime resolver requires a memoized function, and optionally the arguments of a call to forget.")
+    
+    func = args[0].as_value
 
-    instructions.extend(func.instructions)
-    interpreter.execute_instructions(instructions, func.owner, func.file)
+    if not isinstance(func, Function) or func.memo is None:
+        raise ResolutionError("Only memoized functions have calls to forget.")
+    
+    if len(args) == 1:
+        func.memo.forget()
+        return
+    
+    # The arguments are given like they are to 'call', and any destinations among them are ignored.
+    func.memo.forget(func.memo.key(call_values(func, args)))
 
 def r_return(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     if len(args) < 2:
@@ -274,6 +565,10 @@ def r_set(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Non
     if len(args) - offset == 2:
         t = "any"
         v = args[offset + 1].as_value
+
+        # A container type with no values, such as 'set, name, dict;', creates an empty one.
+        if args[offset + 1].obj is None and isinstance(v, str) and is_container_type(casters.get(v)):
+            t = v
     else:
         t = args[offset + 1].as_text
         v = args[offset + 2].as_value
@@ -284,7 +579,8 @@ def r_set(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Non
         try:
             cast = casters.get(t, casters["any"])
             if is_container_type(cast):
-                evaluated = py_to_vm([arg.as_value for arg in args[offset + 2:]], runtime)
+                values = [arg.as_value for arg in args[offset + 2:]]
+                evaluated = py_to_vm(pair_values(values) if issubclass(cast, dict) else values, runtime)
             else:
                 evaluated = cast(v)
         except Exception as e:
@@ -305,7 +601,7 @@ def r_del(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> Non
     env = args[0].as_value if has_env else runtime
     name = args[offset].as_text
 
-    del env.memory[name]
+    del_memory(env, name)
 
 def add_cast(key: str, cast: Type) -> None:
     casters[key] = cast
@@ -314,12 +610,14 @@ def remove_cast(key: str) -> None:
     del casters[key]
 
 object_syntax: SyntaxDict = SyntaxDict(
-    Syntax("class", True, p_class, r___class__),
-    Syntax("func", True, p_func, r___func__),
-    Syntax("import", runtime_resolver=r_import),
-    Syntax("init", runtime_resolver=r_init),
-    Syntax("call", runtime_resolver=r_call),
-    Syntax("return", runtime_resolver=r_return),
-    Syntax("set", runtime_resolver=r_set),
-    Syntax("del", runtime_resolver=r_del)
+    Syntax("class", True, p_class, r___class__, 3),
+    Syntax("func", True, p_func, r___func__, 2),
+    Syntax("import", runtime_resolver=r_import, arity=1),
+    Syntax("init", runtime_resolver=r_init, arity=2),
+    Syntax("call", runtime_resolver=r_call, arity=1),
+    Syntax("memo", runtime_resolver=r_memo, arity=1),
+    Syntax("forget", runtime_resolver=r_forget, arity=1),
+    Syntax("return", runtime_resolver=r_return, arity=2),
+    Syntax("set", runtime_resolver=r_set, arity=2),
+    Syntax("del", runtime_resolver=r_del, arity=1)
 )
\ No newline at end of file
@@ -12,16 +12,19 @@ def r_input(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> N
     name = args[0].as_text
     prompt = args[1].as_value
 
-    set_memory(runtime, name, input(prompt))
+    set_memory(runtime, name, interpreter.streams.read_line(str(prompt)))
 
 def r_print(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     if len(args) < 1:
         raise ResolutionError("The 'print' runtime resolver requires at least one argument.")
     
+    text = " ".join([str(arg.as_value if isinstance(arg, Argument) else arg) for arg in extract_arguments(args)])
+
     if isinstance(args[0].as_value, Environment):
-        print({name: value for name, value in args[0].as_value.memory.items() if not name.startswith("__")})
+        members = {name: value for name, value in args[0].as_value.memory.items() if not name.startswith("__")}
+        text = f"{members}\n{text}"
     
-    print(*[arg.as_value if isinstance(arg, Argument) else arg for arg in extract_arguments(args)])
+    interpreter.streams.write(text + "\n")
 
 def r_jump(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
     if len(args) < 1:
@@ -29,8 +32,21 @@ def r_jump(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> No
     
     runtime.jump = args[0].as_value
 
+def r_await(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    raise ResolutionError("'await' can only be used while executing asynchronously, with an AsyncInterpreter.")
+
+def r_scheduled(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    raise ResolutionError("Tasks, channels and yielding can only be used in programs run by a Scheduler.")
+
 other_syntax: SyntaxDict = SyntaxDict(
-    Syntax("input", runtime_resolver=r_input),
-    Syntax("print", runtime_resolver=r_print),
-    Syntax("jump", runtime_resolver=r_jump)
+    Syntax("input", runtime_resolver=r_input, arity=2),
+    Syntax("print", runtime_resolver=r_print, arity=1),
+    Syntax("jump", runtime_resolver=r_jump, arity=1),
+    Syntax("await", runtime_resolver=r_await, arity=2),
+    Syntax("spawn", runtime_resolver=r_scheduled, arity=2),
+    Syntax("yield", runtime_resolver=r_scheduled),
+    Syntax("join", runtime_resolver=r_scheduled, arity=2),
+    Syntax("channel", runtime_resolver=r_scheduled, arity=1),
+    Syntax("send", runtime_resolver=r_scheduled, arity=2),
+    Syntax("receive", runtime_resolver=r_scheduled, arity=2)
 )
\ No newline at end of file
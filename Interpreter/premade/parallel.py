@@ -0,0 +1,238 @@
+"""Map and reduce interpreted functions over vm lists on a pool of worker processes or threads."""
+
+from typing import Dict, List, Tuple, Iterable, Iterator, Optional, Any
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from threading import Lock
+from collections import OrderedDict
+import hashlib
+import atexit
+import pickle
+import io
+import os
+
+from Interpreter.core import ExecutionContext, Runtime, Interpreter
+from Interpreter.memory import Environment, ArgumentList
+from Interpreter.exceptions import ResolutionError
+from Interpreter.utils import Function, set_memory
+
+from Interpreter.syntax import Syntax, SyntaxDict
+
+from .ffi import py_to_vm, vm_to_py
+from .objects import bind_arguments
+from .snapshot import SnapshotPickler
+
+RESULT = "__result__"
+
+@dataclass(slots=True)
+class ParallelConfig:
+    """How parallel primitives run: on 'process' or 'thread' workers, how many, and how many chunks per worker."""
+
+    mode: str = "process"
+    workers: Optional[int] = None
+    chunks_per_worker: int = 4
+
+parallel_config = ParallelConfig()
+
+_executors: Dict[str, Executor] = {}
+_executors_lock = Lock()
+
+# Process pools by the token of the payload their workers loaded when they started, the most recently used last.
+_process_executors: "OrderedDict[str, Executor]" = OrderedDict()
+MAX_PROCESS_EXECUTORS = 4
+
+# The payload loaded by this worker, by token, so chunks only need to name it.
+_loaded: Dict[str, Tuple[Interpreter, Function]] = {}
+
+def get_executor(mode: str) -> Executor:
+    with _executors_lock:
+        executor = _executors.get(mode)
+        if executor is None:
+            if mode != "thread":
+                raise ResolutionError(f"Unknown parallel mode '{mode}'.")
+            executor = _executors[mode] = ThreadPoolExecutor(parallel_config.workers or os.cpu_count() or 1)
+        return executor
+
+def get_process_executor(token: str, payload: bytes) -> Executor:
+    """
+    A process pool whose workers load the payload once as they start, so every chunk sent to it only carries the token.
+    Pools are kept for the payloads used last, as mapping the same function again sends the same payload.
+    """
+    with _executors_lock:
+        executor = _process_executors.get(token)
+        if executor is not None:
+            _process_executors.move_to_end(token)
+            return executor
+
+        workers = parallel_config.workers or os.cpu_count() or 1
+        executor = _process_executors[token] = ProcessPoolExecutor(workers, initializer=install_payload, initargs=(token, payload))
+
+        while len(_process_executors) > MAX_PROCESS_EXECUTORS:
+            _, evicted = _process_executors.popitem(last=False)
+            evicted.shutdown(wait=False)
+
+        return executor
+
+def shutdown_executors() -> None:
+    with _executors_lock:
+        for executor in [*_executors.values(), *_process_executors.values()]:
+            executor.shutdown(cancel_futures=True)
+        _executors.clear()
+        _process_executors.clear()
+
+atexit.register(shutdown_executors)
+
+def dump_payload(interpreter: Interpreter, func: Function) -> Optional[bytes]:
+    """Pickle a function with the environments it captures, or None if they cannot be sent to another process."""
+    buffer = io.BytesIO()
+    try:
+        SnapshotPickler(buffer, pickle.HIGHEST_PROTOCOL).dump((interpreter, func))
+    except Exception:
+        return None
+    return buffer.getvalue()
+
+def payload_token(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def install_payload(token: str, payload: bytes) -> None:
+    """Initializer of the workers of a process pool, loading the function its chunks run."""
+    _loaded[token] = pickle.loads(payload)
+
+def scoped_function(runtime: Runtime, func: Function) -> Function:
+    """The function bound to the environment 'call' would run it in from the runtime, such as a fork of its owner."""
+    scope = runtime.scope_for(func.owner)
+    return func if scope is func.owner else func.bind(scope)
+
+def call_function(interpreter: Interpreter, root: Runtime, func: Function, values: List[Any]) -> Any:
+    """Call a function with the result name and the values, and take what it returned into the root runtime."""
+    if func.owner and func.owner.is_obj:
+        values = [func.owner] + values
+
+    instructions = bind_arguments(func, [RESULT] + values, root)
+    interpreter.execute_instructions(instructions, func.owner, func.file)
+
+    address = root.memory.pop(RESULT, None)
+    return address.value if address is not None else None
+
+def run_chunk(interpreter: Interpreter, func: Function, chunk: List[Any], reduce: bool) -> List[Any]:
+    root = Runtime(None, file=func.file or "<parallel>")
+
+    with interpreter.execution(ExecutionContext([root])):
+        items = [py_to_vm(item, root) for item in chunk]
+
+        if not reduce:
+            return [vm_to_py(call_function(interpreter, root, func, [item])) for item in items]
+
+        acc = items[0]
+        for item in items[1:]:
+            acc = call_function(interpreter, root, func, [acc, item])
+        return [vm_to_py(acc)]
+
+def run_pickled_chunk(token: str, chunk: List[Any], reduce: bool) -> List[Any]:
+    interpreter, func = _loaded[token]
+    return run_chunk(interpreter, func, chunk, reduce)
+
+def split(items: List[Any], chunk_size: int) -> List[List[Any]]:
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+def submit_chunks(
+    interpreter: Interpreter,
+    func: Function,
+    items: List[Any],
+    chunk_size: int,
+    ordered: bool,
+    reduce: bool
+) -> Iterator[List[Any]]:
+    """Run the function over every chunk on the pool, yielding the result of each chunk as it is available."""
+    mode = parallel_config.mode
+    workers = parallel_config.workers or os.cpu_count() or 1
+
+    if chunk_size <= 0:
+        chunk_size = max(1, -(-len(items) // (workers * parallel_config.chunks_per_worker)))
+
+    chunks = split([vm_to_py(item) for item in items], chunk_size)
+
+    payload = dump_payload(interpreter, func) if mode == "process" else None
+    if payload is None:
+        # Functions capturing environments that cannot be pickled run on threads instead.
+        mode = "thread"
+
+    if mode == "process":
+        token = payload_token(payload)
+        executor = get_process_executor(token, payload)
+        futures: List[Future] = [executor.submit(run_pickled_chunk, token, chunk, reduce) for chunk in chunks]
+    else:
+        executor = get_executor(mode)
+        futures = [executor.submit(run_chunk, interpreter, func, chunk, reduce) for chunk in chunks]
+
+    results: Iterable[Future] = futures if ordered else as_completed(futures)
+    for future in results:
+        yield future.result()
+
+def list_items(value: Any) -> List[Any]:
+    if isinstance(value, Environment):
+        items = value.memory.get("items")
+        if items is not None and isinstance(items.value, list):
+            return items.value
+
+    if isinstance(value, list):
+        return value
+
+    raise ResolutionError("Parallel primitives can only be used over lists.")
+
+def parallel_options(args: ArgumentList, first: int) -> Tuple[int, bool]:
+    chunk_size = int(args[first].as_value) if len(args) > first else 0
+    ordered = bool(args[first + 1].as_value) if len(args) > first + 1 else True
+    return chunk_size, ordered
+
+def r_parallel_map(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 3:
+        raise ResolutionError("The 'parallel_map' runtime resolver requires a destination, a function and a list. Optionally a chunk size and whether to keep the order.")
+
+    dest = args[0].as_text
+    func = args[1].as_value
+
+    if not isinstance(func, Function):
+        raise ResolutionError("Only interpreted functions can be mapped in parallel.")
+
+    func = scoped_function(runtime, func)
+
+    items = list_items(args[2].as_value)
+    chunk_size, ordered = parallel_options(args, 3)
+
+    results = []
+    for chunk in submit_chunks(interpreter, func, items, chunk_size, ordered, False):
+        results.extend(chunk)
+
+    set_memory(runtime, dest, py_to_vm(results, runtime))
+
+def r_parallel_reduce(interpreter: Interpreter, runtime: Runtime, args: ArgumentList) -> None:
+    """Reduce chunks in parallel and combine them in order, so the function must be associative."""
+    if len(args) < 4:
+        raise ResolutionError("The 'parallel_reduce' runtime resolver requires a destination, a function, a list and an initial value. Optionally a chunk size.")
+
+    dest = args[0].as_text
+    func = args[1].as_value
+
+    if not isinstance(func, Function):
+        raise ResolutionError("Only interpreted functions can be reduced in parallel.")
+
+    func = scoped_function(runtime, func)
+
+    items = list_items(args[2].as_value)
+    acc = args[3].as_value
+    chunk_size, _ = parallel_options(args, 4)
+
+    partials = [chunk[0] for chunk in submit_chunks(interpreter, func, items, chunk_size, True, True)]
+
+    root = Runtime(None, file=runtime.file)
+    with interpreter.execution(ExecutionContext([root])):
+        for partial in partials:
+            acc = call_function(interpreter, root, func, [acc, py_to_vm(partial, root)])
+
+    set_memory(runtime, dest, py_to_vm(acc, runtime))
+
+parallel_syntax: SyntaxDict = SyntaxDict(
+    Syntax("parallel_map", runtime_resolver=r_parallel_map, arity=3),
+    Syntax("parallel_reduce", runtime_resolver=r_parallel_reduce, arity=4)
+)
@@ -0,0 +1,271 @@
+"""A pool of pre-warmed interpreter processes, for running many independent programs on every core."""
+
+from typing import Dict, List, Tuple, Iterable, Sequence, Optional, Any
+from dataclasses import dataclass
+from collections import deque
+from multiprocessing.connection import Connection, wait
+import multiprocessing
+import traceback
+import time
+import os
+
+from Interpreter.core import Interpreter
+
+from .standard import create_standard_interpreter
+from .ffi import export_memory
+
+@dataclass(slots=True)
+class Job:
+    """A program to run in the pool, given either as source code or as a path."""
+
+    source: Optional[str] = None
+    path: Optional[str] = None
+    timeout: Optional[float] = None
+
+@dataclass(slots=True)
+class JobResult:
+    """The exported memory of a finished job, or the error it failed with."""
+
+    job: Job
+    exports: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+    worker: Optional[int] = None
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+@dataclass(slots=True)
+class PoolStats:
+    jobs: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    workers_started: int = 0
+    workers_recycled: int = 0
+    busy_time: float = 0.0
+    wall_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Finished jobs per second of wall time spent in 'map'."""
+        return self.jobs / self.wall_time if self.wall_time else 0.0
+
+def warm_interpreter(modules: Sequence[str]) -> Interpreter:
+    """Create a standard interpreter and load every module into the import cache."""
+    interpreter = create_standard_interpreter()
+    for module in modules:
+        interpreter.import_file(module)
+    return interpreter
+
+def run_job(interpreter: Interpreter, job: Job) -> Dict[str, Any]:
+    # Every job has its own execution context, so it binds to its own views of the warmed modules.
+    with interpreter.execution():
+        if job.path is not None:
+            runtime = interpreter.interpret(job.path)
+        else:
+            runtime = interpreter.execute(job.source or "")
+    return export_memory(runtime)
+
+def worker_main(conn: Connection, modules: Sequence[str]) -> None:
+    try:
+        interpreter = warm_interpreter(modules)
+    except Exception:
+        conn.send(("failed", traceback.format_exc()))
+        return
+
+    conn.send(("ready", os.getpid()))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+
+        if message is None:
+            return
+
+        index, job = message
+        start = time.perf_counter()
+        try:
+            exports = run_job(interpreter, job)
+            error = None
+        except Exception as e:
+            exports = None
+            error = f"{type(e).__qualname__}: {e}"
+        elapsed = time.perf_counter() - start
+
+        try:
+            conn.send((index, exports, error, elapsed))
+        except Exception as e:
+            conn.send((index, None, f"The exports could not be sent back: {e}", elapsed))
+
+class Worker:
+    __slots__ = ("process", "conn", "pid", "jobs")
+
+    def __init__(self, context: Any, modules: Sequence[str]) -> None:
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=worker_main, args=(child_conn, tuple(modules)), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+        self.pid = self.process.pid
+        self.jobs = 0
+
+    def wait_ready(self) -> None:
+        status, detail = self.conn.recv()
+        if status != "ready":
+            self.kill()
+            raise RuntimeError(f"A worker failed to warm up:\n{detail}")
+
+    def send(self, index: int, job: Job) -> None:
+        self.conn.send((index, job))
+        self.jobs += 1
+
+    def shutdown(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+class WorkerPool:
+    """
+    Run programs in worker processes that are warmed once, by loading a set of modules into their import cache.
+    Workers are reused between jobs, replaced when a job times out, and recycled after 'max_jobs_per_worker' jobs.
+    """
+
+    __slots__ = ("size", "modules", "timeout", "max_jobs_per_worker", "stats", "_context", "_workers")
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        modules: Sequence[str] = ("standard/.txt",),
+        timeout: Optional[float] = None,
+        max_jobs_per_worker: Optional[int] = None,
+        start_method: Optional[str] = None
+    ) -> None:
+        self.size = size or os.cpu_count() or 1
+        self.modules = tuple(modules)
+        self.timeout = timeout
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.stats = PoolStats()
+
+        self._context = multiprocessing.get_context(start_method)
+        self._workers: List[Worker] = []
+
+    def __enter__(self) -> "WorkerPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _spawn(self, count: int) -> List[Worker]:
+        workers = [Worker(self._context, self.modules) for _ in range(count)]
+        for worker in workers:
+            worker.wait_ready()
+        self.stats.workers_started += count
+        return workers
+
+    def start(self) -> None:
+        if not self._workers:
+            self._workers = self._spawn(self.size)
+
+    def close(self) -> None:
+        for worker in self._workers:
+            worker.shutdown()
+        self._workers = []
+
+    def _replace(self, worker: Worker, kill: bool) -> Worker:
+        if kill:
+            worker.kill()
+        else:
+            worker.shutdown()
+
+        new_worker = self._spawn(1)[0]
+        self._workers[self._workers.index(worker)] = new_worker
+        return new_worker
+
+    def map(self, jobs: Iterable[Job]) -> List[JobResult]:
+        """Run every job and return the results in the same order."""
+        self.start()
+
+        jobs = list(jobs)
+        results: List[Optional[JobResult]] = [None] * len(jobs)
+        pending = deque(enumerate(jobs))
+
+        idle = list(self._workers)
+        busy: Dict[Connection, Tuple[Worker, int, Optional[float], float]] = {}
+
+        stats = self.stats
+        started = time.perf_counter()
+
+        while pending or busy:
+            while pending and idle:
+                worker = idle.pop()
+                index, job = pending.popleft()
+
+                timeout = job.timeout if job.timeout is not None else self.timeout
+                sent = time.monotonic()
+                deadline = sent + timeout if timeout is not None else None
+
+                worker.send(index, job)
+                busy[worker.conn] = (worker, index, deadline, sent)
+
+            deadlines = [deadline for _, _, deadline, _ in busy.values() if deadline is not None]
+            wait_time = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+            for conn in wait(list(busy), wait_time):
+                worker, index, _, _ = busy.pop(conn)
+
+                try:
+                    _, exports, error, elapsed = conn.recv()
+                except (EOFError, OSError):
+                    results[index] = JobResult(jobs[index], error="The worker exited unexpectedly.", worker=worker.pid)
+                    stats.failures += 1
+                    idle.append(self._replace(worker, kill=True))
+                    continue
+
+                results[index] = JobResult(jobs[index], exports, error, elapsed, worker.pid)
+                stats.busy_time += elapsed
+                if error is not None:
+                    stats.failures += 1
+
+                if self.max_jobs_per_worker and worker.jobs >= self.max_jobs_per_worker:
+                    worker = self._replace(worker, kill=False)
+                    stats.workers_recycled += 1
+                idle.append(worker)
+
+            now = time.monotonic()
+            for conn, (worker, index, deadline, sent) in list(busy.items()):
+                if deadline is None or deadline > now:
+                    continue
+
+                del busy[conn]
+                results[index] = JobResult(
+                    jobs[index], error="The job timed out.", elapsed=now - sent, worker=worker.pid, timed_out=True
+                )
+                stats.timeouts += 1
+                stats.failures += 1
+                idle.append(self._replace(worker, kill=True))
+
+        stats.jobs += len(jobs)
+        stats.wall_time += time.perf_counter() - started
+
+        return results
+
+    def run_files(self, paths: Iterable[str], timeout: Optional[float] = None) -> List[JobResult]:
+        return self.map(Job(path=path, timeout=timeout) for path in paths)
+
+    def run_sources(self, sources: Iterable[str], timeout: Optional[float] = None) -> List[JobResult]:
+        return self.map(Job(source=source, timeout=timeout) for source in sources)
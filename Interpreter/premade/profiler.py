@@ -0,0 +1,186 @@
+"""A deterministic profiler, timing every instruction, line, token and function of an execution."""
+
+from typing import Dict, List, Tuple, Iterator, Optional, Callable, Any
+from dataclasses import dataclass
+from contextlib import contextmanager
+import time
+import os
+
+from Interpreter.core import Monitor, ExecutionContext, Runtime, Interpreter
+from Interpreter.memory import Instruction
+
+@dataclass(slots=True)
+class ProfileStats:
+    """Counts and times, in nanoseconds. Inclusive time counts recursive entries of the same key once."""
+
+    count: int = 0
+    inclusive: int = 0
+    exclusive: int = 0
+
+@dataclass(slots=True)
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+
+def frame_name(inst: Optional[Instruction]) -> str:
+    """Name a frame after the instruction that entered it."""
+    if inst is None:
+        return "<module>"
+
+    target = inst.args[0].strip() if inst.args and isinstance(inst.args[0], str) else ""
+    if inst.token in ("call", "init", "spawn") and target:
+        return target
+    if inst.token == "import" and target:
+        return f"import {target}"
+    return f"<{inst.token}>"
+
+class Profiler(Monitor):
+    """
+    Monitor recording, per file and line, per token and per function, how often it ran and the time spent in it.
+    Functions are named after the call that entered them, and the time of every instruction is also kept per stack of
+    functions, for flame graphs. Calls to memoized functions are counted as hits and misses of their memo.
+    """
+
+    __slots__ = ("clock", "lines", "tokens", "functions", "memos", "stacks", "_calls", "_frames", "_real", "_path", "_active")
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns) -> None:
+        self.clock = clock
+
+        self.lines: Dict[Tuple[str, int], ProfileStats] = {}
+        self.tokens: Dict[str, ProfileStats] = {}
+        self.functions: Dict[str, ProfileStats] = {}
+        self.memos: Dict[Tuple[str, str], MemoStats] = {}
+        self.stacks: Dict[Tuple[str, ...], int] = {}
+
+        # Entries are [start, child time, key] for instructions, and [start, child time, key, runtime] for frames.
+        self._calls: List[List[Any]] = []
+        self._frames: List[bool] = []
+        self._real: List[List[Any]] = []
+        self._path: Tuple[str, ...] = ()
+        self._active: Dict[Any, int] = {}
+
+    def _record(self, table: Dict[Any, ProfileStats], key: Any, active_key: Any, inclusive: int, exclusive: int) -> None:
+        stats = table.get(key)
+        if stats is None:
+            stats = table[key] = ProfileStats()
+
+        stats.count += 1
+        stats.exclusive += exclusive
+
+        active = self._active[active_key] - 1
+        if active:
+            self._active[active_key] = active
+        else:
+            del self._active[active_key]
+            stats.inclusive += inclusive
+
+    def _activate(self, key: Any) -> None:
+        self._active[key] = self._active.get(key, 0) + 1
+
+    def enter_frame(self, runtime: Runtime) -> None:
+        if self._real and self._real[-1][3] is runtime:
+            # Bodies of control flow run in the runtime of their statement, so they are not frames of their own.
+            self._frames.append(False)
+            return
+
+        name = frame_name(self._calls[-1][2][1] if self._calls else None)
+        label = f"{name}@{os.path.basename(runtime.file)}"
+        key = ("function", f"{name} ({runtime.file})")
+
+        self._activate(key)
+        self._frames.append(True)
+        self._real.append([self.clock(), 0, key, runtime])
+        self._path = self._path + (label,)
+
+    def exit_frame(self, runtime: Runtime) -> None:
+        if not self._frames.pop():
+            return
+
+        start, child, key, _ = self._real.pop()
+        inclusive = self.clock() - start
+
+        if self._real:
+            self._real[-1][1] += inclusive
+        self._path = self._path[:-1]
+
+        self._record(self.functions, key[1], key, inclusive, inclusive - child)
+
+    def before(self, runtime: Runtime, inst: Instruction) -> None:
+        line = (runtime.file, inst.line)
+        self._activate(line)
+        self._activate(("token", inst.token))
+        self._calls.append([self.clock(), 0, (line, inst)])
+
+    def after(self, runtime: Runtime, inst: Instruction) -> None:
+        start, child, (line, _) = self._calls.pop()
+        inclusive = self.clock() - start
+        exclusive = inclusive - child
+
+        if self._calls:
+            self._calls[-1][1] += inclusive
+
+        self._record(self.lines, line, line, inclusive, exclusive)
+        self._record(self.tokens, inst.token, ("token", inst.token), inclusive, exclusive)
+        self.stacks[self._path] = self.stacks.get(self._path, 0) + exclusive
+
+    def memoized(self, runtime: Runtime, name: str, hit: bool) -> None:
+        key = (name, runtime.file)
+        stats = self.memos.get(key)
+        if stats is None:
+            stats = self.memos[key] = MemoStats()
+
+        if hit:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+
+    def report(self, limit: int = 20, sort: str = "exclusive") -> str:
+        """
+        A text report of the most costly functions, lines and tokens, sorted by 'exclusive', 'inclusive' or 'count'.
+
+        Inclusive time counts recursive entries once, from the outermost one. A function that only calls itself thus has
+        the same inclusive and exclusive time, as all the time below its outermost call is spent in its own frames.
+        """
+        sections = [
+            ("Functions", self.functions),
+            ("Lines", {f"{file}:{line}": stats for (file, line), stats in self.lines.items()}),
+            ("Tokens", self.tokens)
+        ]
+
+        out = []
+        for title, table in sections:
+            rows = sorted(table.items(), key=lambda item: getattr(item[1], sort), reverse=True)[:limit]
+
+            out.append(f"{title}:")
+            out.append(f"{'count':>10} {'inclusive ms':>14} {'exclusive ms':>14}  name")
+            for name, stats in rows:
+                out.append(f"{stats.count:>10} {stats.inclusive / 1e6:>14.3f} {stats.exclusive / 1e6:>14.3f}  {name}")
+            out.append("")
+
+        if self.memos:
+            out.append("Memoized functions:")
+            out.append(f"{'hits':>10} {'misses':>10} {'hit rate':>10}  name")
+            for (name, file), stats in sorted(self.memos.items(), key=lambda item: item[1].hits + item[1].misses, reverse=True)[:limit]:
+                rate = stats.hits / (stats.hits + stats.misses)
+                out.append(f"{stats.hits:>10} {stats.misses:>10} {rate:>10.1%}  {name} ({file})")
+            out.append("")
+
+        return "\n".join(out)
+
+    def collapsed(self) -> str:
+        """Collapsed stacks with their exclusive time in microseconds, the input format of flame graph tools."""
+        return "\n".join(
+            f"{';'.join(path) or '<root>'} {max(1, ns // 1000)}"
+            for path, ns in sorted(self.stacks.items()) if ns > 0
+        )
+
+    def write_collapsed(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed() + "\n")
+
+@contextmanager
+def profiled(interpreter: Interpreter, profiler: Optional[Profiler] = None) -> Iterator[Profiler]:
+    """Profile everything executed in the block, in a new execution context."""
+    profiler = profiler or Profiler()
+    with interpreter.execution(ExecutionContext(monitor=profiler)):
+        yield profiler
@@ -0,0 +1,255 @@
+"""Green threads: many lightweight tasks in one thread, time-sliced by instruction count and talking over channels."""
+
+from typing import Deque, List, Set, Tuple, Optional, Coroutine, Any
+from contextvars import ContextVar
+from collections import deque
+import asyncio
+
+from Interpreter.core import AsyncRuntimeResolutions, ExecutionContext, Runtime, AsyncInterpreter
+from Interpreter.memory import Environment, ArgumentList
+from Interpreter.exceptions import ResolutionError, Deadlock
+from Interpreter.utils import Function, set_memory, extract_arguments
+
+from .objects import bind_arguments
+from .asynchronous import create_async_interpreter
+
+current_scheduler: ContextVar[Optional["Scheduler"]] = ContextVar("current_scheduler", default=None)
+
+class GreenTask:
+    """A task run by a scheduler. Its result is the runtime that a spawned function returned into."""
+
+    __slots__ = ("id", "task", "joined")
+
+    def __init__(self, id: int, task: "asyncio.Task[Any]") -> None:
+        self.id = id
+        self.task = task
+        self.joined = False
+
+    def __repr__(self) -> str:
+        state = "done" if self.task.done() else "running"
+        return f"<GreenTask {self.id} {state}>"
+
+    @property
+    def done(self) -> bool:
+        return self.task.done()
+
+class Channel:
+    """A channel between tasks. Sending blocks while it holds 'capacity' values, unless the capacity is 0 (unbounded)."""
+
+    __slots__ = ("scheduler", "capacity", "buffer", "getters", "putters")
+
+    def __init__(self, scheduler: "Scheduler", capacity: int = 0) -> None:
+        self.scheduler = scheduler
+        self.capacity = capacity
+        self.buffer: Deque[Any] = deque()
+        self.getters: Deque["asyncio.Future[Any]"] = deque()
+        self.putters: Deque[Tuple["asyncio.Future[Any]", Any]] = deque()
+
+    def __repr__(self) -> str:
+        return f"<Channel {len(self.buffer)}/{self.capacity or 'unbounded'}>"
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    async def send(self, value: Any) -> None:
+        while self.getters:
+            getter = self.getters.popleft()
+            if not getter.done():
+                getter.set_result(value)
+                return
+
+        if not self.capacity or len(self.buffer) < self.capacity:
+            self.buffer.append(value)
+            return
+
+        putter = asyncio.get_running_loop().create_future()
+        self.putters.append((putter, value))
+        await self.scheduler.block(putter)
+
+    async def receive(self) -> Any:
+        if self.buffer:
+            value = self.buffer.popleft()
+
+            while self.putters:
+                putter, pending = self.putters.popleft()
+                if not putter.done():
+                    self.buffer.append(pending)
+                    putter.set_result(None)
+                    break
+
+            return value
+
+        getter = asyncio.get_running_loop().create_future()
+        self.getters.append(getter)
+        return await self.scheduler.block(getter)
+
+class Scheduler:
+    """
+    Run programs as green threads on one event loop. Every task yields after 'time_slice' instructions, so a busy task
+    cannot starve the others, and waiting on a channel or a join only blocks the task itself.
+    """
+
+    __slots__ = ("interpreter", "time_slice", "tasks", "alive", "waiting", "_next_id")
+
+    def __init__(self, interpreter: Optional[AsyncInterpreter] = None, time_slice: int = 100) -> None:
+        self.interpreter = interpreter or create_async_interpreter(resolutions=scheduler_resolutions)
+        self.time_slice = time_slice
+
+        self.tasks: List[GreenTask] = []
+        self.alive = 0
+        self.waiting: Set["asyncio.Future[Any]"] = set()
+
+        self._next_id = 0
+
+    def spawn(self, coroutine: Coroutine[Any, Any, Any], root: Optional[Runtime] = None) -> GreenTask:
+        """Run a coroutine as a new task, with its own execution context that starts at the root runtime."""
+        context = ExecutionContext([root] if root else [], time_slice=self.time_slice, slice_left=self.time_slice)
+        task = GreenTask(self._next_id, self.interpreter.create_task(coroutine, context))
+
+        self._next_id += 1
+        self.alive += 1
+        self.tasks.append(task)
+
+        task.task.add_done_callback(self._finished)
+        return task
+
+    def spawn_function(self, func: Function, values: List[Any], runtime: Runtime) -> GreenTask:
+        """Call an interpreted function as a new task. It returns into a fresh runtime, which joining the task gives."""
+        root = Runtime(None, file=func.file or runtime.file)
+        if self.interpreter.environment_loader:
+            self.interpreter.environment_loader(root)
+
+        instructions = bind_arguments(func, values, runtime)
+        return self.spawn(self._call(instructions, runtime.scope_for(func.owner), func.file, root), root)
+
+    async def _call(self, instructions: List[Any], owner: Optional[Environment], file: Optional[str], root: Runtime) -> Runtime:
+        await self.interpreter.execute_instructions_async(instructions, owner, file)
+        return root
+
+    def _finished(self, task: "asyncio.Task[Any]") -> None:
+        self.alive -= 1
+        # Tasks joining this one are woken by callbacks added after this one, so look for a deadlock once they ran.
+        task.get_loop().call_soon(self._check_deadlock)
+
+    def _check_deadlock(self) -> None:
+        if not self.waiting or len(self.waiting) < self.alive:
+            return
+
+        if any(future.done() for future in self.waiting):
+            return
+
+        for future in self.waiting:
+            future.set_exception(Deadlock("Every task is waiting on a channel or another task."))
+
+    async def block(self, future: "asyncio.Future[Any]") -> Any:
+        """Wait for a future, failing every waiting task if no task could ever complete it."""
+        self.waiting.add(future)
+        self._check_deadlock()
+        try:
+            return await future
+        finally:
+            self.waiting.discard(future)
+
+    async def join(self, task: GreenTask) -> Any:
+        task.joined = True
+
+        if not task.task.done():
+            done = asyncio.get_running_loop().create_future()
+            task.task.add_done_callback(lambda _: done.done() or done.set_result(None))
+            await self.block(done)
+
+        return task.task.result()
+
+    async def run_async(self, code: str) -> Runtime:
+        """Run a program as the main task, then wait for every task it spawned."""
+        token = current_scheduler.set(self)
+        try:
+            main = self.spawn(self.interpreter.execute_async(code))
+            main.joined = True
+
+            while any(not task.done for task in self.tasks):
+                await asyncio.gather(*[task.task for task in self.tasks], return_exceptions=True)
+        finally:
+            current_scheduler.reset(token)
+
+        for task in self.tasks:
+            if not task.joined and task.task.exception() is not None:
+                raise task.task.exception()
+
+        return main.task.result()
+
+    def run(self, code: str) -> Runtime:
+        return asyncio.run(self.run_async(code))
+
+def scheduler_of(token: str) -> Scheduler:
+    scheduler = current_scheduler.get()
+    if scheduler is None:
+        raise ResolutionError(f"'{token}' can only be used in programs run by a Scheduler.")
+    return scheduler
+
+async def a_spawn(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The 'spawn' runtime resolver requires at least a destination and a function. Optionally parse arguments following.")
+
+    dest = args[0].as_text
+    func = args[1].as_value
+
+    if not isinstance(func, Function):
+        raise ResolutionError("Only interpreted functions can be spawned as tasks.")
+
+    values = extract_arguments(args[2:])
+    if func.owner and func.owner.is_obj:
+        values = [func.owner] + values
+
+    set_memory(runtime, dest, scheduler_of("spawn").spawn_function(func, values, runtime))
+
+async def a_yield(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    await interpreter.preempt(interpreter.context)
+
+async def a_join(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The 'join' runtime resolver requires a destination and a task.")
+
+    dest = args[0].as_text
+    task = args[1].as_value
+
+    if not isinstance(task, GreenTask):
+        raise ResolutionError("Only tasks can be joined.")
+
+    set_memory(runtime, dest, await scheduler_of("join").join(task))
+
+async def a_channel(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 1:
+        raise ResolutionError("The 'channel' runtime resolver requires a name and optionally a capacity.")
+
+    capacity = args[1].as_value if len(args) > 1 else 0
+    set_memory(runtime, args[0].as_text, Channel(scheduler_of("channel"), int(capacity)))
+
+async def a_send(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The 'send' runtime resolver requires a channel and a value.")
+
+    channel = args[0].as_value
+    if not isinstance(channel, Channel):
+        raise ResolutionError("Values can only be sent over channels.")
+
+    await channel.send(args[1].as_value)
+
+async def a_receive(interpreter: AsyncInterpreter, runtime: Runtime, args: ArgumentList) -> None:
+    if len(args) < 2:
+        raise ResolutionError("The 'receive' runtime resolver requires a destination and a channel.")
+
+    channel = args[1].as_value
+    if not isinstance(channel, Channel):
+        raise ResolutionError("Values can only be received from channels.")
+
+    set_memory(runtime, args[0].as_text, await channel.receive())
+
+scheduler_resolutions: AsyncRuntimeResolutions = {
+    "spawn": a_spawn,
+    "yield": a_yield,
+    "join": a_join,
+    "channel": a_channel,
+    "send": a_send,
+    "receive": a_receive
+}
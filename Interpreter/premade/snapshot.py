@@ -0,0 +1,100 @@
+"""Snapshots store a warmed interpreter and its runtimes, so later processes can load them instead of re-executing library code."""
+
+from typing import Tuple, Optional, BinaryIO, Callable, Any
+from Interpreter.core import Runtime, Interpreter
+from Interpreter.memory import Environment
+from Interpreter.exceptions import SnapshotError
+
+from .ffi import PyFunction, pyimport_environment
+
+import importlib
+import pickle
+import io
+
+SNAPSHOT_VERSION = 6
+
+def import_name(func: Callable) -> Optional[Tuple[str, str]]:
+    """Find the module and qualified name a python callable can be imported by, if any."""
+    module_name = getattr(func, "__module__", None)
+    qualname = getattr(func, "__qualname__", None)
+
+    if not module_name or not qualname or "<" in qualname:
+        return None
+
+    try:
+        obj = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            obj = getattr(obj, part)
+    except Exception:
+        return None
+
+    return (module_name, qualname) if obj is func else None
+
+def rebind_function(module_name: str, qualname: str) -> PyFunction:
+    obj = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return PyFunction(obj)
+
+def rebind_module(module_name: str, parent: Optional[Environment]) -> Environment:
+    return pyimport_environment(module_name, parent)
+
+class SnapshotPickler(pickle.Pickler):
+    """Pickler that stores python modules and functions by their import name."""
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, PyFunction):
+            name = import_name(obj.func)
+            if name is not None:
+                return rebind_function, name
+
+        elif isinstance(obj, Environment):
+            module = obj.memory.get("__module__")
+            if module is not None:
+                return rebind_module, (module.value, obj.parent)
+
+        return NotImplemented
+
+def dump_snapshot(interpreter: Interpreter, runtime: Runtime, file: BinaryIO) -> None:
+    """Write the interpreter, with its imported modules, and the runtime to a binary file."""
+    if interpreter.runtimes:
+        raise SnapshotError("Cannot snapshot an interpreter while it is executing.")
+
+    state = {
+        "version": SNAPSHOT_VERSION,
+        "interpreter": interpreter,
+        "runtime": runtime
+    }
+
+    try:
+        SnapshotPickler(file, pickle.HIGHEST_PROTOCOL).dump(state)
+    except Exception as e:
+        raise SnapshotError(f"The interpreter state could not be snapshotted: {e}") from e
+
+def load_snapshot(file: BinaryIO) -> Tuple[Interpreter, Runtime]:
+    """Restore an interpreter and runtime written by 'dump_snapshot'."""
+    try:
+        state = pickle.load(file)
+    except Exception as e:
+        raise SnapshotError(f"The snapshot could not be restored: {e}") from e
+
+    if not isinstance(state, dict) or state.get("version") != SNAPSHOT_VERSION:
+        raise SnapshotError("The snapshot was written by an incompatible version.")
+
+    return state["interpreter"], state["runtime"]
+
+def dumps_snapshot(interpreter: Interpreter, runtime: Runtime) -> bytes:
+    buffer = io.BytesIO()
+    dump_snapshot(interpreter, runtime, buffer)
+    return buffer.getvalue()
+
+def loads_snapshot(data: bytes) -> Tuple[Interpreter, Runtime]:
+    return load_snapshot(io.BytesIO(data))
+
+def save_snapshot(interpreter: Interpreter, runtime: Runtime, path: str) -> None:
+    with open(path, "wb") as f:
+        dump_snapshot(interpreter, runtime, f)
+
+def restore_snapshot(path: str) -> Tuple[Interpreter, Runtime]:
+    with open(path, "rb") as f:
+        return load_snapshot(f)
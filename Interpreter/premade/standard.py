@@ -1,24 +1,43 @@
 """The standard language allows using our own programming language that supports classes, inheritance, python FFI, variables and much more."""
 
-from typing import Tuple
+from typing import Tuple, Optional
 from Interpreter.core import ParserResolutions, RuntimeResolutions, Accent, Runtime, Interpreter
-from Interpreter.memory import Environment
-from Interpreter.utils import set_memory
+from Interpreter.memory import Virtuals, Environment
 
-from Interpreter.syntax import SyntaxTree, SyntaxDict
+from Interpreter.syntax import SyntaxTree, FrozenSyntaxTree, SyntaxDict
 
 from .objects import object_syntax 
 from .comparison import comparison_syntax
 from .ffi import ffi_syntax
 from .math import math_syntax
 from .others import other_syntax
+from .parallel import parallel_syntax
+from .files import files_syntax
+from .generators import generator_syntax
+from .arrays import array_syntax
+from .columns import execute_batch_columns
 
-def standard_environment_loader(environment: Environment) -> None:
-    set_memory(environment, "this", environment)
-    set_memory(environment, "this_parent", environment.parent)
+def this(environment: Environment) -> Environment:
+    return environment
+
+def this_parent(environment: Environment) -> Optional[Environment]:
+    return environment.parent
+
+def this_path(environment: Runtime) -> str:
+    return environment.file
 
-    if hasattr(environment, "file"):
-        set_memory(environment, "this_path", environment.file)
+standard_virtuals: Virtuals = {
+    "this": this,
+    "this_parent": this_parent
+}
+
+runtime_virtuals: Virtuals = {
+    **standard_virtuals,
+    "this_path": this_path
+}
+
+def standard_environment_loader(environment: Environment) -> None:
+    environment.virtuals = runtime_virtuals if hasattr(environment, "file") else standard_virtuals
 
 standard_accent = Accent()
 
@@ -28,17 +47,23 @@ standard_syntax_dict.update(comparison_syntax)
 standard_syntax_dict.update(ffi_syntax)
 standard_syntax_dict.update(math_syntax)
 standard_syntax_dict.update(other_syntax)
+standard_syntax_dict.update(parallel_syntax)
+standard_syntax_dict.update(files_syntax)
+standard_syntax_dict.update(generator_syntax)
+standard_syntax_dict.update(array_syntax)
 
 standard_syntax_tree: SyntaxTree = standard_syntax_dict.create_syntax_tree()
+frozen_standard_syntax_tree: FrozenSyntaxTree = standard_syntax_tree.freeze()
 
 parser_resoultions: ParserResolutions = standard_syntax_tree.parser_resolutions
 runtime_resolutions: RuntimeResolutions = standard_syntax_tree.runtime_resolutions
 
 def create_standard_interpreter(debug: bool = False) -> Interpreter:
-    return standard_syntax_tree.create_interpreter(
+    return frozen_standard_syntax_tree.create_interpreter(
         accent = standard_accent,
         environment_loader = standard_environment_loader,
-        debug = debug
+        debug = debug,
+        batch_executor = execute_batch_columns
     )
 
 def interpret_file(file: str, debug: bool = False) -> Tuple[Interpreter, Runtime]:
@@ -0,0 +1,90 @@
+"""Timeline tracing of executions, written as Chrome Trace Event JSON for chrome://tracing and Perfetto."""
+
+from typing import Dict, List, Iterator, Optional, Callable, Any
+from contextlib import contextmanager
+from threading import get_ident
+import json
+import time
+import os
+
+from Interpreter.core import Monitor, ExecutionContext, Runtime, Interpreter
+from Interpreter.memory import Instruction
+
+from .ffi import PyFunction
+
+class Tracer(Monitor):
+    """
+    Monitor recording spans for interpreting files (read, raw_parse, transform and execute), for every import with
+    whether it was cached, for every 'call' and 'init' by the name of the callee, and for calls into python functions.
+    """
+
+    __slots__ = ("interpreter", "clock", "origin", "pid", "events", "_open")
+
+    def __init__(self, interpreter: Interpreter, clock: Callable[[], int] = time.perf_counter_ns) -> None:
+        self.interpreter = interpreter
+        self.clock = clock
+        self.origin = clock()
+        self.pid = os.getpid()
+
+        self.events: List[Dict[str, Any]] = []
+        self._open: List[Optional[str]] = []
+
+    def _event(self, phase: str, name: str, category: str, args: Optional[Dict[str, Any]] = None) -> None:
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": phase,
+            "ts": (self.clock() - self.origin) / 1000,
+            "pid": self.pid,
+            "tid": get_ident()
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def begin(self, name: str, category: str, args: Optional[Dict[str, Any]] = None) -> None:
+        self._event("B", name, category, args)
+
+    def end(self, name: str, category: str) -> None:
+        self._event("E", name, category)
+
+    def before(self, runtime: Runtime, inst: Instruction) -> None:
+        if inst.token not in ("call", "init") or not inst.args:
+            self._open.append(None)
+            return
+
+        target = inst.args[0]
+        category = inst.token
+        name = target
+
+        # The callee is looked up again by the resolver, which reports a failing lookup with the file and line.
+        try:
+            func = self.interpreter.translate(runtime, target).as_value
+        except Exception:
+            func = None
+
+        if isinstance(func, PyFunction):
+            category = "ffi"
+            name = getattr(func.func, "__qualname__", None) or repr(func.func)
+
+        self._open.append(category)
+        self.begin(name, category, {"file": runtime.file, "line": inst.line})
+
+    def after(self, runtime: Runtime, inst: Instruction) -> None:
+        category = self._open.pop()
+        if category is not None:
+            self.end("", category)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"traceEvents": self.events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f)
+
+@contextmanager
+def traced(interpreter: Interpreter, tracer: Optional[Tracer] = None) -> Iterator[Tracer]:
+    """Trace everything executed in the block, in a new execution context."""
+    tracer = tracer or Tracer(interpreter)
+    with interpreter.execution(ExecutionContext(monitor=tracer)):
+        yield tracer
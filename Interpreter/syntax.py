@@ -1,7 +1,8 @@
-from ._internal.syntax import Syntax, SyntaxTree, SyntaxDict
+from ._internal.syntax import Syntax, SyntaxTree, FrozenSyntaxTree, SyntaxDict
 
 __all__ = (
     "Syntax",
     "SyntaxTree",
+    "FrozenSyntaxTree",
     "SyntaxDict"
 )
\ No newline at end of file
@@ -1,8 +1,13 @@
 from ._internal.utils import (
     Body,
+    Returns,
+    Identity,
+    Memo,
     Function, 
+    create_closure,
     create_body,
     set_memory,
+    del_memory,
     extract_arguments,
     evaluate_condition,
     evaluate_math
@@ -10,9 +15,14 @@ from ._internal.utils import (
 
 __all__ = (
     "Body",
+    "Returns",
+    "Identity",
+    "Memo",
     "Function",
+    "create_closure",
     "create_body",
     "set_memory",
+    "del_memory",
     "extract_arguments",
     "evaluate_condition",
     "evaluate_math"
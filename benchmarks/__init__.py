@@ -0,0 +1,7 @@
+"""
+Benchmarks of EPIS workloads, for tracking the performance of the interpreter between changes.
+
+Run them from the root of the repository with 'python -m benchmarks'. Store a baseline with '--save-baseline FILE'
+before a change and compare against it with '--baseline FILE' after it; the run fails when any benchmark got slower
+than the threshold allows.
+"""
@@ -0,0 +1,133 @@
+"""Run benchmarks, write their results as JSON and compare them against a stored baseline."""
+
+from typing import Dict, List, Sequence, Optional, Callable, Any
+from dataclasses import dataclass, asdict
+import statistics
+import argparse
+import platform
+import fnmatch
+import json
+import time
+import sys
+
+@dataclass(slots=True)
+class Benchmark:
+    """A named workload. 'setup' prepares it once and returns the function that is timed."""
+
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], Any]]
+    repeat: int = 5
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    name: str
+    group: str
+    runs: List[float]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.runs)
+
+    @property
+    def best(self) -> float:
+        return min(self.runs)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {**asdict(self), "median": self.median, "best": self.best}
+
+@dataclass(slots=True)
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+def run_benchmark(benchmark: Benchmark, repeat: Optional[int] = None) -> BenchmarkResult:
+    run = benchmark.setup()
+    run()
+
+    runs = []
+    for _ in range(repeat or benchmark.repeat):
+        start = time.perf_counter()
+        run()
+        runs.append(time.perf_counter() - start)
+
+    return BenchmarkResult(benchmark.name, benchmark.group, runs)
+
+def run_all(benchmarks: Sequence[Benchmark], pattern: str = "*", repeat: Optional[int] = None, verbose: bool = True) -> List[BenchmarkResult]:
+    results = []
+    for benchmark in benchmarks:
+        if not fnmatch.fnmatch(benchmark.name, pattern) and not fnmatch.fnmatch(benchmark.group, pattern):
+            continue
+
+        result = run_benchmark(benchmark, repeat)
+        results.append(result)
+
+        if verbose:
+            print(f"{result.group:>8} {result.name:<28} median {result.median * 1000:>10.3f} ms  best {result.best * 1000:>10.3f} ms")
+
+    return results
+
+def results_to_json(results: Sequence[BenchmarkResult]) -> Dict[str, Any]:
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "results": {result.name: result.to_json() for result in results}
+    }
+
+def compare(results: Sequence[BenchmarkResult], baseline: Dict[str, Any]) -> List[Comparison]:
+    """Compare the median of every result with the same benchmark in the baseline, when it has one."""
+    stored = baseline.get("results", {})
+    return [
+        Comparison(result.name, stored[result.name]["median"], result.median)
+        for result in results if result.name in stored
+    ]
+
+def regressions(comparisons: Sequence[Comparison], threshold: float) -> List[Comparison]:
+    return [comparison for comparison in comparisons if comparison.ratio > 1 + threshold]
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark EPIS workloads.")
+    parser.add_argument("--filter", default="*", help="only run benchmarks whose name or group matches this pattern")
+    parser.add_argument("--repeat", type=int, default=None, help="timed runs of every benchmark")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare against the results stored in this file")
+    parser.add_argument("--threshold", type=float, default=0.10, help="slowdown, as a fraction, that counts as a regression")
+    parser.add_argument("--save-baseline", help="store the results as a new baseline in this file")
+    args = parser.parse_args(argv)
+
+    from .workloads import benchmarks
+
+    results = run_all(benchmarks(), args.filter, args.repeat)
+    data = results_to_json(results)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    comparisons = compare(results, baseline)
+    print()
+    for comparison in comparisons:
+        print(f"{comparison.name:<28} {comparison.baseline * 1000:>10.3f} ms -> {comparison.current * 1000:>10.3f} ms  x{comparison.ratio:.2f}")
+
+    failed = regressions(comparisons, args.threshold)
+    if failed:
+        print(f"\n{len(failed)} benchmark(s) regressed by more than {args.threshold:.0%}: " + ", ".join(c.name for c in failed))
+        return 1
+
+    return 0
@@ -0,0 +1,57 @@
+"""
+Report the memory kept alive by parsed programs: the tracemalloc bytes of the instructions of 'standard/*.txt', parsed
+once and parsed many times over.
+
+Run it from the root of the repository with 'python -m benchmarks.memory'.
+"""
+
+from typing import List, Sequence, Optional, Any
+import tracemalloc
+import argparse
+import glob
+import gc
+
+from Interpreter.premade.standard import create_standard_interpreter
+
+def read_sources(pattern: str) -> List[str]:
+    sources = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, "r", encoding="utf-8") as f:
+            sources.append(f.read())
+    return sources
+
+def parsed_bytes(sources: Sequence[str], copies: int) -> int:
+    """The bytes allocated, and still alive, after parsing every source 'copies' times."""
+    parser = create_standard_interpreter().parser
+    kept: List[Any] = []
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(copies):
+            kept.extend(parser.parse(source) for source in sources)
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.memory", description="Report the memory of parsed programs.")
+    parser.add_argument("--pattern", default="standard/*.txt", help="the programs to parse")
+    parser.add_argument("--copies", type=int, nargs="+", default=[1, 20], help="times every program is parsed")
+    args = parser.parse_args(argv)
+
+    sources = read_sources(args.pattern)
+    if not sources:
+        parser.error(f"no programs match '{args.pattern}'")
+
+    print(f"{'copies':<8} {'total':>12} {'per copy':>12}")
+    for copies in args.copies:
+        size = parsed_bytes(sources, copies)
+        print(f"{copies:<8} {size / 1024:>8.1f} KiB {size / copies / 1024:>8.1f} KiB")
+
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
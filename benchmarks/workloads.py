@@ -0,0 +1,160 @@
+"""The benchmarked workloads: one per premade resolver, the parser on generated sources, and programs using 'standard/'."""
+
+from typing import Dict, List, Callable, Optional, Any
+
+from Interpreter.core import Runtime
+from Interpreter.utils import set_memory
+from Interpreter.premade.standard import create_standard_interpreter
+from Interpreter.premade.ffi import py_to_vm
+from Interpreter.premade.arrays import NumericArray, create_array
+
+from .harness import Benchmark
+
+def repeated(statement: str, count: int) -> str:
+    return "\n".join([statement] * count)
+
+def program(source: str, prelude: str = "", bindings: Optional[Callable[[Runtime], None]] = None) -> Callable[[], Callable[[], Any]]:
+    """
+    Set up a benchmark timing one execution of the source. The prelude runs once, untimed, and the source runs in a
+    fork of its runtime every time, so state from one run does not leak into the next.
+    """
+    def setup() -> Callable[[], Any]:
+        interpreter = create_standard_interpreter()
+        base = interpreter.execute(prelude)
+        if bindings:
+            bindings(base)
+
+        instructions = interpreter.parser.parse(source)
+
+        def run() -> Any:
+            return interpreter.execute_instructions(instructions, runtime=base.fork())
+        return run
+    return setup
+
+def parse(source: str) -> Callable[[], Callable[[], Any]]:
+    def setup() -> Callable[[], Any]:
+        interpreter = create_standard_interpreter()
+        return lambda: interpreter.parser.parse(source)
+    return setup
+
+def generated_source(functions: int) -> str:
+    """A large program of functions with nested control flow, for parsing."""
+    parts = []
+    for i in range(functions):
+        parts.append(f"""
+func, generated_{i}, dest, value;
+    // Generated function number {i};
+    set, total, int, 0;
+    set, n, int, 0;
+    while, n, lesser, value;
+        if, n, greater, {i};
+            math, total, total, plus, n;
+        end, if;
+        math, n, n, plus, 1;
+    end, while;
+    call, strings.create_format, 'fmt', 'value {{}}';
+    return, dest, total;
+end, func;""")
+    return "\n".join(parts)
+
+def batch(source: str, records: List[Dict[str, Any]], columnar: bool = True) -> Callable[[], Callable[[], Any]]:
+    """Set up a benchmark running the source once for every record, a column at a time or record by record."""
+    def setup() -> Callable[[], Any]:
+        interpreter = create_standard_interpreter()
+        if not columnar:
+            interpreter.batch_executor = None
+
+        instructions = interpreter.parser.parse(source)
+        return lambda: interpreter.execute_batch(instructions, records)
+    return setup
+
+def bind_range(name: str, count: int) -> Callable[[Runtime], None]:
+    def bind(runtime: Runtime) -> None:
+        set_memory(runtime, name, py_to_vm(list(range(count)), runtime))
+    return bind
+
+def bind_array(name: str, count: int) -> Callable[[Runtime], None]:
+    def bind(runtime: Runtime) -> None:
+        set_memory(runtime, name, create_array(NumericArray.from_values(range(count)), runtime))
+    return bind
+
+def bind_dict_lists(count: int) -> Callable[[Runtime], None]:
+    def bind(runtime: Runtime) -> None:
+        set_memory(runtime, "keys", py_to_vm([f"key{i}" for i in range(count)], runtime))
+        set_memory(runtime, "values", py_to_vm(list(range(count)), runtime))
+    return bind
+
+def class_hierarchy(depth: int) -> str:
+    classes = ["class, Level0;\n    func, init, self, value;\n        set, self, value, value;\n    end, func;\n    func, get, self, dest;\n        return, dest, self.value;\n    end, func;\nend, class;"]
+    for i in range(1, depth):
+        classes.append(f"class, Level{i}, Level{i - 1};\n    func, level_{i}, self;\n        set, self, level, {i};\n    end, func;\nend, class;")
+    return "\n".join(classes)
+
+STANDARD = "import, 'standard/.txt';"
+
+PRICING = "math, total, price, times, quantity;\nset, discount, 0;\nif, total, greater, 100;\n    math, discount, total, times, 0.1;\nend, if;\nmath, due, total, minus, discount;"
+
+ORDERS = [{"price": i % 50 + 1, "quantity": i % 7 + 1} for i in range(10000)]
+
+FIB = "func, fib, dest, n;\n    set, r, n;\n    if, n, not, lesser, 2;\n        math, a, n, minus, 1;\n        math, b, n, minus, 2;\n        call, fib, 'x', a;\n        call, fib, 'y', b;\n        math, r, x, plus, y;\n    end, if;\n    return, dest, r;\nend, func;"
+
+def benchmarks() -> List[Benchmark]:
+    return [
+        # Micro benchmarks, one statement repeated so the loop itself is not measured.
+        Benchmark("set", "micro", program(repeated("set, x, int, 5;", 1000))),
+        Benchmark("math", "micro", program(repeated("math, x, x, plus, 1;", 1000), "set, x, 0;")),
+        Benchmark("call", "micro", program(
+            repeated("call, f, 'r', 1;", 1000), "func, f, dest, v;\n    return, dest, v;\nend, func;"
+        )),
+        Benchmark("init", "micro", program(
+            repeated("init, Point, p, 1, 2;", 500),
+            "class, Point;\n    func, init, self, x, y;\n        set, self, x, x;\n        set, self, y, y;\n    end, func;\nend, class;"
+        )),
+        Benchmark("if", "micro", program(repeated("if, x, equal, 5;\n    set, y, 1;\nend, if;", 1000), "set, x, 5;")),
+        Benchmark("while", "micro", program(
+            "set, n, 0;\nwhile, n, lesser, 1000;\n    math, n, n, plus, 1;\nend, while;"
+        )),
+        Benchmark("import", "micro", program(repeated(STANDARD, 1000), STANDARD)),
+        Benchmark("pyimport", "micro", program(repeated("pyimport, m, math;", 20))),
+        Benchmark("ffi_call", "micro", program(repeated("call, m.sqrt, r, 16;", 1000), "pyimport, m, math;")),
+
+        # Parser benchmarks on generated sources.
+        Benchmark("parse_small", "parser", parse(generated_source(50))),
+        Benchmark("parse_large", "parser", parse(generated_source(1000)), repeat=3),
+
+        # Macro workloads over the standard library.
+        Benchmark("counter_iterate", "macro", program(
+            "init, counter_lib.Iterator, it, 2000;\ncall, it.iterate, visit;",
+            STANDARD + "\nfunc, visit, i;\n    set, last, i;\nend, func;"
+        ), repeat=3),
+        Benchmark("dict_build", "macro", program(
+            "call, iterables.create_empty_dict, 'd';\nset, n, 0;\nwhile, n, lesser, 500;\n    call, d.set, n, n;\n    math, n, n, plus, 1;\nend, while;",
+            STANDARD
+        ), repeat=3),
+        Benchmark("dict_iterate_10k", "macro", program(
+            "init, iterables.Dict, d, keys, values;\ncall, d.iterate_items, visit;",
+            STANDARD + "\nfunc, visit, key, value;\n    set, last, value;\nend, func;",
+            bind_dict_lists(10000)
+        ), repeat=3),
+        Benchmark("list_iterate_10k", "macro", program(
+            "init, iterables.List, l, *items.items;\ncall, l.iterate, visit;",
+            STANDARD + "\nfunc, visit, value;\n    set, last, value;\nend, func;",
+            bind_range("items", 10000)
+        ), repeat=3),
+        Benchmark("class_hierarchy", "macro", program(
+            "set, n, 0;\nwhile, n, lesser, 200;\n    init, Level29, obj, n;\n    call, obj.get, 'v';\n    math, n, n, plus, 1;\nend, while;",
+            class_hierarchy(30)
+        ), repeat=3),
+        Benchmark("recursion", "macro", program("call, fib, 'out', 14;", FIB), repeat=3),
+        Benchmark("recursion_memo", "macro", program("forget, fib;\ncall, fib, 'out', 14;", FIB + "\nmemo, fib;"), repeat=3),
+        Benchmark("array_math_100k", "macro", program(
+            "math, scaled, readings, times, 1.5;\nmath, shifted, scaled, minus, 2;\nmath, total, sum, shifted;\nmath, peak, max, shifted;",
+            bindings=bind_array("readings", 100000)
+        ), repeat=3),
+        Benchmark("batch_rows_10k", "macro", batch(PRICING, ORDERS, False), repeat=3),
+        Benchmark("batch_columns_10k", "macro", batch(PRICING, ORDERS), repeat=3),
+        Benchmark("strings_format", "macro", program(
+            repeated("call, fmt, text, 'a', 1;", 1000),
+            STANDARD + "\ncall, strings.create_format, 'fmt', '{} is {}';"
+        ))
+    ]
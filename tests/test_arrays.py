@@ -0,0 +1,80 @@
+import unittest
+from unittest import mock
+
+from Interpreter.exceptions import ExecutionFailed, ResolutionError
+from Interpreter.premade import arrays
+from Interpreter.premade.standard import create_standard_interpreter
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LEFT = [-7.0, 2.0, 3.5, 9.0]
+RIGHT = [3.0, 4.0, 0.5, 2.0]
+
+EXPECTED = {
+    "plus": lambda a, b: a + b,
+    "minus": lambda a, b: a - b,
+    "times": lambda a, b: a * b,
+    "divide": lambda a, b: a / b,
+    "power": lambda a, b: a ** b,
+    "modolo": lambda a, b: a % b
+}
+
+def numbers(values) -> str:
+    return ", ".join(str(value) for value in values)
+
+class FallbackArrayTest(unittest.TestCase):
+    """Arrays of 'array.array', which are used when numpy is not installed. The numpy test runs the same cases."""
+
+    backend = None
+
+    def setUp(self) -> None:
+        patch = mock.patch.object(arrays, "numpy", self.backend)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.interpreter = create_standard_interpreter()
+
+    def execute(self, code: str):
+        return self.interpreter.execute(f"array, a, {numbers(LEFT)};\narray, b, {numbers(RIGHT)};\n{code}")
+
+    def values(self, runtime, name: str) -> list:
+        # Rounded, as numpy may compute powers with another rounding than python.
+        return [round(value, 9) for value in arrays.array_data(runtime.memory[name].value)]
+
+    def test_backend(self) -> None:
+        runtime = self.execute("")
+        data = arrays.array_data(runtime.memory["a"].value).data
+        self.assertIsInstance(data, arrays.array if self.backend is None else numpy.ndarray)
+
+    def test_elementwise_operations(self) -> None:
+        for op, func in EXPECTED.items():
+            with self.subTest(op=op):
+                runtime = self.execute(f"math, both, a, {op}, b;\nmath, right, a, {op}, 2;\nmath, left, 2, {op}, b;")
+                self.assertEqual(self.values(runtime, "both"), [round(func(x, y), 9) for x, y in zip(LEFT, RIGHT)])
+                self.assertEqual(self.values(runtime, "right"), [round(func(x, 2), 9) for x in LEFT])
+                self.assertEqual(self.values(runtime, "left"), [round(func(2, y), 9) for y in RIGHT])
+
+    def test_length_mismatch(self) -> None:
+        with self.assertRaises(ExecutionFailed) as caught:
+            self.execute("array, short, 1, 2;\nmath, c, a, plus, short;")
+        self.assertIsInstance(caught.exception.__cause__, ResolutionError)
+
+    def test_divide_by_zero(self) -> None:
+        for code in ("math, c, a, divide, 0;", "array, zeros, 0, 0, 0, 0;\nmath, c, a, modolo, zeros;"):
+            with self.subTest(code=code):
+                with self.assertRaises(ExecutionFailed) as caught:
+                    self.execute(code)
+                self.assertIsInstance(caught.exception.__cause__, ResolutionError)
+
+    def test_reductions(self) -> None:
+        runtime = self.execute("math, s, sum, a, b;\nmath, low, min, a, b;\nmath, high, max, a, 10;\nmath, size, abs, a;")
+        self.assertEqual(runtime.memory["s"].value, sum(LEFT) + sum(RIGHT))
+        self.assertEqual(runtime.memory["low"].value, -7.0)
+        self.assertEqual(runtime.memory["high"].value, 10)
+        self.assertEqual(runtime.memory["size"].value, abs(sum(LEFT)))
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class NumpyArrayTest(FallbackArrayTest):
+    backend = numpy
@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import unittest
+
+from Interpreter.core import Runtime, ExecutionContext
+from Interpreter.exceptions import ResourceExhausted
+from Interpreter.utils import set_memory
+from Interpreter.premade.asynchronous import create_async_interpreter
+from Interpreter.premade.ffi import PyFunction
+from Interpreter.premade.governor import ResourceLimits, Governor
+
+class AsyncInterpreterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter = create_async_interpreter()
+
+    def runtime(self, **functions) -> Runtime:
+        runtime = Runtime(None, file="<code>")
+        for name, func in functions.items():
+            set_memory(runtime, name, PyFunction(func))
+        return runtime
+
+    def execute(self, code: str, **functions) -> Runtime:
+        return asyncio.run(self.interpreter.execute_async(code, self.runtime(**functions)))
+
+    def test_await_coroutine_function(self) -> None:
+        async def double(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        runtime = self.execute("await, result, double, 21;", double=double)
+        self.assertEqual(runtime.memory["result"].value, 42)
+
+    def test_await_blocking_function_runs_in_a_thread(self) -> None:
+        loop_thread = threading.get_ident()
+        runtime = self.execute("await, thread, current;", current=threading.get_ident)
+        self.assertNotEqual(runtime.memory["thread"].value, loop_thread)
+
+    def test_concurrent_runs_on_one_loop(self) -> None:
+        arrived = 0
+        both = asyncio.Event()
+
+        async def meet(value):
+            # Only returns once both runs are waiting here, so the runs must be interleaved on the loop.
+            nonlocal arrived
+            arrived += 1
+            if arrived == 2:
+                both.set()
+            await both.wait()
+            return value
+
+        async def main():
+            tasks = [
+                self.interpreter.create_task(self.interpreter.execute_async(f"await, x, meet, {i};", self.runtime(meet=meet)))
+                for i in range(2)
+            ]
+            return await asyncio.wait_for(asyncio.gather(*tasks), 5)
+
+        runtimes = asyncio.run(main())
+        self.assertEqual([runtime.memory["x"].value for runtime in runtimes], [0, 1])
+
+    def test_try_does_not_catch_exhausted_resources(self) -> None:
+        code = (
+            "func, failure, e;\n"
+            "    set, caught, true;\n"
+            "end, func;\n"
+            "try, failure;\n"
+            "    set, n, 0;\n"
+            "    while, n, lesser, 1000;\n"
+            "        math, n, n, plus, 1;\n"
+            "    end, while;\n"
+            "end, try;"
+        )
+        runtime = self.runtime()
+
+        async def main():
+            with self.interpreter.execution(ExecutionContext(monitor=Governor(ResourceLimits(instructions=50)))):
+                await self.interpreter.execute_async(code, runtime)
+
+        with self.assertRaises(ResourceExhausted):
+            asyncio.run(main())
+        self.assertNotIn("caught", runtime.memory)
+
+    def test_call_native_method(self) -> None:
+        runtime = self.execute("set, m, dict;\ncall, m.set, 'k', 5;\ncall, m.get, v, 'k';")
+        self.assertEqual(runtime.memory["v"].value, 5)
+
+    def test_call_generator(self) -> None:
+        runtime = self.execute(
+            "func, count;\n"
+            "    yield, 1;\n"
+            "    yield, 2;\n"
+            "end, func;\n"
+            "call, count, numbers;\n"
+            "set, total, 0;\n"
+            "for, n, numbers;\n"
+            "    math, total, total, plus, n;\n"
+            "end, for;"
+        )
+        self.assertEqual(runtime.memory["total"].value, 3)
+
+    def test_call_memoized(self) -> None:
+        runtime = self.execute(
+            "func, square, dest, a;\n"
+            "    math, result, a, times, a;\n"
+            "    return, dest, result;\n"
+            "end, func;\n"
+            "memo, square;\n"
+            "call, square, first, 3;\n"
+            "call, square, second, 3;"
+        )
+        self.assertEqual((runtime.memory["first"].value, runtime.memory["second"].value), (9, 9))
+
+        memo = runtime.memory["square"].value.memo
+        self.assertEqual((memo.hits, memo.misses), (1, 1))
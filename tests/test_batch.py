@@ -0,0 +1,37 @@
+import unittest
+from unittest import mock
+
+from Interpreter.exceptions import ExecutionFailed
+from Interpreter.premade.standard import create_standard_interpreter
+from Interpreter.premade import columns
+
+PROGRAM = "math, total, price, times, quantity;\nif, total, greater, 10;\n    set, label, 'big';\nend, if;"
+
+class BatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter = create_standard_interpreter()
+
+    def test_columnar_and_record_by_record_agree(self) -> None:
+        records = [{"price": 2, "quantity": 3}, {"price": 5, "quantity": 4}]
+        columnar = self.interpreter.execute_batch(PROGRAM, records)
+
+        self.interpreter.batch_executor = None
+        rows = self.interpreter.execute_batch(PROGRAM, records)
+
+        self.assertTrue(columnar.columnar)
+        self.assertFalse(rows.columnar)
+        self.assertEqual(columnar.columns, rows.columns)
+        self.assertEqual(columnar.columns["label"], [None, "big"])
+
+    def test_value_errors_are_reported_by_the_record(self) -> None:
+        with self.assertRaises(ExecutionFailed) as raised:
+            self.interpreter.execute_batch("math, q, a, divide, b;", [{"a": 1, "b": 0}])
+        self.assertIsInstance(raised.exception.__cause__, ZeroDivisionError)
+
+    def test_other_errors_are_not_hidden(self) -> None:
+        def broken(interpreter, frame, args):
+            raise RuntimeError("broken resolution")
+
+        with mock.patch.dict(columns.column_resolutions, {"set": broken}):
+            with self.assertRaises(RuntimeError):
+                self.interpreter.execute_batch("set, x, 1;", [{"a": 1}])
@@ -0,0 +1,37 @@
+import threading
+import time
+import unittest
+
+from Interpreter.premade.standard import create_standard_interpreter
+
+LOOP = "set, n, 0;\nwhile, n, lesser, 3000000;\n    math, n, n, plus, 1;\nend, while;"
+
+class StopTest(unittest.TestCase):
+    def test_stop_from_another_thread(self) -> None:
+        interpreter = create_standard_interpreter()
+        watchdog = threading.Timer(0.2, interpreter.stop)
+        watchdog.start()
+
+        started = time.monotonic()
+        runtime = interpreter.execute(LOOP)
+        watchdog.join()
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertLess(runtime.memory["n"].value, 3000000)
+        self.assertTrue(interpreter.stopped)
+
+    def test_stop_reaches_runs_on_other_threads(self) -> None:
+        interpreter = create_standard_interpreter()
+        results = {}
+
+        def run() -> None:
+            results["n"] = interpreter.execute(LOOP).memory["n"].value
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        time.sleep(0.2)
+        interpreter.stop()
+        worker.join(5)
+
+        self.assertFalse(worker.is_alive())
+        self.assertLess(results["n"], 3000000)
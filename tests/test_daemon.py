@@ -0,0 +1,135 @@
+import io
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from unittest import mock
+
+from Interpreter.premade.daemon import InterpreterService, InterpreterServer, RunRequest
+from Interpreter.premade import client
+
+SET_IMPORTED = "import, 'standard/.txt';\nset, create_empty_list, int, 5;\nset, strings, create_format, 6;"
+READ_IMPORTED = (
+    "import, 'standard/.txt';\n"
+    "set, replaced, false;\n"
+    "if, create_empty_list, equal, 5;\n"
+    "    set, replaced, true;\n"
+    "end, if;\n"
+    "if, strings.create_format, equal, 6;\n"
+    "    set, replaced, true;\n"
+    "end, if;"
+)
+
+class InterpreterServiceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.service = InterpreterService(workers=4)
+
+    def test_runs_do_not_share_imported_bindings(self) -> None:
+        self.assertTrue(self.service.run(RunRequest(source=SET_IMPORTED)).ok)
+
+        response = self.service.run(RunRequest(source=READ_IMPORTED))
+        self.assertTrue(response.ok, response.error)
+        self.assertIs(response.exports["replaced"], False)
+
+    def test_concurrent_runs_do_not_share_imported_bindings(self) -> None:
+        requests = [RunRequest(source=SET_IMPORTED if i % 2 else READ_IMPORTED) for i in range(16)]
+        with ThreadPoolExecutor(4) as executor:
+            responses = list(executor.map(self.service.run, requests))
+
+        self.assertTrue(all(response.ok for response in responses))
+        self.assertFalse(any(response.exports["replaced"] for response in responses[::2]))
+
+class InterpreterServerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "epis.sock")
+        self.service = InterpreterService(modules=())
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_stale_sockets_are_replaced(self) -> None:
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(self.path)
+        stale.close()
+
+        with InterpreterServer(self.path, self.service):
+            self.assertTrue(os.path.exists(self.path))
+
+    def test_sockets_of_running_servers_are_kept(self) -> None:
+        with InterpreterServer(self.path, self.service):
+            with self.assertRaises(OSError):
+                InterpreterServer(self.path, self.service)
+            self.assertTrue(os.path.exists(self.path))
+
+    def test_other_files_are_kept(self) -> None:
+        with open(self.path, "w") as f:
+            f.write("not a socket")
+
+        with self.assertRaises(OSError):
+            InterpreterServer(self.path, self.service)
+        with open(self.path) as f:
+            self.assertEqual(f.read(), "not a socket")
+
+class ModuleRefreshTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.module = os.path.join(self.directory.name, "module.txt")
+        self.write_module("1")
+        self.service = InterpreterService(modules=(self.module,))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write_module(self, value: str) -> None:
+        with open(self.module, "w", encoding="utf-8") as f:
+            f.write(f"set, value, int, {value};")
+
+    def read_value(self):
+        response = self.service.run(RunRequest(source=f"import, '{self.module}', module;\nset, value, module.value;"))
+        self.assertTrue(response.ok, response.error)
+        return response.exports["value"]
+
+    def test_changed_modules_are_imported_again(self) -> None:
+        self.assertEqual(self.read_value(), 1)
+
+        self.write_module("22")
+        self.assertEqual(self.read_value(), 22)
+
+    def test_unchanged_modules_are_kept(self) -> None:
+        runtime = self.service.interpreter.modules[self.module]
+        self.read_value()
+        self.assertIs(self.service.interpreter.modules[self.module], runtime)
+
+class ClientTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "epis.sock")
+        self.program = os.path.join(self.directory.name, "echo.txt")
+        with open(self.program, "w", encoding="utf-8") as f:
+            f.write("input, line, '';\nprint, line;")
+
+        self.server = InterpreterServer(self.path, InterpreterService(modules=()))
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.directory.cleanup()
+
+    def run_client(self, stdin: str, *args: str) -> str:
+        output = io.StringIO()
+        with mock.patch("sys.stdin", io.StringIO(stdin)), redirect_stdout(output):
+            self.assertEqual(client.main(["--socket", self.path, "run", *args]), 0)
+        return output.getvalue()
+
+    def test_piped_stdin_is_the_input(self) -> None:
+        self.assertEqual(self.run_client("piped\n", self.program), "piped\n")
+
+    def test_input_from_stdin(self) -> None:
+        self.assertEqual(self.run_client("given\n", self.program, "--input", "-"), "given\n")
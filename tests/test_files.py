@@ -0,0 +1,67 @@
+import os
+import tempfile
+import unittest
+
+from Interpreter.exceptions import ResolutionError
+from Interpreter.premade.files import FileReader
+from Interpreter.premade.standard import create_standard_interpreter
+
+TEXT = "first line\r\nsecond ✓ line\nthird — line"
+
+class FileReaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "text.txt")
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write(TEXT)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_map_and_buffered_read_the_same_lines(self) -> None:
+        for mode in ("map", "buffered"):
+            with self.subTest(mode=mode):
+                with FileReader(self.path, mode) as reader:
+                    self.assertEqual(reader.mode, mode)
+                    self.assertEqual(list(reader.lines()), ["first line", "second ✓ line", "third — line"])
+
+    def test_chunks_split_inside_characters(self) -> None:
+        for mode in ("map", "buffered"):
+            with self.subTest(mode=mode):
+                with FileReader(self.path, mode) as reader:
+                    chunks = list(reader.chunks(1))
+                self.assertEqual("".join(chunks), TEXT)
+                self.assertNotIn("�", "".join(chunks))
+
+    def test_lines_after_a_chunk_ending_inside_a_character(self) -> None:
+        # The chunk ends after the first of the three bytes of '✓'.
+        prefix = len("first line\r\nsecond ".encode("utf-8")) + 1
+        with FileReader(self.path, "buffered") as reader:
+            self.assertEqual(reader.read_chunk(prefix), "first line\r\nsecond ")
+            self.assertEqual(reader.read_line(), "✓ line")
+            self.assertEqual(reader.read_line(), "third — line")
+            self.assertIsNone(reader.read_line())
+
+    def test_iterating_closes_the_file(self) -> None:
+        reader = FileReader(self.path)
+        list(reader.lines())
+        self.assertTrue(reader.closed)
+        with self.assertRaises(ResolutionError):
+            reader.read_line()
+
+        reader = FileReader(self.path)
+        list(reader.chunks(4))
+        self.assertTrue(reader.closed)
+
+    def test_for_over_a_file(self) -> None:
+        runtime = create_standard_interpreter().execute(
+            f"open, fh, '{self.path}';\n"
+            "set, count, 0;\n"
+            "for, line, fh;\n"
+            "    math, count, count, plus, 1;\n"
+            "    set, last, line;\n"
+            "end, for;"
+        )
+        self.assertEqual(runtime.memory["count"].value, 3)
+        self.assertEqual(runtime.memory["last"].value, "third — line")
+        self.assertTrue(runtime.memory["fh"].value.memory["reader"].value.closed)
@@ -0,0 +1,46 @@
+import unittest
+
+from Interpreter.premade.standard import create_standard_interpreter
+
+BASE = """
+set, rate, int, 1;
+func, price, dest, amount;
+    math, total, amount, times, rate;
+    return, dest, total;
+end, func;
+func, double_price, dest, amount;
+    call, price, 'inner', amount;
+    math, doubled, inner, times, 2;
+    return, dest, doubled;
+end, func;
+"""
+
+class ForkTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter = create_standard_interpreter()
+        self.base = self.interpreter.execute(BASE)
+
+    def run_fork(self, code: str, base=None):
+        return self.interpreter.execute(code, runtime=(base or self.base).fork())
+
+    def test_functions_of_the_base_see_writes_of_the_fork(self) -> None:
+        fork = self.run_fork("set, rate, int, 10;\ncall, price, 'p', 3;")
+        self.assertEqual(fork.memory["p"].value, 30)
+
+    def test_nested_calls_run_in_the_fork(self) -> None:
+        fork = self.run_fork("set, rate, int, 10;\ncall, double_price, 'p', 3;")
+        self.assertEqual(fork.memory["p"].value, 60)
+
+    def test_forks_of_forks(self) -> None:
+        middle = self.run_fork("set, rate, int, 5;")
+        fork = self.run_fork("call, price, 'p', 3;", middle)
+        self.assertEqual(fork.memory["p"].value, 15)
+
+    def test_forks_do_not_change_the_base(self) -> None:
+        self.run_fork("set, rate, int, 10;\ncall, price, 'p', 3;")
+        base = self.interpreter.execute("call, price, 'p', 3;", runtime=self.base)
+        self.assertEqual(base.memory["p"].value, 3)
+        self.assertEqual(self.base.memory["rate"].value, 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from Interpreter.premade.standard import create_standard_interpreter
+
+class GeneratorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter = create_standard_interpreter()
+
+    def test_return_in_blocks_stays_in_the_generator(self) -> None:
+        runtime = self.interpreter.execute(
+            "func, count;\n"
+            "    set, i, 0;\n"
+            "    while, i, lesser, 3;\n"
+            "        yield, i;\n"
+            "        math, i, i, plus, 1;\n"
+            "        if, i, equal, 2;\n"
+            "            return, 'leaked', i;\n"
+            "        end, if;\n"
+            "    end, while;\n"
+            "end, func;\n"
+            "call, count, numbers;\n"
+            "set, total, 0;\n"
+            "for, n, numbers;\n"
+            "    math, total, total, plus, n;\n"
+            "end, for;"
+        )
+        self.assertEqual(runtime.memory["total"].value, 3)
+        self.assertNotIn("leaked", runtime.memory)
@@ -0,0 +1,29 @@
+import tracemalloc
+import unittest
+
+from Interpreter.premade.governor import ResourceLimits, Governor
+
+class GovernorTest(unittest.TestCase):
+    def test_tracing_stops_with_the_last_governor(self) -> None:
+        self.assertFalse(tracemalloc.is_tracing())
+
+        first = Governor(ResourceLimits(memory=1 << 30))
+        second = Governor(ResourceLimits(memory=1 << 30))
+        first.start()
+        second.start()
+
+        first.finish()
+        self.assertTrue(tracemalloc.is_tracing())
+
+        second.finish()
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_tracing_started_elsewhere_is_left_running(self) -> None:
+        tracemalloc.start()
+        try:
+            governor = Governor(ResourceLimits(memory=1 << 30))
+            governor.start()
+            governor.finish()
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
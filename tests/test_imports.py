@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from Interpreter.premade.standard import create_standard_interpreter
+from Interpreter.premade.pool import WorkerPool, Job, warm_interpreter, run_job
+
+SET_IMPORTED = "import, 'standard/.txt';\nset, create_empty_list, int, 5;\nset, strings, create_format, 6;"
+READ_IMPORTED = """import, 'standard/.txt';
+set, unaliased, bool, false;
+set, aliased, bool, false;
+if, create_empty_list, equal, 5;
+    set, unaliased, bool, true;
+end, if;
+if, strings.create_format, equal, 6;
+    set, aliased, bool, true;
+end, if;"""
+COUNTER = "set, count, 0;\nfunc, get, dest;\n    return, dest, count;\nend, func;"
+
+class ImportIsolationTest(unittest.TestCase):
+    def test_executions_do_not_share_bindings(self) -> None:
+        interpreter = create_standard_interpreter()
+        with interpreter.execution():
+            interpreter.execute(SET_IMPORTED)
+        with interpreter.execution():
+            runtime = interpreter.execute(READ_IMPORTED)
+        
+        self.assertFalse(runtime.memory["unaliased"].value)
+        self.assertFalse(runtime.memory["aliased"].value)
+
+    def test_imports_are_shared_within_an_execution(self) -> None:
+        interpreter = create_standard_interpreter()
+        runtime = interpreter.execute(
+            "import, 'standard/.txt';\nset, strings, marker, 1;\nimport, 'standard/strings.txt', again;\nset, seen, again.marker;"
+        )
+        self.assertEqual(runtime.memory["seen"].value, 1)
+
+    def test_module_functions_see_writes_to_their_module(self) -> None:
+        interpreter = create_standard_interpreter()
+        runtime = interpreter.execute(
+            "import, 'standard/.txt';\ncall, iterables.create_empty_dict, 'd';\ncall, d.set, 'k', 2;\ncall, d.get, 'v', 'k';"
+        )
+        self.assertEqual(runtime.memory["v"].value, 2)
+
+    def test_module_functions_read_the_bindings_of_the_job(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "counter.txt")
+            with open(path, "w") as f:
+                f.write(COUNTER)
+            
+            interpreter = warm_interpreter([path])
+            first = run_job(interpreter, Job(source=f"import, '{path}', m;\nset, m, count, 5;\ncall, m.get, 'seen';"))
+            second = run_job(interpreter, Job(source=f"import, '{path}', m;\ncall, m.get, 'seen';"))
+        
+        self.assertEqual(first["seen"], 5)
+        self.assertEqual(second["seen"], 0)
+
+    def test_jobs_on_one_worker_do_not_share_bindings(self) -> None:
+        with WorkerPool(size=1) as pool:
+            first, second = pool.map([Job(source=SET_IMPORTED), Job(source=READ_IMPORTED)])
+        
+        self.assertTrue(first.ok, first.error)
+        self.assertTrue(second.ok, second.error)
+        self.assertEqual(first.worker, second.worker)
+        self.assertFalse(second.exports["unaliased"])
+        self.assertFalse(second.exports["aliased"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import sys
+import unittest
+from dataclasses import FrozenInstanceError
+
+from Interpreter.memory import Instruction
+from Interpreter.premade.standard import create_standard_interpreter
+
+def walk(instructions):
+    for inst in instructions:
+        yield inst
+        for arg in inst.args:
+            if isinstance(arg, tuple) and arg and isinstance(arg[0], Instruction):
+                yield from walk(arg)
+            elif hasattr(arg, "instructions"):
+                yield from walk(arg.instructions)
+
+class InstructionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.parser = create_standard_interpreter().parser
+
+    def test_instructions_are_frozen(self) -> None:
+        inst = Instruction("set", ["x", "1"], 1)
+        with self.assertRaises(FrozenInstanceError):
+            inst.token = "print"
+
+    def test_arguments_are_tuples(self) -> None:
+        self.assertEqual(Instruction("set", ["x", "1"], 1).args, ("x", "1"))
+
+        body = self.parser.parse("if, x, equal, 1;\n    set, y, 2;\nend, if;")[0].args[-1]
+        self.assertIsInstance(body, tuple)
+
+    def test_tokens_and_names_are_interned(self) -> None:
+        name = "".join(["coun", "ter"])
+        inst = self.parser.parse(f"set, {name}, 1;")[0]
+        self.assertIs(inst.token, sys.intern("set"))
+        self.assertIs(inst.args[0], sys.intern(name))
+
+    def test_identical_arguments_are_shared(self) -> None:
+        first, second = self.parser.parse("set, y, 2;\nset, y, 2;")
+        self.assertIs(first.args, second.args)
+
+    def test_end_lines_are_dropped(self) -> None:
+        instructions = self.parser.parse(
+            "func, f, x;\n"
+            "    while, x, lesser, 3;\n"
+            "        if, x, equal, 1;\n"
+            "            set, y, 2;\n"
+            "        end, if;\n"
+            "    end, while;\n"
+            "end, func;"
+        )
+        tokens = [inst.token for inst in walk(instructions)]
+        self.assertIn("set", tokens)
+        self.assertNotIn("end", tokens)
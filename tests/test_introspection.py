@@ -0,0 +1,45 @@
+import unittest
+
+from Interpreter.premade.introspection import snapshot_memory, diff_snapshots, tracked
+from Interpreter.premade.standard import create_standard_interpreter
+
+POINT = (
+    "class, Point;\n"
+    "    func, init, self, x;\n"
+    "        set, self, x, x;\n"
+    "    end, func;\n"
+    "end, class;"
+)
+
+class IntrospectionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter = create_standard_interpreter()
+        self.runtime = self.interpreter.execute(POINT)
+
+    def run_code(self, code: str) -> None:
+        self.interpreter.execute_instructions(self.interpreter.parser.parse(code), runtime=self.runtime)
+
+    def test_diff_counts_the_objects_of_a_class(self) -> None:
+        before = snapshot_memory(self.interpreter, {"main": self.runtime})
+        self.run_code("init, Point, a, 1;\ninit, Point, b, 2;\ninit, Point, c, 3;")
+        after = snapshot_memory(self.interpreter, {"main": self.runtime})
+
+        diff = diff_snapshots(before, after)
+        self.assertEqual(diff.objects, {"Point": 3})
+        self.assertEqual(diff.environments, 3)
+        self.assertGreater(diff.roots["main"], 0)
+
+    def test_shared_values_count_for_the_first_root(self) -> None:
+        self.run_code("init, Point, a, 1;")
+        snapshot = snapshot_memory(self.interpreter, {"main": self.runtime, "point": self.runtime.memory["a"].value})
+
+        self.assertEqual(snapshot.objects, {"Point": 1})
+        self.assertEqual(snapshot.roots["point"], 0)
+
+    def test_allocations_are_charged_to_lines(self) -> None:
+        with tracked(self.interpreter) as tracker:
+            self.run_code("set, n, 0;\nwhile, n, lesser, 5;\n    init, Point, p, n;\n    math, n, n, plus, 1;\nend, while;")
+
+        # Line 3 of the class runs in every 'init' on line 3, so the counts of 'math' on line 4 are the ones of the loop.
+        self.assertEqual(tracker.lines[("<code>", 4)].count, 5)
+        self.assertEqual(tracker.lines[("<code>", 3)].count, 10)
@@ -0,0 +1,27 @@
+import io
+import unittest
+
+from Interpreter.core import InterpreterIO
+
+class Terminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+class InterpreterIOTest(unittest.TestCase):
+    def test_terminals_are_line_buffered(self) -> None:
+        output = Terminal()
+        InterpreterIO(output).write("line\n")
+        self.assertEqual(output.getvalue(), "line\n")
+
+    def test_other_outputs_are_block_buffered(self) -> None:
+        output = io.StringIO()
+        streams = InterpreterIO(output)
+        streams.write("line\n")
+        self.assertEqual(output.getvalue(), "")
+        streams.flush()
+        self.assertEqual(output.getvalue(), "line\n")
+
+    def test_line_buffering_can_be_turned_off(self) -> None:
+        output = Terminal()
+        InterpreterIO(output, line_buffering=False).write("line\n")
+        self.assertEqual(output.getvalue(), "")
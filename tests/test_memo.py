@@ -0,0 +1,99 @@
+import gc
+import unittest
+import weakref
+
+from Interpreter.core import Monitor, ExecutionContext
+from Interpreter.utils import Memo
+from Interpreter.premade.standard import create_standard_interpreter
+
+SQUARE = (
+    "set, calls, 0;\n"
+    "set, main, this;\n"
+    "func, square, dest, a, main;\n"
+    "    math, calls, main.calls, plus, 1;\n"
+    "    set, main, calls, calls;\n"
+    "    math, result, a, times, a;\n"
+    "    return, dest, result;\n"
+    "end, func;\n"
+)
+
+class Unhashable:
+    __hash__ = None
+
+class FrameCounter(Monitor):
+    __slots__ = ("frames",)
+
+    def __init__(self) -> None:
+        self.frames = 0
+
+    def enter_frame(self, runtime) -> None:
+        self.frames += 1
+
+class MemoTest(unittest.TestCase):
+    def test_least_recently_used_are_evicted(self) -> None:
+        memo = Memo(2, frozenset())
+        for value in (1, 2):
+            memo.put(memo.key([value]), ((-1, "r", value),))
+
+        self.assertIsNotNone(memo.get(memo.key([1])))
+        memo.put(memo.key([3]), ((-1, "r", 3),))
+
+        self.assertEqual(list(memo.entries), [(1,), (3,)])
+
+    def test_destinations_are_left_out_of_keys(self) -> None:
+        memo = Memo(None, frozenset((0,)))
+        self.assertEqual(memo.key(["first", 4]), memo.key(["second", 4]))
+
+    def test_identity_keys_keep_their_values(self) -> None:
+        memo = Memo(None, frozenset())
+        value = Unhashable()
+        reference = weakref.ref(value)
+        memo.put(memo.key([value]), ())
+
+        del value
+        gc.collect()
+        self.assertIsNotNone(reference())
+        self.assertIsNotNone(memo.get(memo.key([reference()])))
+        self.assertIsNone(memo.get(memo.key([Unhashable()])))
+
+class MemoizedFunctionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter = create_standard_interpreter()
+
+    def test_hits_and_misses(self) -> None:
+        runtime = self.interpreter.execute(
+            SQUARE + "memo, square;\ncall, square, x, 3, main;\ncall, square, y, 3, main;\ncall, square, z, 4, main;"
+        )
+        self.assertEqual([runtime.memory[name].value for name in ("x", "y", "z")], [9, 9, 16])
+        self.assertEqual(runtime.memory["calls"].value, 2)
+
+        memo = runtime.memory["square"].value.memo
+        self.assertEqual((memo.hits, memo.misses), (1, 2))
+
+    def test_calls_beyond_the_size_are_evicted(self) -> None:
+        runtime = self.interpreter.execute(
+            SQUARE + "memo, square, 2;\n"
+            "call, square, x, 1, main;\ncall, square, x, 2, main;\ncall, square, x, 3, main;\ncall, square, x, 1, main;"
+        )
+        self.assertEqual(runtime.memory["calls"].value, 4)
+
+    def test_forget_one_call_or_all(self) -> None:
+        runtime = self.interpreter.execute(
+            SQUARE + "memo, square;\n"
+            "call, square, x, 1, main;\ncall, square, x, 2, main;\n"
+            "forget, square, x, 1, main;\n"
+            "call, square, x, 1, main;\ncall, square, x, 2, main;\n"
+            "set, forgot_one, calls;\n"
+            "forget, square;\n"
+            "call, square, x, 1, main;\ncall, square, x, 2, main;"
+        )
+        self.assertEqual(runtime.memory["forgot_one"].value, 3)
+        self.assertEqual(runtime.memory["calls"].value, 5)
+
+    def test_hits_create_no_frames(self) -> None:
+        counter = FrameCounter()
+        with self.interpreter.execution(ExecutionContext(monitor=counter)):
+            self.interpreter.execute(SQUARE + "memo, square;\ncall, square, x, 3, main;\ncall, square, y, 3, main;")
+
+        # The program and the call that missed.
+        self.assertEqual(counter.frames, 2)
@@ -0,0 +1,83 @@
+import unittest
+
+from Interpreter.premade.standard import create_standard_interpreter
+
+class SetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter = create_standard_interpreter()
+
+    def test_container_types_without_values_are_empty(self) -> None:
+        runtime = self.interpreter.execute("set, d, dict;\nset, xs, list;")
+        self.assertEqual(runtime.memory["d"].value.memory["items"].value, {})
+        self.assertEqual(runtime.memory["xs"].value.memory["items"].value, [])
+
+    def test_variables_named_like_types_are_read(self) -> None:
+        runtime = self.interpreter.execute("set, dict, int, 4;\nset, y, dict;")
+        self.assertEqual(runtime.memory["y"].value, 4)
+
+    def test_standard_empty_dict(self) -> None:
+        runtime = self.interpreter.execute(
+            "import, 'standard/.txt';\ncall, iterables.create_empty_dict, 'd';\ncall, d.set, 'k', 2;"
+        )
+        self.assertEqual(runtime.memory["d"].value.memory["items"].value, {"k": 2})
+
+class HoistTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter = create_standard_interpreter()
+
+    def definition(self, code: str):
+        return self.interpreter.parser.parse(code)[0].args[1]
+
+    def test_names_spelled_like_types_are_captured(self) -> None:
+        runtime = self.interpreter.execute(
+            "func, outer, dest, list;\n"
+            "    func, inner, d;\n"
+            "        return, d, list;\n"
+            "    end, func;\n"
+            "    call, inner, 'x';\n"
+            "    return, dest, x;\n"
+            "end, func;\n"
+            "call, outer, 'y', 5;"
+        )
+        self.assertEqual(runtime.memory["y"].value, 5)
+
+    def test_names_spelled_like_operators_are_captured(self) -> None:
+        func = self.definition(
+            "func, outer, dest, plus;\n"
+            "    func, inner, d;\n"
+            "        math, s, plus, plus, 1;\n"
+            "        return, d, s;\n"
+            "    end, func;\n"
+            "end, func;"
+        )
+        self.assertEqual(func.hoisted, ())
+
+    def test_operators_and_types_do_not_capture(self) -> None:
+        func = self.definition(
+            "func, outer, dest;\n"
+            "    set, xs, list, 1, 2;\n"
+            "    math, n, 1, plus, 2;\n"
+            "    func, inner, d;\n"
+            "        set, ys, list, 3;\n"
+            "        if, 1, equal, 1;\n"
+            "            math, m, 2, plus, 2;\n"
+            "        end, if;\n"
+            "        return, d, ys;\n"
+            "    end, func;\n"
+            "end, func;"
+        )
+        self.assertEqual(len(func.hoisted), 1)
+
+    def test_functions_read_before_their_definition_are_not_hoisted(self) -> None:
+        runtime = self.interpreter.execute(
+            "set, inner, int, 7;\n"
+            "func, outer, dest;\n"
+            "    set, before, inner;\n"
+            "    func, inner, d;\n"
+            "        return, d, 1;\n"
+            "    end, func;\n"
+            "    return, dest, before;\n"
+            "end, func;\n"
+            "call, outer, 'z';"
+        )
+        self.assertEqual(runtime.memory["z"].value, 7)
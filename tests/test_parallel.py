@@ -0,0 +1,57 @@
+import unittest
+
+from Interpreter.premade.standard import create_standard_interpreter
+from Interpreter.premade import parallel
+
+PROGRAM = """
+set, factor, int, 3;
+func, scale, dest, x;
+    math, y, x, times, factor;
+    return, dest, y;
+end, func;
+set, xs, list, 1, 2, 3, 4, 5, 6, 7, 8;
+func, add, dest, a, b;
+    math, total, a, plus, b;
+    return, dest, total;
+end, func;
+parallel_map, ys, scale, xs, 2;
+"""
+
+class ParallelTest(unittest.TestCase):
+    def setUp(self) -> None:
+        parallel.parallel_config.mode = "process"
+        parallel.parallel_config.workers = 2
+
+    def tearDown(self) -> None:
+        parallel.shutdown_executors()
+        parallel.parallel_config.mode = "process"
+        parallel.parallel_config.workers = None
+
+    def run_program(self) -> list:
+        runtime = create_standard_interpreter().execute(PROGRAM)
+        return runtime.memory["ys"].value.memory["items"].value
+
+    def test_map_on_processes(self) -> None:
+        self.assertEqual(self.run_program(), [3, 6, 9, 12, 15, 18, 21, 24])
+        self.assertEqual(len(parallel._process_executors), 1)
+
+    def test_the_same_payload_reuses_its_workers(self) -> None:
+        self.run_program()
+        executor = next(iter(parallel._process_executors.values()))
+        self.assertEqual(self.run_program(), [3, 6, 9, 12, 15, 18, 21, 24])
+        self.assertIs(next(iter(parallel._process_executors.values())), executor)
+
+    def test_functions_run_in_the_fork_they_are_mapped_from(self) -> None:
+        for mode in ("process", "thread"):
+            with self.subTest(mode=mode):
+                parallel.parallel_config.mode = mode
+                interpreter = create_standard_interpreter()
+                base = interpreter.execute(PROGRAM)
+                fork = interpreter.execute(
+                    "set, factor, int, 10;\nparallel_map, ys, scale, xs, 4;\nparallel_reduce, total, add, ys, 0;\ncall, scale, 'c', 1;",
+                    runtime=base.fork()
+                )
+
+                self.assertEqual(fork.memory["c"].value, 10)
+                self.assertEqual(fork.memory["ys"].value.memory["items"].value, [10, 20, 30, 40, 50, 60, 70, 80])
+                self.assertEqual(fork.memory["total"].value, 360)
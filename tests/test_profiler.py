@@ -0,0 +1,69 @@
+import itertools
+import unittest
+
+from Interpreter.premade.profiler import Profiler, profiled
+from Interpreter.premade.standard import create_standard_interpreter
+
+LOOP = (
+    "func, step, dest, n;\n"
+    "    math, r, n, plus, 1;\n"
+    "    return, dest, r;\n"
+    "end, func;\n"
+    "set, n, 0;\n"
+    "while, n, lesser, 3;\n"
+    "    call, step, 'n', n;\n"
+    "end, while;"
+)
+
+FIB = (
+    "func, fib, dest, n;\n"
+    "    set, r, n;\n"
+    "    if, n, not, lesser, 2;\n"
+    "        math, a, n, minus, 1;\n"
+    "        math, b, n, minus, 2;\n"
+    "        call, fib, 'x', a;\n"
+    "        call, fib, 'y', b;\n"
+    "        math, r, x, plus, y;\n"
+    "    end, if;\n"
+    "    return, dest, r;\n"
+    "end, func;\n"
+    "call, fib, result, 6;"
+)
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter = create_standard_interpreter()
+
+        # Every reading of the clock is a microsecond later, so the times do not depend on the machine.
+        ticks = itertools.count(0, 1000)
+        self.profiler = Profiler(clock=lambda: next(ticks))
+
+    def profile(self, code: str) -> Profiler:
+        with profiled(self.interpreter, self.profiler) as profiler:
+            self.interpreter.execute(code)
+        return profiler
+
+    def test_counts(self) -> None:
+        profiler = self.profile(LOOP)
+
+        self.assertEqual(profiler.functions["step (<code>)"].count, 3)
+        self.assertEqual(profiler.functions["<module> (<code>)"].count, 1)
+        self.assertEqual(profiler.tokens["call"].count, 3)
+        self.assertEqual(profiler.tokens["math"].count, 3)
+        self.assertEqual(profiler.lines[("<code>", 7)].count, 3)
+        self.assertEqual(profiler.lines[("<code>", 6)].count, 1)
+
+    def test_collapsed_stacks(self) -> None:
+        stacks = dict(line.rsplit(" ", 1) for line in self.profile(LOOP).collapsed().splitlines())
+
+        self.assertEqual(set(stacks), {"<module>@<code>", "<module>@<code>;step@<code>"})
+        self.assertTrue(all(int(us) > 0 for us in stacks.values()))
+
+    def test_recursive_inclusive_time_is_counted_once(self) -> None:
+        profiler = self.profile(FIB)
+        fib = profiler.functions["fib (<code>)"]
+
+        self.assertEqual(fib.count, 25)
+        self.assertEqual(fib.inclusive, fib.exclusive)
+        self.assertLess(fib.inclusive, profiler.functions["<module> (<code>)"].inclusive)
+        self.assertIn("fib (<code>)", profiler.report())
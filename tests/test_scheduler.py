@@ -0,0 +1,139 @@
+import unittest
+
+from Interpreter.exceptions import Deadlock
+from Interpreter.premade.scheduler import Scheduler
+
+# The producer records how many values it sent on the main runtime, which the main task reads after letting it run.
+PRODUCER = (
+    "set, sent, 0;\n"
+    "set, main, this;\n"
+    "func, produce, c, main;\n"
+    "    send, c, 1;\n"
+    "    set, main, sent, 1;\n"
+    "    send, c, 2;\n"
+    "    set, main, sent, 2;\n"
+    "    send, c, 3;\n"
+    "    set, main, sent, 3;\n"
+    "end, func;\n"
+    "spawn, t, produce, c, main;\n"
+    "yield;\n"
+    "set, seen, sent;\n"
+    "receive, a, c;\n"
+    "receive, b, c;\n"
+    "receive, d, c;"
+)
+
+class ChannelTest(unittest.TestCase):
+    def received(self, runtime) -> list:
+        return [runtime.memory[name].value for name in ("a", "b", "d")]
+
+    def test_bounded_channel_blocks_the_sender(self) -> None:
+        runtime = Scheduler().run("channel, c, 1;\n" + PRODUCER)
+        self.assertEqual(runtime.memory["seen"].value, 1)
+        self.assertEqual(self.received(runtime), [1, 2, 3])
+
+    def test_unbounded_channel_never_blocks_the_sender(self) -> None:
+        runtime = Scheduler().run("channel, c;\n" + PRODUCER)
+        self.assertEqual(runtime.memory["seen"].value, 3)
+        self.assertEqual(self.received(runtime), [1, 2, 3])
+
+class SchedulerTest(unittest.TestCase):
+    def test_join_gives_the_runtime_of_the_task(self) -> None:
+        runtime = Scheduler().run(
+            "func, work, x;\n"
+            "    math, y, x, times, 2;\n"
+            "    return, 'result', y;\n"
+            "end, func;\n"
+            "spawn, t, work, 4;\n"
+            "join, done, t;\n"
+            "set, value, done.result;"
+        )
+        self.assertEqual(runtime.memory["value"].value, 8)
+
+    def test_arguments_named_like_outer_objects(self) -> None:
+        runtime = Scheduler().run(
+            "set, box, this;\n"
+            "func, fill, box;\n"
+            "    set, box, filled, true;\n"
+            "end, func;\n"
+            "spawn, t, fill, box;\n"
+            "join, done, t;"
+        )
+        self.assertIs(runtime.memory["filled"].value, True)
+
+    def test_tasks_waiting_on_each_other_deadlock(self) -> None:
+        with self.assertRaises(Deadlock):
+            Scheduler().run(
+                "channel, a;\n"
+                "channel, b;\n"
+                "func, relay, a, b;\n"
+                "    receive, x, a;\n"
+                "    send, b, x;\n"
+                "end, func;\n"
+                "spawn, t, relay, a, b;\n"
+                "receive, y, b;"
+            )
+
+    def test_busy_tasks_do_not_starve_others(self) -> None:
+        code = (
+            "channel, c;\n"
+            "func, busy, c;\n"
+            "    set, n, 0;\n"
+            "    while, n, lesser, 5000;\n"
+            "        math, n, n, plus, 1;\n"
+            "    end, while;\n"
+            "    send, c, 'busy';\n"
+            "end, func;\n"
+            "func, quick, c;\n"
+            "    send, c, 'quick';\n"
+            "end, func;\n"
+            "spawn, a, busy, c;\n"
+            "spawn, b, quick, c;\n"
+            "receive, first, c;\n"
+            "receive, second, c;"
+        )
+        self.assertEqual(Scheduler(time_slice=100).run(code).memory["first"].value, "quick")
+        self.assertEqual(Scheduler(time_slice=0).run(code).memory["first"].value, "busy")
+
+class YieldTest(unittest.TestCase):
+    """'yield' with a value is the '__yield__' of generator functions, and without one it yields to the scheduler."""
+
+    def test_generators_yield_values_under_a_scheduler(self) -> None:
+        runtime = Scheduler().run(
+            "func, count, n;\n"
+            "    set, i, 0;\n"
+            "    while, i, lesser, n;\n"
+            "        yield, i;\n"
+            "        math, i, i, plus, 1;\n"
+            "    end, while;\n"
+            "end, func;\n"
+            "func, pause;\n"
+            "    yield;\n"
+            "    return, 'paused', true;\n"
+            "end, func;\n"
+            "call, count, numbers, 3;\n"
+            "set, total, 0;\n"
+            "for, x, numbers;\n"
+            "    math, total, total, plus, x;\n"
+            "end, for;\n"
+            "call, pause;"
+        )
+        self.assertEqual(runtime.memory["total"].value, 3)
+        self.assertIs(runtime.memory["paused"].value, True)
+        self.assertFalse(runtime.memory["pause"].value.generator)
+
+    def test_generators_yielding_to_the_scheduler_go_on(self) -> None:
+        runtime = Scheduler().run(
+            "func, numbers;\n"
+            "    yield;\n"
+            "    yield, 1;\n"
+            "    yield;\n"
+            "    yield, 2;\n"
+            "end, func;\n"
+            "call, numbers, xs;\n"
+            "set, total, 0;\n"
+            "for, x, xs;\n"
+            "    math, total, total, plus, x;\n"
+            "end, for;"
+        )
+        self.assertEqual(runtime.memory["total"].value, 3)
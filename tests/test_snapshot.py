@@ -0,0 +1,47 @@
+import unittest
+from unittest import mock
+
+from Interpreter.exceptions import SnapshotError
+from Interpreter.premade import snapshot
+from Interpreter.premade.snapshot import dumps_snapshot, loads_snapshot
+from Interpreter.premade.standard import interpret_file
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.interpreter, self.runtime = interpret_file("standard/.txt")
+
+    def restored(self, code: str):
+        interpreter, runtime = loads_snapshot(dumps_snapshot(self.interpreter, self.runtime))
+        interpreter.execute_instructions(interpreter.parser.parse(code), runtime=runtime)
+        return interpreter, runtime
+
+    def test_round_trip_of_the_standard_library(self) -> None:
+        interpreter, runtime = self.restored(
+            "init, path_lib.Path, p, 'standard';\n"
+            "call, p.isdir, found;"
+        )
+        self.assertIsNot(interpreter, self.interpreter)
+        self.assertIs(runtime.memory["found"].value, True)
+
+    def test_python_modules_are_imported_again(self) -> None:
+        self.interpreter.execute_instructions(self.interpreter.parser.parse("pyimport, m, 'math';"), runtime=self.runtime)
+
+        interpreter, runtime = self.restored("call, m.sqrt, root, 16;")
+        self.assertEqual(runtime.memory["root"].value, 4.0)
+
+    def test_other_versions_are_rejected(self) -> None:
+        with mock.patch.object(snapshot, "SNAPSHOT_VERSION", snapshot.SNAPSHOT_VERSION - 1):
+            data = dumps_snapshot(self.interpreter, self.runtime)
+
+        with self.assertRaises(SnapshotError):
+            loads_snapshot(data)
+
+    def test_native_maps_keep_their_items(self) -> None:
+        self.interpreter.execute_instructions(
+            self.interpreter.parser.parse("call, iterables.create_empty_dict, 'people';\ncall, people.set, 'First', 'Neo';"),
+            runtime=self.runtime
+        )
+
+        interpreter, runtime = self.restored("call, people.get, name, 'First';\ncall, people.len, size;")
+        self.assertEqual(runtime.memory["name"].value, "Neo")
+        self.assertEqual(runtime.memory["size"].value, 1)
@@ -0,0 +1,36 @@
+import unittest
+
+from Interpreter.exceptions import ParserError, UnknownToken
+from Interpreter.syntax import Syntax, SyntaxTree
+
+def r_greet(interpreter, runtime, args) -> None:
+    pass
+
+class SyntaxTreeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tree = SyntaxTree([Syntax("greet", runtime_resolver=r_greet, arity=2)])
+
+    def test_frozen_trees_are_immutable(self) -> None:
+        frozen = self.tree.freeze()
+        with self.assertRaises(TypeError):
+            frozen.runtime_resolutions["other"] = r_greet
+
+        self.tree.syntax_list.append(Syntax("other", runtime_resolver=r_greet))
+        self.assertNotIn("other", frozen.runtime_resolutions)
+        self.assertEqual([syntax.name for syntax in frozen.syntax], ["greet"])
+
+    def test_instructions_below_the_arity_are_rejected(self) -> None:
+        interpreter = self.tree.create_interpreter()
+        with self.assertRaises(ParserError):
+            interpreter.execute("greet, someone;")
+
+        interpreter.execute("greet, someone, warmly;")
+
+    def test_unknown_tokens(self) -> None:
+        with self.assertRaises(UnknownToken):
+            self.tree.create_interpreter().execute("shout, someone;")
+
+    def test_syntax_dict(self) -> None:
+        syntax_dict = self.tree.syntax_dict
+        self.assertIs(syntax_dict.get("greet"), self.tree.syntax_list[0])
+        self.assertIs(self.tree.syntax_dict, syntax_dict)
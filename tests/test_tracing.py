@@ -0,0 +1,21 @@
+import unittest
+
+from Interpreter.core import Runtime
+from Interpreter.memory import Instruction
+from Interpreter.utils import set_memory
+from Interpreter.premade.standard import create_standard_interpreter
+from Interpreter.premade.tracing import Tracer
+
+class TracerTest(unittest.TestCase):
+    def test_failing_callee_lookup_is_left_to_the_resolver(self) -> None:
+        tracer = Tracer(create_standard_interpreter())
+        runtime = Runtime(None, file="<test>")
+        set_memory(runtime, "x", 1)
+
+        inst = Instruction("call", ("x.method", "_"), 2)
+        tracer.before(runtime, inst)
+        tracer.after(runtime, inst)
+
+        self.assertEqual([event["ph"] for event in tracer.events], ["B", "E"])
+        self.assertEqual(tracer.events[0]["name"], "x.method")
+        self.assertEqual(tracer.events[0]["args"], {"file": "<test>", "line": 2})